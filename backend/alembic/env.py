@@ -37,6 +37,15 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+# 모델에 없는 공간 인덱스(app/db/spatial.py에서 생성)는 autogenerate 비교에서 제외
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and name.startswith("locations_rtree"):
+        return False
+    if type_ == "index" and name == "ix_locations_geography":
+        return False
+    return True
+
+
 def run_migrations_offline():
     """Run migrations in 'offline' mode.
 
@@ -53,6 +62,7 @@ def run_migrations_offline():
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -76,7 +86,8 @@ def run_migrations_online():
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
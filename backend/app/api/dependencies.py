@@ -1,38 +1,49 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from functools import lru_cache
 from typing import Generator, Optional
 
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.services.kakao_map import KakaoMapService
 from app.services.tashu import TashuService
 from app.services.durunubi import DurunubiService
 from app.services.navigation import NavigationService
+from app.services.routing_executor import get_routing_executor
 from app.schemas.user import TokenPayload
 from app.db.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# 외부 API 서비스는 상태 없이 공유 HTTP 클라이언트만 사용하므로 요청마다 만들지 않고 하나씩만 생성
+@lru_cache()
 def get_kakao_map_service() -> KakaoMapService:
     return KakaoMapService()
 
+@lru_cache()
 def get_tashu_service() -> TashuService:
     return TashuService()
 
+@lru_cache()
 def get_durunubi_service() -> DurunubiService:
     return DurunubiService()
 
+_navigation_service: Optional[NavigationService] = None
+
 def get_navigation_service() -> NavigationService:
-    return NavigationService()
+    # 경로 탐색 실행기가 바뀌면(애플리케이션 재시작 등) 새 실행기로 다시 생성
+    global _navigation_service
+    executor = get_routing_executor()
+    if _navigation_service is None or _navigation_service.routing_executor is not executor:
+        _navigation_service = NavigationService(routing_executor=executor, tashu_service=get_tashu_service())
+    return _navigation_service
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    token: str = Depends(oauth2_scheme)
-) -> User:
+def _token_user_id(token: str) -> int:
     """
-    현재 인증된 사용자 가져오기
+    액세스 토큰에서 사용자 ID 추출 (유효하지 않으면 401)
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -49,10 +60,37 @@ def get_current_user(
         token_data = TokenPayload(sub=user_id)
     except JWTError:
         raise credentials_exception
-    
-    user = db.query(User).filter(User.id == token_data.sub).first()
+    return token_data.sub
+
+def _check_user(user: Optional[User]) -> User:
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증할 수 없습니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     if not user.is_active:
         raise HTTPException(status_code=400, detail="비활성화된 사용자입니다")
     return user
+
+def get_current_user(
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme)
+) -> User:
+    """
+    현재 인증된 사용자 가져오기
+    """
+    user_id = _token_user_id(token)
+    user = db.query(User).filter(User.id == user_id).first()
+    return _check_user(user)
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(oauth2_scheme)
+) -> User:
+    """
+    현재 인증된 사용자 가져오기 (async 라우트용 - 비동기 세션으로 조회)
+    """
+    user_id = _token_user_id(token)
+    user = await db.get(User, user_id)
+    return _check_user(user)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from app.db.session import get_db
 from app.db.models.favorite import Favorite as FavoriteModel
 from app.db.models.location import Location as LocationModel
@@ -20,29 +20,17 @@ def get_user_favorites(
     """
     현재 사용자의 즐겨찾기 목록 조회
     """
+    # 위치 정보를 같은 쿼리에서 JOIN으로 함께 조회 (위치가 없는 즐겨찾기는 제외)
     favorites = (
         db.query(FavoriteModel)
+        .options(joinedload(FavoriteModel.location, innerjoin=True))
         .filter(FavoriteModel.user_id == current_user.id)
         .offset(skip)
         .limit(limit)
         .all()
     )
     
-    # 위치 정보와 함께 반환
-    result = []
-    for fav in favorites:
-        location = db.query(LocationModel).filter(LocationModel.id == fav.location_id).first()
-        if location:
-            result.append({
-                "id": fav.id,
-                "user_id": fav.user_id,
-                "location_id": fav.location_id,
-                "memo": fav.memo,
-                "created_at": fav.created_at,
-                "location": location
-            })
-    
-    return result
+    return favorites
 
 @router.post("", response_model=Favorite)
 def create_favorite(
@@ -93,8 +81,10 @@ def get_favorite(
     """
     즐겨찾기 상세 조회
     """
+    # 위치 정보를 같은 쿼리에서 JOIN으로 함께 조회
     favorite = (
         db.query(FavoriteModel)
+        .options(joinedload(FavoriteModel.location))
         .filter(
             FavoriteModel.id == favorite_id,
             FavoriteModel.user_id == current_user.id
@@ -105,17 +95,7 @@ def get_favorite(
     if not favorite:
         raise HTTPException(status_code=404, detail=f"ID가 {favorite_id}인 즐겨찾기를 찾을 수 없습니다")
     
-    # 위치 정보 가져오기
-    location = db.query(LocationModel).filter(LocationModel.id == favorite.location_id).first()
-    
-    return {
-        "id": favorite.id,
-        "user_id": favorite.user_id,
-        "location_id": favorite.location_id,
-        "memo": favorite.memo,
-        "created_at": favorite.created_at,
-        "location": location
-    }
+    return favorite
 
 @router.put("/{favorite_id}", response_model=Favorite)
 def update_favorite(
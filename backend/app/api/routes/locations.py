@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
+from app.core.pagination import count_cache, cut_page, decode_cursor, estimated_row_count
 from app.db.session import get_db
+from app.db.spatial import nearby_filter
 from app.db.models.location import Location as LocationModel, LocationType
 from app.schemas.location import Location, LocationCreate, LocationUpdate, LocationList
 from app.api.dependencies import get_current_user
@@ -11,13 +13,18 @@ router = APIRouter()
 
 @router.get("", response_model=LocationList)
 def get_locations(
-    skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     location_type: Optional[str] = None,
+    include_total: bool = False,
+    skip: int = Query(0, ge=0, description="cursor 대신 건너뛸 개수 (이전 버전 호환용, 깊은 페이지는 느림)"),
     db: Session = Depends(get_db)
 ):
     """
-    위치 정보 목록 조회
+    위치 정보 목록 조회 (ID순)
+    
+    ID 기준 커서 페이지네이션으로, 응답의 next_cursor를 다음 요청의 cursor로 넘기면
+    몇 번째 페이지든 첫 페이지와 같은 비용으로 조회합니다.
     """
     query = db.query(LocationModel)
     
@@ -29,13 +36,34 @@ def get_locations(
         except KeyError:
             raise HTTPException(status_code=400, detail=f"유효하지 않은 위치 유형: {location_type}")
     
-    # 전체 개수 계산
-    total = query.count()
-    
-    # 페이지네이션 적용
-    locations = query.offset(skip).limit(limit).all()
-    
-    return {"total": total, "items": locations}
+    # 전체 개수 계산 (요청한 경우만 - 필터가 없으면 통계 정보의 추정치, 아니면 COUNT 결과를 잠시 캐시)
+    total = None
+    if include_total:
+        key = ("locations", location_type.upper() if location_type else None)
+        total = count_cache.get(key)
+        if total is None:
+            if not location_type:
+                total = estimated_row_count(db, LocationModel.__tablename__)
+            if total is None:
+                total = query.count()
+            count_cache.set(key, total)
+    
+    # 커서 이후의 위치만 조회
+    if cursor:
+        try:
+            (location_id,) = decode_cursor("locations", cursor)
+            location_id = int(location_id)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다")
+        query = query.filter(LocationModel.id > location_id)
+    elif skip:
+        query = query.offset(skip)
+    
+    # 다음 페이지 유무 확인을 위해 한 개 더 조회
+    rows = query.order_by(LocationModel.id).limit(limit + 1).all()
+    locations, next_cursor = cut_page(rows, limit, "locations", lambda location: [location.id])
+    
+    return {"total": total, "items": locations, "next_cursor": next_cursor}
 
 @router.post("", response_model=Location)
 def create_location(
@@ -69,6 +97,37 @@ def create_location(
     
     return db_location
 
+@router.get("/nearby", response_model=LocationList)
+def get_nearby_locations(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    radius: float = Query(1000, ge=0, le=50000),  # 미터 단위
+    location_type: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db)
+):
+    """
+    주변 위치 정보 조회 (가까운 순)
+    
+    공간 인덱스(PostGIS GiST, SQLite R*Tree 또는 geohash 열 인덱스)로 반경을 덮는 후보만 읽고,
+    데이터베이스에서 정확한 거리(haversine)로 걸러 가까운 순으로 limit개를 반환합니다.
+    """
+    condition, distance = nearby_filter(db, LocationModel, latitude, longitude, radius)
+    query = db.query(LocationModel).filter(condition)
+    
+    # 위치 유형으로 필터링
+    if location_type:
+        try:
+            type_enum = LocationType[location_type.upper()]
+            query = query.filter(LocationModel.type == type_enum)
+        except KeyError:
+            raise HTTPException(status_code=400, detail=f"유효하지 않은 위치 유형: {location_type}")
+    
+    # 거리순 정렬 및 개수 제한
+    nearby_locations = query.order_by(distance).limit(limit).all()
+    
+    return {"total": len(nearby_locations), "items": nearby_locations}
+
 @router.get("/{location_id}", response_model=Location)
 def get_location(
     location_id: int,
@@ -124,58 +183,3 @@ def delete_location(
     db.commit()
     
     return {"detail": "위치 정보가 삭제되었습니다"}
-
-@router.get("/nearby", response_model=LocationList)
-def get_nearby_locations(
-    latitude: float,
-    longitude: float,
-    radius: float = Query(1000, ge=0),  # 미터 단위
-    location_type: Optional[str] = None,
-    limit: int = 100,
-    db: Session = Depends(get_db)
-):
-    """
-    주변 위치 정보 조회 (거리 기반)
-    
-    참고: 실제 구현에서는 PostgreSQL의 PostGIS 확장을 사용하거나
-    Haversine 공식을 사용하여 거리 계산을 구현해야 합니다.
-    여기서는 간단한 예시만 제공합니다.
-    """
-    # 여기에 거리 기반 쿼리 구현
-    # 예시: PostgreSQL + PostGIS를 사용한 쿼리
-    # query = db.query(LocationModel).filter(
-    #     func.ST_DWithin(
-    #         func.ST_SetSRID(func.ST_MakePoint(LocationModel.longitude, LocationModel.latitude), 4326),
-    #         func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326),
-    #         radius / 111320  # 미터를 대략적인 도(degree)로 변환
-    #     )
-    # )
-    
-    # 간단한 구현을 위해 모든 위치를 가져와서 Python에서 필터링
-    # 실제 프로덕션에서는 데이터베이스 수준에서 필터링하는 것이 좋습니다
-    locations = db.query(LocationModel).all()
-    
-    # 위치 유형으로 필터링
-    if location_type:
-        try:
-            type_enum = LocationType[location_type.upper()]
-            locations = [loc for loc in locations if loc.type == type_enum]
-        except KeyError:
-            raise HTTPException(status_code=400, detail=f"유효하지 않은 위치 유형: {location_type}")
-    
-    # 거리 계산 및 필터링 (간단한 구현)
-    # 실제로는 Haversine 공식을 사용하여 정확한 거리 계산 필요
-    nearby_locations = []
-    for loc in locations:
-        # 간단한 거리 계산 (실제 구현에서는 Haversine 공식 사용)
-        distance = ((loc.latitude - latitude) ** 2 + (loc.longitude - longitude) ** 2) ** 0.5 * 111320  # 대략적인 미터 변환
-        if distance <= radius:
-            nearby_locations.append(loc)
-    
-    # 거리순으로 정렬
-    nearby_locations.sort(key=lambda loc: ((loc.latitude - latitude) ** 2 + (loc.longitude - longitude) ** 2))
-    
-    # 개수 제한
-    nearby_locations = nearby_locations[:limit]
-    
-    return {"total": len(nearby_locations), "items": nearby_locations}
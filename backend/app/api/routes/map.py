@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Dict, Any, Optional
+from app.core.cache import cache_stats
+from app.schemas.map import BatchAddressRequest
 from app.services.kakao_map import KakaoMapService
 from app.api.dependencies import get_kakao_map_service
 
@@ -50,19 +52,39 @@ async def search_by_category(
 
 @router.get("/address")
 async def get_address_from_coords(
-    x: str,
-    y: str,
+    x: float,
+    y: float,
+    exact: bool = False,
+    precision: Optional[int] = Query(None, ge=7, le=9),
     kakao_map_service: KakaoMapService = Depends(get_kakao_map_service)
 ):
     """
     좌표로 주소 검색 (좌표 -> 주소)
+    기본적으로 좌표가 속한 geohash 칸 단위로 조회/캐시하며, exact=true면 입력 좌표 그대로 조회합니다.
     """
     try:
-        result = await kakao_map_service.get_address(x=x, y=y)
-        return result
+        if exact:
+            return await kakao_map_service.get_address(x=str(x), y=str(y))
+        return await kakao_map_service.reverse_geocode(x=x, y=y, precision=precision)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"주소 검색 중 오류 발생: {str(e)}")
 
+@router.post("/address/batch")
+async def get_addresses_from_coords(
+    request: BatchAddressRequest,
+    kakao_map_service: KakaoMapService = Depends(get_kakao_map_service)
+):
+    """
+    여러 좌표의 주소를 한 번에 검색 (좌표 -> 주소, geohash 칸 단위)
+    """
+    try:
+        items = await kakao_map_service.reverse_geocode_batch(
+            [point.dict() for point in request.points], precision=request.precision
+        )
+        return {"total": len(items), "items": items}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"주소 일괄 검색 중 오류 발생: {str(e)}")
+
 @router.get("/coordinates")
 async def get_coords_from_address(
     address: str,
@@ -76,3 +98,10 @@ async def get_coords_from_address(
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"좌표 검색 중 오류 발생: {str(e)}")
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    카카오 API 응답 캐시 통계 (캐시별 항목 수, 적중/실패/병합 횟수)
+    """
+    return cache_stats()
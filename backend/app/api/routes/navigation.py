@@ -1,15 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Dict, Any, Optional
+from app.core.config import settings
 from app.services.navigation import NavigationService
-from app.api.dependencies import get_current_user
+from app.schemas.navigation import BatchDirectionsRequest
+from app.services.routing_executor import RoutingBusyError, RoutingTimeoutError
+from app.api.dependencies import get_current_user, get_navigation_service
 from app.db.models.user import User
 
 router = APIRouter()
 
-# 네비게이션 서비스 의존성 주입 함수
-def get_navigation_service():
-    return NavigationService()
-
 @router.post("/directions/car")
 async def get_car_directions(
     origin_x: float,
@@ -56,11 +55,20 @@ async def get_bike_directions(
     destination_y: float,
     waypoints: Optional[List[Dict[str, float]]] = None,
     priority: str = Query("RECOMMEND", enum=["RECOMMEND", "SAFETY", "DISTANCE"]),
+    optimize_waypoints: bool = False,
     navigation_service: NavigationService = Depends(get_navigation_service)
 ):
     """
     자전거 길찾기 API
+    optimize_waypoints=true면 총 비용이 가장 작도록 경유지 방문 순서를 바꾸고,
+    summary.waypoint_order에 요청한 경유지 번호를 방문 순서대로 반환합니다.
     """
+    if optimize_waypoints and waypoints and len(waypoints) > settings.ROUTING_MAX_OPTIMIZED_WAYPOINTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"순서를 최적화할 수 있는 경유지는 최대 {settings.ROUTING_MAX_OPTIMIZED_WAYPOINTS}개입니다"
+        )
+    
     try:
         result = await navigation_service.get_bike_directions(
             origin_x=origin_x,
@@ -68,16 +76,54 @@ async def get_bike_directions(
             destination_x=destination_x,
             destination_y=destination_y,
             waypoints=waypoints,
-            priority=priority
+            priority=priority,
+            optimize_waypoints=optimize_waypoints
         )
         
         if "error" in result:
             raise HTTPException(status_code=500, detail=result["error"])
         
         return result
+    except HTTPException:
+        raise
+    except RoutingBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except RoutingTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"자전거 길찾기 중 오류 발생: {str(e)}")
 
+@router.post("/directions/batch")
+async def get_batch_directions(
+    request: BatchDirectionsRequest,
+    navigation_service: NavigationService = Depends(get_navigation_service)
+):
+    """
+    자전거 일괄 길찾기 API - 여러 출발지/목적지 쌍을 한 번에 계산
+    """
+    if navigation_service.routing_executor is None:
+        raise HTTPException(status_code=503, detail="로컬 경로 탐색 엔진이 준비되지 않았습니다")
+    
+    try:
+        result = await navigation_service.get_bike_directions_batch(
+            pairs=[pair.dict() for pair in request.pairs],
+            priority=request.priority.value,
+            include_geometry=request.include_geometry
+        )
+        
+        if "error" in result:
+            raise HTTPException(status_code=500, detail=result["error"])
+        
+        return result
+    except HTTPException:
+        raise
+    except RoutingBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except RoutingTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"일괄 길찾기 중 오류 발생: {str(e)}")
+
 @router.post("/directions/pedestrian")
 async def get_pedestrian_directions(
     origin_x: float,
@@ -106,73 +152,120 @@ async def get_pedestrian_directions(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"보행자 길찾기 중 오류 발생: {str(e)}")
 
+@router.get("/isochrone")
+async def get_isochrone(
+    latitude: float,
+    longitude: float,
+    minutes: List[int] = Query([5, 10, 15]),
+    include_vertices: bool = False,
+    navigation_service: NavigationService = Depends(get_navigation_service)
+):
+    """
+    자전거 등시선 API - 출발지에서 주어진 시간(분) 안에 갈 수 있는 영역
+    """
+    if navigation_service.routing_executor is None:
+        raise HTTPException(status_code=503, detail="로컬 경로 탐색 엔진이 준비되지 않았습니다")
+    if not minutes or len(minutes) > 5 or any(m < 1 or m > 60 for m in minutes):
+        raise HTTPException(status_code=400, detail="minutes는 1~60 사이의 값을 최대 5개까지 지정할 수 있습니다")
+    
+    try:
+        result = await navigation_service.get_isochrone(
+            longitude=longitude,
+            latitude=latitude,
+            minutes=minutes,
+            include_vertices=include_vertices
+        )
+        
+        if "error" in result:
+            raise HTTPException(status_code=500, detail=result["error"])
+        
+        return result
+    except HTTPException:
+        raise
+    except RoutingBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except RoutingTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"등시선 계산 중 오류 발생: {str(e)}")
+
 @router.get("/tashu/nearby-routes")
 async def get_nearby_tashu_routes(
     latitude: float,
     longitude: float,
-    radius: float = Query(1000, ge=100, le=5000),  # 미터 단위, 최소 100m, 최대 5km
+    destination_latitude: float,
+    destination_longitude: float,
+    radius: float = Query(1000, ge=100, le=5000),  # 대여소까지 최대 도보 거리 (미터 단위, 최소 100m, 최대 5km)
+    alternatives: int = Query(3, ge=1, le=10),
     navigation_service: NavigationService = Depends(get_navigation_service),
     current_user: Optional[User] = Depends(get_current_user)
 ):
     """
-    현재 위치 주변의 타슈 대여소를 경유하는 추천 경로
+    타슈 복합 경로 API - 현재 위치에서 걸어갈 수 있는 대여소에서 자전거를 빌려
+    목적지 근처 대여소에 반납하는 경로를 총 소요 시간 순으로 추천
     """
-    # 이 기능은 실제 구현에서 타슈 서비스와 네비게이션 서비스를 조합하여 구현
-    # 여기서는 더미 데이터 반환
-    return {
-        "routes": [
-            {
-                "name": "한강변 자전거 코스",
-                "distance": 5.2,  # km
-                "estimated_time": 25,  # 분
-                "difficulty": "EASY",
-                "stations": [
-                    {
-                        "id": "station_1",
-                        "name": "대전역 앞 대여소",
-                        "available_bikes": 8,
-                        "coordinates": {"latitude": latitude + 0.01, "longitude": longitude + 0.01}
-                    },
-                    {
-                        "id": "station_2",
-                        "name": "엑스포 다리 대여소",
-                        "available_bikes": 5,
-                        "coordinates": {"latitude": latitude + 0.02, "longitude": longitude + 0.02}
-                    }
-                ],
-                "path": [
-                    {"latitude": latitude, "longitude": longitude},
-                    {"latitude": latitude + 0.01, "longitude": longitude + 0.01},
-                    {"latitude": latitude + 0.02, "longitude": longitude + 0.02},
-                    {"latitude": latitude + 0.03, "longitude": longitude + 0.03}
-                ]
-            },
-            {
-                "name": "도심 관광 코스",
-                "distance": 3.8,  # km
-                "estimated_time": 18,  # 분
-                "difficulty": "MEDIUM",
-                "stations": [
-                    {
-                        "id": "station_3",
-                        "name": "시청 앞 대여소",
-                        "available_bikes": 12,
-                        "coordinates": {"latitude": latitude - 0.01, "longitude": longitude - 0.01}
-                    },
-                    {
-                        "id": "station_4",
-                        "name": "대전시립미술관 대여소",
-                        "available_bikes": 3,
-                        "coordinates": {"latitude": latitude - 0.02, "longitude": longitude - 0.02}
-                    }
-                ],
-                "path": [
-                    {"latitude": latitude, "longitude": longitude},
-                    {"latitude": latitude - 0.01, "longitude": longitude - 0.01},
-                    {"latitude": latitude - 0.02, "longitude": longitude - 0.02},
-                    {"latitude": latitude - 0.03, "longitude": longitude - 0.03}
-                ]
-            }
-        ],
-        "total": 2
-    }
+    if navigation_service.routing_executor is None:
+        raise HTTPException(status_code=503, detail="로컬 경로 탐색 엔진이 준비되지 않았습니다")
+    
+    try:
+        result = await navigation_service.get_tashu_routes(
+            origin_x=longitude,
+            origin_y=latitude,
+            destination_x=destination_longitude,
+            destination_y=destination_latitude,
+            max_walk_m=radius,
+            alternatives=alternatives
+        )
+        
+        if "error" in result:
+            raise HTTPException(status_code=500, detail=result["error"])
+        
+        return result
+    except HTTPException:
+        raise
+    except RoutingBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except RoutingTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"타슈 경로 탐색 중 오류 발생: {str(e)}")
+
+@router.get("/tashu/nearest-stations")
+async def get_nearest_tashu_stations(
+    latitude: float,
+    longitude: float,
+    k: int = Query(5, ge=1, le=20),
+    mode: str = Query("WALK", enum=["WALK", "BIKE"]),
+    max_distance: float = Query(2000, ge=100, le=10000),  # 최대 이동 거리 (미터 단위)
+    include_geometry: bool = False,
+    navigation_service: NavigationService = Depends(get_navigation_service)
+):
+    """
+    가까운 타슈 대여소 API - 대여 가능한 자전거가 있는 대여소를 실제 이동 시간 순으로 조회
+    (강이나 철도처럼 직선으로 건널 수 없는 곳을 돌아가는 거리를 반영)
+    """
+    if navigation_service.routing_executor is None:
+        raise HTTPException(status_code=503, detail="로컬 경로 탐색 엔진이 준비되지 않았습니다")
+    
+    try:
+        result = await navigation_service.get_nearest_stations(
+            longitude=longitude,
+            latitude=latitude,
+            k=k,
+            mode=mode,
+            max_distance_m=max_distance,
+            include_geometry=include_geometry
+        )
+        
+        if "error" in result:
+            raise HTTPException(status_code=500, detail=result["error"])
+        
+        return result
+    except HTTPException:
+        raise
+    except RoutingBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except RoutingTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"가까운 대여소 조회 중 오류 발생: {str(e)}")
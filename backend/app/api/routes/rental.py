@@ -1,72 +1,114 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
 from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
+import asyncio
 import random
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.core.pagination import count_cache, cut_page, decode_cursor
+from app.db.session import get_async_db
 from app.db.models.rental import Rental as RentalModel, RentalStatus
 from app.schemas.rental import Rental, RentalCreate, RentalUpdate, RentalList
-from app.api.dependencies import get_current_user, get_tashu_service
+from app.api.dependencies import get_current_user_async, get_tashu_service, get_navigation_service
 from app.db.models.user import User
 from app.services.tashu import TashuService
+from app.services.navigation import NavigationService
+from app.services.routing_executor import RoutingBusyError, RoutingTimeoutError
+from app.services.tashu_snapshot import StationSnapshotManager, get_station_snapshot
 
 router = APIRouter()
 
+async def _station_ledger(station_id: str) -> Optional[StationSnapshotManager]:
+    """
+    대여소가 메모리 스냅샷에 있으면 자전거 수 장부를 가진 스냅샷 관리자를 반환합니다.
+    (없으면 None - 스냅샷을 쓰지 않거나, 스냅샷이 TASHU_AVAILABILITY_MAX_AGE_SECONDS보다 오래되었거나,
+    새로 생긴 대여소이므로 타슈 API로 확인)
+    """
+    manager = get_station_snapshot()
+    if manager is None:
+        return None
+    snapshot = await manager.get_snapshot()
+    if snapshot is None or snapshot.age > settings.TASHU_AVAILABILITY_MAX_AGE_SECONDS:
+        return None
+    if snapshot.get(station_id) is None:
+        return None
+    return manager
+
 @router.get("", response_model=RentalList)
 async def get_user_rentals(
-    skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     status: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    include_total: bool = False,
+    skip: int = Query(0, ge=0, description="cursor 대신 건너뛸 개수 (이전 버전 호환용, 깊은 페이지는 느림)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """
-    현재 사용자의 대여 이력 조회
+    현재 사용자의 대여 이력 조회 (최신순)
+    
+    (대여 시각, ID) 기준 커서 페이지네이션으로, 응답의 next_cursor를 다음 요청의 cursor로 넘기면
+    몇 번째 페이지든 첫 페이지와 같은 비용으로 조회합니다.
     """
-    query = db.query(RentalModel).filter(RentalModel.user_id == current_user.id)
+    query = select(RentalModel).where(RentalModel.user_id == current_user.id)
     
     # 상태로 필터링
     if status:
         try:
             status_enum = RentalStatus[status.upper()]
-            query = query.filter(RentalModel.status == status_enum)
+            query = query.where(RentalModel.status == status_enum)
         except KeyError:
             raise HTTPException(status_code=400, detail=f"유효하지 않은 대여 상태: {status}")
     
-    # 전체 개수 계산
-    total = query.count()
+    # 전체 개수 계산 (요청한 경우만, 잠시 캐시)
+    total = None
+    if include_total:
+        count_query = select(func.count()).select_from(query.subquery())
+        total = await count_cache.get_or_load(
+            ("rentals", current_user.id, status.upper() if status else None),
+            lambda: db.scalar(count_query)
+        )
+    
+    # 커서 이후(더 오래된) 대여만 조회
+    if cursor:
+        try:
+            rental_time, rental_id = decode_cursor("rentals", cursor)
+            rental_time, rental_id = datetime.fromisoformat(rental_time), int(rental_id)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다")
+        query = query.where(or_(
+            RentalModel.rental_time < rental_time,
+            and_(RentalModel.rental_time == rental_time, RentalModel.id < rental_id)
+        ))
+    elif skip:
+        query = query.offset(skip)
     
-    # 페이지네이션 적용 및 최신순 정렬
-    rentals = query.order_by(RentalModel.rental_time.desc()).offset(skip).limit(limit).all()
+    # 최신순 정렬 후 다음 페이지 유무 확인을 위해 한 개 더 조회
+    rows = (await db.scalars(
+        query.order_by(RentalModel.rental_time.desc(), RentalModel.id.desc()).limit(limit + 1)
+    )).all()
+    rentals, next_cursor = cut_page(rows, limit, "rentals",
+                                    lambda rental: [rental.rental_time.isoformat(), rental.id])
     
-    return {"total": total, "items": rentals}
+    return {"total": total, "items": rentals, "next_cursor": next_cursor}
 
 @router.post("", response_model=Rental)
 async def create_rental(
     station_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
     tashu_service: TashuService = Depends(get_tashu_service)
 ):
     """
     새 자전거 대여
     """
-    # 대여소 정보 확인
-    station = await tashu_service.get_station_detail(station_id)
-    if not station:
-        raise HTTPException(status_code=404, detail=f"ID가 {station_id}인 대여소를 찾을 수 없습니다")
-    
-    # 사용 가능한 자전거 확인
-    bikes_info = await tashu_service.get_available_bikes(station_id)
-    if not bikes_info or bikes_info.get("available_bikes", 0) <= 0:
-        raise HTTPException(status_code=400, detail="현재 대여 가능한 자전거가 없습니다")
-    
     # 이미 활성화된 대여가 있는지 확인
-    active_rental = db.query(RentalModel).filter(
+    active_rental = (await db.scalars(select(RentalModel).where(
         RentalModel.user_id == current_user.id,
         RentalModel.status == RentalStatus.ACTIVE
-    ).first()
+    ))).first()
     
     if active_rental:
         raise HTTPException(
@@ -74,6 +116,22 @@ async def create_rental(
             detail="이미 대여 중인 자전거가 있습니다. 먼저 반납해주세요."
         )
     
+    ledger = await _station_ledger(station_id)
+    if ledger is not None:
+        # 스냅샷과 대여/반납 장부로 확인하고 자전거 한 대를 미리 차감 (타슈 API 호출 없음)
+        if not ledger.reserve_bike(station_id):
+            raise HTTPException(status_code=400, detail="현재 대여 가능한 자전거가 없습니다")
+    else:
+        # 대여소 정보와 사용 가능한 자전거를 동시에 확인
+        station, bikes_info = await asyncio.gather(
+            tashu_service.get_station_detail(station_id),
+            tashu_service.get_available_bikes(station_id)
+        )
+        if not station:
+            raise HTTPException(status_code=404, detail=f"ID가 {station_id}인 대여소를 찾을 수 없습니다")
+        if not bikes_info or bikes_info.get("available_bikes", 0) <= 0:
+            raise HTTPException(status_code=400, detail="현재 대여 가능한 자전거가 없습니다")
+    
     # 자전거 ID 생성 (실제로는 API에서 받아와야 함)
     bike_id = f"BIKE_{random.randint(1000, 9999)}"
     
@@ -85,55 +143,117 @@ async def create_rental(
         status=RentalStatus.ACTIVE
     )
     
-    db.add(db_rental)
-    db.commit()
-    db.refresh(db_rental)
+    try:
+        db.add(db_rental)
+        await db.commit()
+    except Exception:
+        # 대여가 저장되지 않았으면 차감한 자전거를 되돌림
+        if ledger is not None:
+            ledger.release_bike(station_id)
+        raise
+    await db.refresh(db_rental)
     
     return db_rental
 
 @router.get("/active", response_model=Rental)
 async def get_active_rental(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """
     현재 활성화된 대여 정보 조회
     """
-    active_rental = db.query(RentalModel).filter(
+    active_rental = (await db.scalars(select(RentalModel).where(
         RentalModel.user_id == current_user.id,
         RentalModel.status == RentalStatus.ACTIVE
-    ).first()
+    ))).first()
     
     if not active_rental:
         raise HTTPException(status_code=404, detail="현재 대여 중인 자전거가 없습니다")
     
     return active_rental
 
+@router.get("/{rental_id}/return-stations")
+async def get_return_stations(
+    rental_id: int = Path(..., title="대여 ID"),
+    destination_latitude: float = Query(..., title="목적지 위도"),
+    destination_longitude: float = Query(..., title="목적지 경도"),
+    latitude: Optional[float] = Query(None, title="현재 위치 위도"),
+    longitude: Optional[float] = Query(None, title="현재 위치 경도"),
+    k: int = Query(5, ge=1, le=20),
+    max_walk_distance: float = Query(1000, ge=100, le=5000),  # 미터 단위
+    include_geometry: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+    navigation_service: NavigationService = Depends(get_navigation_service)
+):
+    """
+    반납 대여소 추천 - 빈 거치대가 있는 목적지 근처 대여소를 자전거 이동 시간과 목적지까지의 도보 시간 순으로 조회
+    (현재 위치를 지정하지 않으면 대여한 대여소에서 출발한다고 보고 계산)
+    """
+    rental = (await db.scalars(select(RentalModel).where(
+        RentalModel.id == rental_id,
+        RentalModel.user_id == current_user.id,
+        RentalModel.status == RentalStatus.ACTIVE
+    ))).first()
+    
+    if not rental:
+        raise HTTPException(status_code=404, detail=f"ID가 {rental_id}인 활성 대여를 찾을 수 없습니다")
+    if navigation_service.routing_executor is None:
+        raise HTTPException(status_code=503, detail="로컬 경로 탐색 엔진이 준비되지 않았습니다")
+    
+    try:
+        result = await navigation_service.get_return_stations(
+            destination_x=destination_longitude,
+            destination_y=destination_latitude,
+            position_x=longitude,
+            position_y=latitude,
+            rental_station_id=rental.station_id,
+            k=k,
+            max_walk_m=max_walk_distance,
+            include_geometry=include_geometry
+        )
+        
+        if "error" in result:
+            raise HTTPException(status_code=500, detail=result["error"])
+        
+        return result
+    except HTTPException:
+        raise
+    except RoutingBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except RoutingTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"반납 대여소 추천 중 오류 발생: {str(e)}")
+
 @router.put("/{rental_id}/return", response_model=Rental)
 async def return_bike(
     rental_id: int = Path(..., title="대여 ID"),
     return_station_id: str = Query(..., title="반납 대여소 ID"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
     tashu_service: TashuService = Depends(get_tashu_service)
 ):
     """
     자전거 반납
     """
     # 대여 정보 확인
-    rental = db.query(RentalModel).filter(
+    rental = (await db.scalars(select(RentalModel).where(
         RentalModel.id == rental_id,
         RentalModel.user_id == current_user.id,
         RentalModel.status == RentalStatus.ACTIVE
-    ).first()
+    ))).first()
     
     if not rental:
         raise HTTPException(status_code=404, detail=f"ID가 {rental_id}인 활성 대여를 찾을 수 없습니다")
     
-    # 반납 대여소 확인
-    return_station = await tashu_service.get_station_detail(return_station_id)
-    if not return_station:
-        raise HTTPException(status_code=404, detail=f"ID가 {return_station_id}인 대여소를 찾을 수 없습니다")
+    # 반납 대여소 확인 (스냅샷에 없으면 타슈 API 조회)
+    ledger = await _station_ledger(return_station_id)
+    if ledger is None:
+        return_station = await tashu_service.get_station_detail(return_station_id)
+        if not return_station:
+            raise HTTPException(status_code=404, detail=f"ID가 {return_station_id}인 대여소를 찾을 수 없습니다")
     
     # 이용 시간 계산
     rental_time = rental.rental_time
@@ -151,26 +271,29 @@ async def return_bike(
     rental.status = RentalStatus.COMPLETED
     rental.cost = total_fee
     
-    db.commit()
-    db.refresh(rental)
+    await db.commit()
+    await db.refresh(rental)
+    
+    if ledger is not None:
+        ledger.release_bike(return_station_id)
     
     return rental
 
 @router.put("/{rental_id}/cancel", response_model=Rental)
 async def cancel_rental(
     rental_id: int = Path(..., title="대여 ID"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """
     자전거 대여 취소
     """
     # 대여 정보 확인
-    rental = db.query(RentalModel).filter(
+    rental = (await db.scalars(select(RentalModel).where(
         RentalModel.id == rental_id,
         RentalModel.user_id == current_user.id,
         RentalModel.status == RentalStatus.ACTIVE
-    ).first()
+    ))).first()
     
     if not rental:
         raise HTTPException(status_code=404, detail=f"ID가 {rental_id}인 활성 대여를 찾을 수 없습니다")
@@ -186,7 +309,12 @@ async def cancel_rental(
     rental.return_time = current_time
     rental.cost = 0  # 취소 시 요금 없음
     
-    db.commit()
-    db.refresh(rental)
+    await db.commit()
+    await db.refresh(rental)
+    
+    # 취소한 자전거는 대여한 대여소로 되돌림
+    ledger = await _station_ledger(rental.station_id)
+    if ledger is not None:
+        ledger.release_bike(rental.station_id)
     
     return rental
@@ -1,31 +1,112 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Dict, Any, Optional
+from app.core.config import settings
 from app.services.tashu import TashuService
+from app.services.tashu_snapshot import StationSnapshot, get_station_snapshot, load_station_snapshot
 from app.api.dependencies import get_tashu_service
 
 router = APIRouter()
 
+async def _attach_availability(locations: List[Dict[str, Any]],
+                               snapshot: StationSnapshot,
+                               tashu_service: TashuService) -> Dict[str, Any]:
+    """
+    대여소 목록에 자전거 정보(availability)를 붙입니다.
+    스냅샷이 TASHU_AVAILABILITY_MAX_AGE_SECONDS 이내로 최근이면 스냅샷의 자전거 수를 그대로 쓰고,
+    아니면 대여소별로 동시에 조회하며 조회에 실패한 대여소는 스냅샷 값과 오류를 함께 반환합니다.
+    
+    Returns:
+        조회 요약 (정보 출처, 실패한 대여소 수)
+    """
+    if snapshot.age <= settings.TASHU_AVAILABILITY_MAX_AGE_SECONDS:
+        # 스냅샷 이후 이 서버에서 처리한 대여/반납 반영
+        manager = get_station_snapshot()
+        for location in locations:
+            location["availability"] = dict(location["details"], source="snapshot")
+            if manager is not None and manager.snapshot is snapshot:
+                location["availability"]["available_bikes"] = manager.available_bikes(location["external_id"])
+        return {"source": "snapshot", "age_seconds": round(snapshot.age, 1), "failed": 0}
+    
+    results = await tashu_service.get_availability_batch([location["external_id"] for location in locations])
+    failed = 0
+    for location in locations:
+        result = results[location["external_id"]]
+        if "error" in result:
+            failed += 1
+            location["availability"] = dict(location["details"], source="snapshot", error=result["error"])
+        else:
+            location["availability"] = dict(result, source="live")
+    return {"source": "live", "age_seconds": round(snapshot.age, 1), "failed": failed}
+
 @router.get("/stations")
 async def get_tashu_stations(
     latitude: Optional[float] = None,
     longitude: Optional[float] = None,
     radius: Optional[int] = Query(None, ge=0, le=20000),
+    with_availability: bool = Query(False, description="대여소별 자전거 정보 포함"),
     tashu_service: TashuService = Depends(get_tashu_service)
 ):
     """
-    타슈 대여소 목록 조회
+    타슈 대여소 목록 조회 (위치와 반경을 지정하면 반경 안의 대여소를 가까운 순으로 반환)
+    
+    with_availability를 지정하면 대여소별 자전거 정보를 함께 반환하므로, 목록 화면을 한 번의 요청으로 그릴 수 있습니다.
     """
     try:
-        stations = await tashu_service.get_stations(
-            latitude=latitude, longitude=longitude, radius=radius
-        )
+        snapshot = await load_station_snapshot(tashu_service)
+        if snapshot is None:
+            return {"total": 0, "items": []}
         
-        # 위치 정보 형식으로 변환
-        locations = [tashu_service.parse_station_to_location(station) for station in stations]
+        if latitude and longitude and radius:
+            locations = []
+            for station, distance in snapshot.within(latitude, longitude, radius):
+                location = tashu_service.parse_station_to_location(station)
+                location["distance"] = round(distance)
+                locations.append(location)
+        else:
+            # 위치 정보 형식으로 변환
+            locations = [tashu_service.parse_station_to_location(station) for station in snapshot.stations]
+        
+        if with_availability:
+            availability = await _attach_availability(locations, snapshot, tashu_service)
+            return {"total": len(locations), "items": locations, "availability": availability}
         return {"total": len(locations), "items": locations}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"타슈 대여소 조회 중 오류 발생: {str(e)}")
 
+@router.get("/stations/nearest")
+async def get_nearest_tashu_stations(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    k: int = Query(5, ge=1, le=50),
+    tashu_service: TashuService = Depends(get_tashu_service)
+):
+    """
+    가장 가까운 타슈 대여소 조회 (직선 거리 순, 실제 이동 경로 기준은 /navigation/tashu/nearest-stations)
+    """
+    try:
+        snapshot = await load_station_snapshot(tashu_service)
+        if snapshot is None:
+            return {"total": 0, "items": []}
+        
+        locations = []
+        for station, distance in snapshot.nearest(latitude, longitude, k):
+            location = tashu_service.parse_station_to_location(station)
+            location["distance"] = round(distance)
+            locations.append(location)
+        return {"total": len(locations), "items": locations}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"가까운 타슈 대여소 조회 중 오류 발생: {str(e)}")
+
+@router.get("/stations/snapshot")
+async def get_tashu_snapshot_stats():
+    """
+    타슈 대여소 메모리 스냅샷 상태 조회
+    """
+    manager = get_station_snapshot()
+    if manager is None:
+        return {"enabled": False}
+    return {"enabled": True, **manager.stats()}
+
 @router.get("/stations/{station_id}")
 async def get_tashu_station_detail(
     station_id: str,
@@ -35,7 +116,11 @@ async def get_tashu_station_detail(
     타슈 대여소 상세 정보 조회
     """
     try:
-        station = await tashu_service.get_station_detail(station_id=station_id)
+        # 스냅샷에 있으면 그대로 사용하고, 없으면(새로 생긴 대여소 등) 타슈 API 조회
+        snapshot = await load_station_snapshot(tashu_service)
+        station = snapshot.get(station_id) if snapshot is not None else None
+        if station is None:
+            station = await tashu_service.get_station_detail(station_id=station_id)
         if not station:
             raise HTTPException(status_code=404, detail=f"ID가 {station_id}인 대여소를 찾을 수 없습니다")
         
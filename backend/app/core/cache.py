@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class AsyncTTLCache:
+    """
+    비동기 응답 캐시 (TTL + LRU + 요청 병합)
+
+    항목은 ttl초 동안 유효하며, maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 버립니다.
+    같은 키를 동시에 여러 번 요청하면 외부 호출은 한 번만 하고 나머지 요청은 그 결과를 함께 기다립니다
+    (single-flight). 외부 호출이 실패하면 결과를 저장하지 않고 기다리던 요청 모두에 같은 예외를 전달합니다.
+    저장된 항목은 이벤트 루프와 동기 엔드포인트의 스레드 풀에서 함께 쓰이므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self, name: str, ttl: float, maxsize: int):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.errors = 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시된 값을 반환하고, 없거나 만료되었으면 loader로 불러와 저장합니다.
+
+        Args:
+            key: 캐시 키
+            loader: 값을 불러오는 코루틴 함수 (캐시에 없을 때 키당 한 번만 호출)
+
+        Returns:
+            캐시된 값 또는 새로 불러온 값
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        # 진행 중인 호출 목록은 이벤트 루프에서만 사용
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, loader))
+            # 기다리던 요청이 모두 취소된 뒤 실패해도 "처리되지 않은 예외" 경고가 남지 않도록 결과를 확인
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        # 먼저 요청한 쪽이 취소되어도 외부 호출은 끝까지 진행해 기다리는 다른 요청에 결과를 전달
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await loader()
+        except BaseException:
+            self.errors += 1
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self.set(key, value)
+        return value
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        캐시된 값 (없거나 만료되었으면 None) - 동기 코드에서 get_or_load 대신 set과 함께 사용
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 이름별 캐시 (통계 조회용)
+_caches: Dict[str, AsyncTTLCache] = {}
+
+
+def get_cache(name: str, ttl: float, maxsize: int) -> AsyncTTLCache:
+    """
+    이름에 해당하는 캐시 (처음 호출할 때 생성, 이후에는 같은 캐시 반환)
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        cache = AsyncTTLCache(name, ttl, maxsize)
+        _caches[name] = cache
+    return cache
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    모든 캐시의 적중/실패 통계
+    """
+    return {name: cache.stats() for name, cache in _caches.items()}
@@ -6,6 +6,9 @@ from dotenv import load_dotenv
 # .env 파일 로드
 load_dotenv()
 
+# 저장소 루트 디렉터리 (backend/app/core/config.py 기준)
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
 class Settings(BaseSettings):
     PROJECT_NAME: str = "지도 통합 API 서비스"
     API_V1_STR: str = "/api/v1"
@@ -17,12 +20,65 @@ class Settings(BaseSettings):
     
     # 데이터베이스 설정
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    # 비동기 드라이버 URL (비우면 DATABASE_URL에서 변환: postgresql -> asyncpg, sqlite -> aiosqlite)
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL", "")
     
     # 보안 설정
     SECRET_KEY: str = os.getenv("SECRET_KEY", "")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+    # 경로 탐색 설정
+    # ROUTING_MODE: auto (스냅샷이 있으면 로컬 엔진 사용), local (로컬 엔진만 사용), remote (외부 API만 사용)
+    ROUTING_MODE: str = os.getenv("ROUTING_MODE", "auto")
+    # 스냅샷 디렉터리 또는 버전 저장소 디렉터리 (CURRENT 파일이 현재 버전을 가리킴)
+    ROUTING_SNAPSHOT_PATH: str = os.getenv("ROUTING_SNAPSHOT_PATH", os.path.join(REPO_ROOT, "find-route", "snapshot"))
+    ROUTING_ENGINE_PATH: str = os.getenv("ROUTING_ENGINE_PATH", os.path.join(REPO_ROOT, "find-route"))
+    ROUTING_WORKERS: int = int(os.getenv("ROUTING_WORKERS", "2"))  # 경로 탐색 작업 프로세스 수
+    ROUTING_MAX_PENDING: int = int(os.getenv("ROUTING_MAX_PENDING", "64"))  # 처리 중 요청 상한 (초과 시 503)
+    ROUTING_TIMEOUT_SECONDS: float = float(os.getenv("ROUTING_TIMEOUT_SECONDS", "5"))  # 요청별 제한 시간
+    ROUTING_BATCH_MAX_PAIRS: int = int(os.getenv("ROUTING_BATCH_MAX_PAIRS", "100"))  # 일괄 길찾기 요청당 최대 쌍 수
+    ROUTING_MAX_OPTIMIZED_WAYPOINTS: int = int(os.getenv("ROUTING_MAX_OPTIMIZED_WAYPOINTS", "30"))  # 순서 최적화 최대 경유지 수
+    ROUTING_REFRESH_SECONDS: float = float(os.getenv("ROUTING_REFRESH_SECONDS", "30"))  # 새 스냅샷 버전 확인 주기 (0이면 끔)
+
+    # 외부 API HTTP 클라이언트 설정 (외부 API별 연결 풀마다 적용)
+    HTTP_HTTP2: bool = os.getenv("HTTP_HTTP2", "true").lower() == "true"  # h2 패키지가 있으면 HTTP/2 사용
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+    HTTP_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_TIMEOUT_SECONDS", "5"))  # 쓰기 등 나머지 제한 시간
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "3"))
+    HTTP_READ_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_READ_TIMEOUT_SECONDS", "5"))
+    HTTP_NAVI_READ_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_NAVI_READ_TIMEOUT_SECONDS", "10"))  # 길찾기 API
+    HTTP_POOL_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_POOL_TIMEOUT_SECONDS", "3"))  # 연결 풀 대기 시간
+
+    # 카카오 로컬 API 응답 캐시 설정
+    KAKAO_CACHE_SEARCH_TTL_SECONDS: float = float(os.getenv("KAKAO_CACHE_SEARCH_TTL_SECONDS", "300"))  # 키워드/카테고리 검색
+    KAKAO_CACHE_GEOCODE_TTL_SECONDS: float = float(os.getenv("KAKAO_CACHE_GEOCODE_TTL_SECONDS", "86400"))  # 주소/좌표 변환
+    KAKAO_CACHE_MAX_ENTRIES: int = int(os.getenv("KAKAO_CACHE_MAX_ENTRIES", "1024"))  # 캐시별 최대 항목 수
+
+    # 좌표 -> 주소 변환 격자 캐시 설정
+    GEOCODE_GEOHASH_PRECISION: int = int(os.getenv("GEOCODE_GEOHASH_PRECISION", "8"))  # 7: 약 150m, 8: 약 38m x 19m
+    GEOCODE_CACHE_MAX_ENTRIES: int = int(os.getenv("GEOCODE_CACHE_MAX_ENTRIES", "10000"))
+    GEOCODE_BATCH_MAX_POINTS: int = int(os.getenv("GEOCODE_BATCH_MAX_POINTS", "100"))  # 일괄 변환 요청당 최대 좌표 수
+    GEOCODE_BATCH_CONCURRENCY: int = int(os.getenv("GEOCODE_BATCH_CONCURRENCY", "8"))  # 일괄 변환 동시 조회 수
+
+    # 타슈 대여소 목록 메모리 스냅샷 설정 (갱신 주기 0이면 요청마다 타슈 API 호출)
+    TASHU_SNAPSHOT_REFRESH_SECONDS: float = float(os.getenv("TASHU_SNAPSHOT_REFRESH_SECONDS", "20"))
+    TASHU_SNAPSHOT_JITTER_SECONDS: float = float(os.getenv("TASHU_SNAPSHOT_JITTER_SECONDS", "5"))  # 갱신 주기 무작위 편차
+    TASHU_SNAPSHOT_MAX_AGE_SECONDS: float = float(os.getenv("TASHU_SNAPSHOT_MAX_AGE_SECONDS", "120"))  # 넘으면 요청 시 갱신
+
+    # 대여소 목록의 자전거 정보 동시 조회 설정 (with_availability)
+    TASHU_AVAILABILITY_MAX_AGE_SECONDS: float = float(os.getenv("TASHU_AVAILABILITY_MAX_AGE_SECONDS", "30"))  # 이내면 스냅샷 사용
+    TASHU_AVAILABILITY_CONCURRENCY: int = int(os.getenv("TASHU_AVAILABILITY_CONCURRENCY", "16"))  # 동시 조회 수
+    TASHU_AVAILABILITY_TIMEOUT_SECONDS: float = float(os.getenv("TASHU_AVAILABILITY_TIMEOUT_SECONDS", "2"))  # 대여소별 제한 시간
+    TASHU_AVAILABILITY_CACHE_TTL_SECONDS: float = float(os.getenv("TASHU_AVAILABILITY_CACHE_TTL_SECONDS", "10"))
+    TASHU_AVAILABILITY_CACHE_MAX_ENTRIES: int = int(os.getenv("TASHU_AVAILABILITY_CACHE_MAX_ENTRIES", "2048"))
+
+    # 목록 전체 개수(include_total) 캐시 설정
+    PAGINATION_COUNT_CACHE_TTL_SECONDS: float = float(os.getenv("PAGINATION_COUNT_CACHE_TTL_SECONDS", "30"))
+    PAGINATION_COUNT_CACHE_MAX_ENTRIES: int = int(os.getenv("PAGINATION_COUNT_CACHE_MAX_ENTRIES", "4096"))
+
     class Config:
         case_sensitive = True
 
@@ -0,0 +1,119 @@
+import math
+from typing import List, Tuple
+
+# geohash base32 문자 (a, i, l, o 제외)
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE = {c: i for i, c in enumerate(BASE32)}
+
+
+def encode(latitude: float, longitude: float, precision: int = 8) -> str:
+    """
+    위경도를 geohash 문자열로 변환합니다.
+    길이 7이면 약 153m x 153m, 길이 8이면 약 38m x 19m 격자 칸입니다.
+
+    Args:
+        latitude: 위도
+        longitude: 경도
+        precision: geohash 길이
+
+    Returns:
+        geohash 문자열
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bit, value, even = 0, 0, True
+    while len(chars) < precision:
+        # 짝수 번째 비트는 경도, 홀수 번째 비트는 위도를 반으로 나눔
+        target, coordinate = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (target[0] + target[1]) / 2
+        if coordinate >= mid:
+            value = (value << 1) | 1
+            target[0] = mid
+        else:
+            value <<= 1
+            target[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(BASE32[value])
+            bit, value = 0, 0
+    return "".join(chars)
+
+
+def bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """
+    geohash 칸의 경계
+
+    Returns:
+        (최소 위도, 최소 경도, 최대 위도, 최대 경도)
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for c in geohash:
+        value = _DECODE[c]
+        for shift in range(4, -1, -1):
+            target = lon_range if even else lat_range
+            mid = (target[0] + target[1]) / 2
+            if (value >> shift) & 1:
+                target[0] = mid
+            else:
+                target[1] = mid
+            even = not even
+    return lat_range[0], lon_range[0], lat_range[1], lon_range[1]
+
+
+def decode(geohash: str) -> Tuple[float, float]:
+    """
+    geohash 칸의 중심 좌표
+
+    Returns:
+        (위도, 경도)
+    """
+    min_lat, min_lon, max_lat, max_lon = bounds(geohash)
+    return (min_lat + max_lat) / 2, (min_lon + max_lon) / 2
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """
+    geohash 칸 크기
+
+    Returns:
+        (위도 폭, 경도 폭) 도 단위
+    """
+    lat_bits = precision * 5 // 2
+    lon_bits = precision * 5 - lat_bits
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def covering(min_lat: float, min_lon: float, max_lat: float, max_lon: float,
+             max_cells: int = 16) -> List[str]:
+    """
+    영역을 덮는 geohash 칸 목록 (max_cells개 이하가 되는 가장 긴 geohash)
+    각 칸은 geohash 문자열 접두어 범위 조회에 사용합니다.
+
+    Args:
+        min_lat, min_lon, max_lat, max_lon: 영역 경계
+        max_cells: 최대 칸 수
+
+    Returns:
+        geohash 목록
+    """
+    for precision in range(12, 0, -1):
+        height, width = cell_size(precision)
+        first_row = math.floor((min_lat + 90) / height)
+        first_col = math.floor((min_lon + 180) / width)
+        rows = math.floor((max_lat + 90) / height) - first_row + 1
+        cols = math.floor((max_lon + 180) / width) - first_col + 1
+        if rows * cols > max_cells and precision > 1:
+            continue
+        cells = set()
+        for row in range(rows):
+            for col in range(cols):
+                # 칸 중심 좌표로 geohash를 구함
+                lat = (first_row + row + 0.5) * height - 90
+                lon = (first_col + col + 0.5) * width - 180
+                cells.add(encode(min(lat, 90.0), (lon + 180) % 360 - 180, precision))
+        return sorted(cells)
+    return []
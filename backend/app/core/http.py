@@ -0,0 +1,74 @@
+from typing import Dict
+
+import httpx
+
+from app.core.config import settings
+
+# 외부 API별 연결 풀 이름
+KAKAO_LOCAL = "kakao_local"        # 카카오 로컬 (장소 검색, 주소 변환)
+KAKAO_MOBILITY = "kakao_mobility"  # 카카오 모빌리티 (길찾기)
+TASHU = "tashu"
+DURUNUBI = "durunubi"
+
+# 외부 API별 읽기 제한 시간 (초, 없으면 HTTP_READ_TIMEOUT_SECONDS)
+READ_TIMEOUTS: Dict[str, float] = {
+    KAKAO_MOBILITY: settings.HTTP_NAVI_READ_TIMEOUT_SECONDS,
+}
+
+
+def _http2_available() -> bool:
+    # HTTP/2는 h2 패키지가 있을 때만 사용 (서버가 지원하지 않으면 ALPN으로 HTTP/1.1 사용)
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClientRegistry:
+    """
+    외부 API별 공유 httpx.AsyncClient 저장소
+
+    요청마다 클라이언트를 새로 만들면 호출마다 TCP/TLS 연결을 다시 맺어야 하므로,
+    외부 API마다 연결 풀(keep-alive)을 가진 클라이언트를 하나씩 만들어 애플리케이션 수명 동안 재사용합니다.
+    클라이언트는 처음 사용할 때 만들고, 애플리케이션 종료 시 close()로 모두 닫습니다.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self.http2 = settings.HTTP_HTTP2 and _http2_available()
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """
+        외부 API 이름에 해당하는 공유 클라이언트 (없거나 닫혔으면 새로 생성)
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._create(name)
+            self._clients[name] = client
+        return client
+
+    def _create(self, name: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS
+            ),
+            timeout=httpx.Timeout(
+                settings.HTTP_TIMEOUT_SECONDS,
+                connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS,
+                read=READ_TIMEOUTS.get(name, settings.HTTP_READ_TIMEOUT_SECONDS),
+                pool=settings.HTTP_POOL_TIMEOUT_SECONDS
+            )
+        )
+
+    async def close(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+# 애플리케이션 전체에서 공유하는 클라이언트 저장소
+http_clients = HttpClientRegistry()
@@ -0,0 +1,78 @@
+import base64
+import json
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache
+from app.core.config import settings
+
+# 목록 전체 개수 캐시 (include_total 요청마다 COUNT를 다시 실행하지 않음)
+count_cache = get_cache("pagination_count", settings.PAGINATION_COUNT_CACHE_TTL_SECONDS,
+                        settings.PAGINATION_COUNT_CACHE_MAX_ENTRIES)
+
+
+def encode_cursor(kind: str, values: List[Any]) -> str:
+    """
+    다음 페이지 위치(마지막 항목의 정렬 키)를 클라이언트에 넘길 커서 문자열로 변환
+
+    Args:
+        kind: 커서 종류 (다른 목록의 커서를 잘못 넘기는 경우를 구분)
+        values: 마지막 항목의 정렬 키 값
+
+    Returns:
+        URL에 그대로 쓸 수 있는 base64 문자열
+    """
+    raw = json.dumps({"k": kind, "v": values}, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(kind: str, cursor: str) -> List[Any]:
+    """
+    커서 문자열을 정렬 키 값으로 변환
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 다른 목록의 커서인 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("유효하지 않은 커서입니다")
+    if not isinstance(data, dict) or data.get("k") != kind or not isinstance(data.get("v"), list):
+        raise ValueError("유효하지 않은 커서입니다")
+    return data["v"]
+
+
+def cut_page(rows: Sequence[Any], limit: int, kind: str,
+             key: Callable[[Any], List[Any]]) -> Tuple[List[Any], Optional[str]]:
+    """
+    limit + 1개를 조회한 결과를 한 페이지와 다음 페이지 커서로 나눕니다.
+
+    Args:
+        rows: limit + 1개까지 조회한 행
+        limit: 페이지 크기
+        kind: 커서 종류
+        key: 행의 정렬 키 값
+
+    Returns:
+        (페이지 행 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+    """
+    if len(rows) <= limit:
+        return list(rows), None
+    rows = list(rows[:limit])
+    return rows, encode_cursor(kind, key(rows[-1]))
+
+
+def estimated_row_count(db: Session, table_name: str) -> Optional[int]:
+    """
+    테이블 전체 행 수 추정치 (PostgreSQL 통계 정보, 그 외 데이터베이스이거나 통계가 없으면 None)
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name"), {"name": table_name}
+    ).scalar()
+    # 한 번도 ANALYZE하지 않은 테이블은 -1
+    return int(estimate) if estimate is not None and estimate >= 0 else None
@@ -2,12 +2,15 @@ from sqlalchemy.orm import Session
 
 from app.db.base import Base
 from app.db.session import engine
+from app.db.spatial import setup_spatial_index
 from app.core.config import settings
 
 # 데이터베이스 초기화 함수
 def init_db() -> None:
     # 모든 테이블 생성
     Base.metadata.create_all(bind=engine)
+    # 주변 위치 조회용 공간 인덱스 (PostGIS GiST 또는 SQLite R*Tree) 생성
+    setup_spatial_index(engine)
 
 if __name__ == "__main__":
     init_db()
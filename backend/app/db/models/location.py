@@ -1,8 +1,10 @@
-from sqlalchemy import Column, Integer, String, Float, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Float, Enum, DateTime, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
+from app.core import geohash
 from app.db.session import Base
+from app.db.spatial import GEOHASH_PRECISION
 
 class LocationType(enum.Enum):
     TASHU = "tashu"
@@ -16,6 +18,7 @@ class Location(Base):
     name = Column(String, index=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
+    geohash = Column(String(GEOHASH_PRECISION), index=True)  # 주변 위치 조회용 (위경도에서 자동 계산)
     address = Column(String, nullable=True)
     type = Column(Enum(LocationType), nullable=False)
     external_id = Column(String, nullable=True)  # 외부 API의 ID
@@ -28,3 +31,9 @@ class Location(Base):
     
     def __repr__(self):
         return f"<Location {self.name} ({self.type.value})>"
+
+
+@event.listens_for(Location, "before_insert")
+@event.listens_for(Location, "before_update")
+def _set_geohash(mapper, connection, target: Location) -> None:
+    target.geohash = geohash.encode(target.latitude, target.longitude, GEOHASH_PRECISION)
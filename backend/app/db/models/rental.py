@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -11,6 +11,10 @@ class RentalStatus(enum.Enum):
 
 class Rental(Base):
     __tablename__ = "rentals"
+    __table_args__ = (
+        # 사용자별 대여 이력 커서 페이지네이션 (대여 시각, ID 순)
+        Index("ix_rentals_user_rental_time", "user_id", "rental_time", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,15 +1,45 @@
-from sqlalchemy import create_engine
+from typing import AsyncGenerator
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.db.spatial import register_sqlite_functions
 
 # 데이터베이스 엔진 생성
 engine = create_engine(settings.DATABASE_URL)
 
+# SQLite에는 없는 거리 계산 함수 등록 (주변 위치 조회)
+event.listen(engine, "connect", register_sqlite_functions)
+
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 드라이버
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def async_database_url(url: str) -> str:
+    """
+    동기 드라이버 URL을 같은 데이터베이스의 비동기 드라이버 URL로 변환
+    """
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        return url.render_as_string(hide_password=False)
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+# 비동기 데이터베이스 엔진 생성 (async 라우트에서 이벤트 루프를 막지 않고 조회)
+async_engine = create_async_engine(settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL))
+
+# 비동기 세션 팩토리 생성 (커밋 후에도 응답 직렬화에 객체 속성을 쓰므로 만료하지 않음)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 # Base 클래스 생성 - 모든 모델이 상속할 클래스
 Base = declarative_base()
 
@@ -20,3 +50,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# async 라우트용 의존성 주입 함수
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,189 @@
+import math
+import sqlite3
+from typing import Dict, Tuple
+
+from sqlalchemy import and_, bindparam, column, func, inspect, or_, select, table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.core import geohash
+
+EARTH_RADIUS_M = 6371000.0
+
+# 위치 테이블에 저장하는 geohash 길이 (약 3.7cm x 1.9cm 칸, 조회 시에는 접두어로 범위 검색)
+GEOHASH_PRECISION = 12
+
+# 반경을 덮는 geohash 칸 최대 수 (칸마다 인덱스 범위 조회 한 번)
+GEOHASH_MAX_CELLS = 16
+
+# 공간 조회 방식
+POSTGIS = "postgis"   # PostGIS ST_DWithin + GiST 인덱스
+RTREE = "rtree"       # SQLite R*Tree 가상 테이블
+GEOHASH = "geohash"   # geohash 열 인덱스 범위 조회 (확장 기능이 없는 데이터베이스)
+
+# SQLite R*Tree 색인 (위치 테이블의 트리거로 함께 갱신)
+locations_rtree = table("locations_rtree", column("id"), column("min_lat"), column("max_lat"),
+                        column("min_lon"), column("max_lon"))
+
+SQLITE_RTREE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS locations_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon)",
+    """CREATE TRIGGER IF NOT EXISTS locations_rtree_insert AFTER INSERT ON locations BEGIN
+        INSERT INTO locations_rtree VALUES (new.id, new.latitude, new.latitude, new.longitude, new.longitude);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS locations_rtree_update AFTER UPDATE OF latitude, longitude ON locations BEGIN
+        UPDATE locations_rtree SET min_lat = new.latitude, max_lat = new.latitude,
+            min_lon = new.longitude, max_lon = new.longitude WHERE id = new.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS locations_rtree_delete AFTER DELETE ON locations BEGIN
+        DELETE FROM locations_rtree WHERE id = old.id;
+    END""",
+    "INSERT OR IGNORE INTO locations_rtree SELECT id, latitude, latitude, longitude, longitude FROM locations",
+]
+
+# PostGIS 공간 인덱스 (조회 식과 같은 식으로 만든 GiST 함수 인덱스)
+POSTGIS_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_locations_geography ON locations "
+    "USING GIST (geography(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)))"
+)
+
+# 엔진별 공간 조회 방식 (처음 조회할 때 확인)
+_backends: Dict[str, str] = {}
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(math.sqrt(a), 1.0))
+
+
+def register_sqlite_functions(dbapi_connection, connection_record) -> None:
+    """
+    SQLite 연결에 haversine(lat1, lon1, lat2, lon2) 함수 등록 (SQLite에는 삼각 함수가 없을 수 있음)
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_function("haversine", 4, haversine_m, deterministic=True)
+
+
+def bounding_box(latitude: float, longitude: float, radius_m: float) -> Tuple[float, float, float, float]:
+    """
+    반경을 덮는 위경도 사각형
+
+    Returns:
+        (최소 위도, 최소 경도, 최대 위도, 최대 경도)
+    """
+    dlat = math.degrees(radius_m / EARTH_RADIUS_M)
+    dlon = dlat / max(math.cos(math.radians(latitude)), 1e-6)
+    return (max(latitude - dlat, -90.0), max(longitude - dlon, -180.0),
+            min(latitude + dlat, 90.0), min(longitude + dlon, 180.0))
+
+
+def spatial_backend(db: Session) -> str:
+    """
+    데이터베이스에서 사용할 수 있는 공간 조회 방식 (PostGIS > SQLite R*Tree > geohash)
+    """
+    engine = db.get_bind()
+    key = str(engine.url)
+    backend = _backends.get(key)
+    if backend is None:
+        backend = GEOHASH
+        if engine.dialect.name == "postgresql":
+            if db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'postgis'")).first():
+                backend = POSTGIS
+        elif engine.dialect.name == "sqlite":
+            if db.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'locations_rtree'")).first():
+                backend = RTREE
+        _backends[key] = backend
+    return backend
+
+
+def setup_spatial_index(engine: Engine) -> str:
+    """
+    위치 테이블 공간 인덱스 생성 및 geohash 열 채우기 (테이블 생성 후 한 번 실행)
+
+    Returns:
+        사용할 공간 조회 방식
+    """
+    from app.db.models.location import Location
+
+    backend = GEOHASH
+    with engine.begin() as connection:
+        # geohash 열이 생기기 전에 만든 테이블이면 열과 인덱스 추가
+        if "geohash" not in {c["name"] for c in inspect(connection).get_columns("locations")}:
+            connection.exec_driver_sql(f"ALTER TABLE locations ADD COLUMN geohash VARCHAR({GEOHASH_PRECISION})")
+            connection.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_locations_geohash ON locations (geohash)")
+
+        # geohash 열이 비어 있는 기존 행 채우기
+        rows = connection.execute(
+            select(Location.id, Location.latitude, Location.longitude).where(Location.geohash.is_(None))
+        ).all()
+        if rows:
+            connection.execute(
+                Location.__table__.update().where(Location.id == bindparam("row_id"))
+                .values(geohash=bindparam("row_geohash")),
+                [{"row_id": row.id, "row_geohash": geohash.encode(row.latitude, row.longitude, GEOHASH_PRECISION)}
+                 for row in rows]
+            )
+
+        if engine.dialect.name == "postgresql":
+            if connection.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'postgis'")).first():
+                connection.execute(text(POSTGIS_INDEX_DDL))
+                backend = POSTGIS
+
+    if engine.dialect.name == "sqlite":
+        try:
+            with engine.begin() as connection:
+                for statement in SQLITE_RTREE_DDL:
+                    connection.exec_driver_sql(statement)
+            backend = RTREE
+        except OperationalError:
+            # R*Tree 모듈 없이 빌드된 SQLite
+            pass
+    _backends.pop(str(engine.url), None)
+    return backend
+
+
+def nearby_filter(db: Session, model, latitude: float, longitude: float, radius_m: float):
+    """
+    반경 안의 행만 남기는 조건과 거리 식 (model: latitude, longitude, geohash 열이 있는 위치 모델)
+
+    인덱스로 후보를 줄이는 조건(PostGIS ST_DWithin, R*Tree 사각형, geohash 칸 범위)과
+    정확한 haversine 거리 조건을 함께 반환합니다.
+
+    Returns:
+        (조건, 거리(m) 식)
+    """
+    latitude_column, longitude_column = model.latitude, model.longitude
+    backend = spatial_backend(db)
+    if backend == POSTGIS:
+        point = func.geography(func.ST_SetSRID(func.ST_MakePoint(model.longitude, model.latitude), 4326))
+        target = func.geography(func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326))
+        return func.ST_DWithin(point, target, radius_m), func.ST_Distance(point, target)
+
+    min_lat, min_lon, max_lat, max_lon = bounding_box(latitude, longitude, radius_m)
+    if db.get_bind().dialect.name == "sqlite":
+        distance = func.haversine(latitude_column, longitude_column, latitude, longitude)
+    else:
+        distance = 2 * EARTH_RADIUS_M * func.asin(func.sqrt(
+            func.power(func.sin(func.radians(latitude_column - latitude) / 2), 2)
+            + func.cos(func.radians(latitude)) * func.cos(func.radians(latitude_column))
+            * func.power(func.sin(func.radians(longitude_column - longitude) / 2), 2)
+        ))
+
+    if backend == RTREE:
+        candidates = model.id.in_(select(locations_rtree.c.id).where(
+            locations_rtree.c.min_lat <= max_lat, locations_rtree.c.max_lat >= min_lat,
+            locations_rtree.c.min_lon <= max_lon, locations_rtree.c.max_lon >= min_lon
+        ))
+    else:
+        # 칸마다 geohash 접두어 범위 (base32 문자 중 가장 큰 'z' 다음 문자 '{'를 상한으로 사용)
+        cells = geohash.covering(min_lat, min_lon, max_lat, max_lon, GEOHASH_MAX_CELLS)
+        candidates = or_(*(and_(model.geohash >= cell, model.geohash < cell + "{") for cell in cells))
+
+    condition = and_(
+        candidates,
+        latitude_column.between(min_lat, max_lat),
+        longitude_column.between(min_lon, max_lon),
+        distance <= radius_m
+    )
+    return condition, distance
@@ -1,14 +1,36 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 
 from app.api.routes import map, tashu, durunubi, locations, favorites, auth, navigation, rental
 from app.core.config import settings
+from app.core.http import http_clients
+from app.db.session import async_engine
+from app.api.dependencies import get_tashu_service
+from app.services.routing_executor import start_routing_executor, stop_routing_executor
+from app.services.tashu_snapshot import start_station_snapshot, stop_station_snapshot
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 시작 시 경로 탐색 작업 프로세스를 띄워 스냅샷 로드
+    await start_routing_executor()
+    # 타슈 대여소 목록을 메모리에 올리고 주기적으로 갱신
+    await start_station_snapshot(get_tashu_service())
+    yield
+    await stop_station_snapshot()
+    stop_routing_executor()
+    # 외부 API 연결 풀과 비동기 데이터베이스 연결 풀 정리
+    await http_clients.close()
+    await async_engine.dispose()
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
 # CORS 미들웨어 설정
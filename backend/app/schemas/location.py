@@ -37,8 +37,9 @@ class Location(LocationInDB):
     pass
 
 class LocationList(BaseModel):
-    total: int
+    total: Optional[int] = None  # include_total을 지정한 경우만 (추정치 또는 캐시된 값일 수 있음)
     items: List[Location]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
     class Config:
         orm_mode = True
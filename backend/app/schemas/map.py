@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from app.core.config import settings
+from app.schemas.navigation import Coordinate
+
+class BatchAddressRequest(BaseModel):
+    points: List[Coordinate] = Field(..., min_length=1, max_length=settings.GEOCODE_BATCH_MAX_POINTS)
+    precision: Optional[int] = Field(None, ge=7, le=9)  # geohash 길이 (기본값: GEOCODE_GEOHASH_PRECISION)
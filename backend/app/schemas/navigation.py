@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+from typing import List
+from enum import Enum
+
+from app.core.config import settings
+
+class BikePriority(str, Enum):
+    RECOMMEND = "RECOMMEND"
+    SAFETY = "SAFETY"
+    DISTANCE = "DISTANCE"
+
+class Coordinate(BaseModel):
+    x: float  # 경도
+    y: float  # 위도
+
+class DirectionsPair(BaseModel):
+    origin: Coordinate
+    destination: Coordinate
+
+class BatchDirectionsRequest(BaseModel):
+    pairs: List[DirectionsPair] = Field(..., min_length=1, max_length=settings.ROUTING_BATCH_MAX_PAIRS)
+    priority: BikePriority = BikePriority.RECOMMEND
+    include_geometry: bool = False
@@ -35,8 +35,9 @@ class Rental(RentalInDB):
     pass
 
 class RentalList(BaseModel):
-    total: int
+    total: Optional[int] = None  # include_total을 지정한 경우만 (추정치 또는 캐시된 값일 수 있음)
     items: List[Rental]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
     class Config:
         orm_mode = True
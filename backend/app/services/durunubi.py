@@ -1,6 +1,7 @@
 import httpx
 from typing import Dict, Any, List, Optional
 from app.core.config import settings
+from app.core.http import DURUNUBI, http_clients
 
 class DurunubiService:
     """두루누비(자전거 도로 및 보행로) API 서비스"""
@@ -11,6 +12,11 @@ class DurunubiService:
     def __init__(self):
         self.api_key = settings.DURUNUBI_API_KEY
     
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 연결 풀을 사용하는 HTTP 클라이언트"""
+        return http_clients.get(DURUNUBI)
+    
     async def get_bike_routes(self, latitude: Optional[float] = None, 
                              longitude: Optional[float] = None, 
                              radius: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -38,19 +44,18 @@ class DurunubiService:
                 "radius": radius
             })
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()["data"]
-            except httpx.HTTPStatusError as e:
-                # API 오류 처리
-                print(f"두루누비 API 오류: {e}")
-                return []
-            except Exception as e:
-                # 기타 오류 처리
-                print(f"두루누비 API 호출 중 오류 발생: {e}")
-                return []
+        try:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()["data"]
+        except httpx.HTTPStatusError as e:
+            # API 오류 처리
+            print(f"두루누비 API 오류: {e}")
+            return []
+        except Exception as e:
+            # 기타 오류 처리
+            print(f"두루누비 API 호출 중 오류 발생: {e}")
+            return []
     
     async def get_bike_facilities(self, latitude: float, longitude: float, 
                                 radius: int = 5000) -> List[Dict[str, Any]]:
@@ -73,19 +78,18 @@ class DurunubiService:
             "radius": radius
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()["data"]
-            except httpx.HTTPStatusError as e:
-                # API 오류 처리
-                print(f"두루누비 API 오류: {e}")
-                return []
-            except Exception as e:
-                # 기타 오류 처리
-                print(f"두루누비 API 호출 중 오류 발생: {e}")
-                return []
+        try:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()["data"]
+        except httpx.HTTPStatusError as e:
+            # API 오류 처리
+            print(f"두루누비 API 오류: {e}")
+            return []
+        except Exception as e:
+            # 기타 오류 처리
+            print(f"두루누비 API 호출 중 오류 발생: {e}")
+            return []
     
     async def get_walking_routes(self, latitude: float, longitude: float, 
                                radius: int = 5000) -> List[Dict[str, Any]]:
@@ -108,19 +112,18 @@ class DurunubiService:
             "radius": radius
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()["data"]
-            except httpx.HTTPStatusError as e:
-                # API 오류 처리
-                print(f"두루누비 API 오류: {e}")
-                return []
-            except Exception as e:
-                # 기타 오류 처리
-                print(f"두루누비 API 호출 중 오류 발생: {e}")
-                return []
+        try:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()["data"]
+        except httpx.HTTPStatusError as e:
+            # API 오류 처리
+            print(f"두루누비 API 오류: {e}")
+            return []
+        except Exception as e:
+            # 기타 오류 처리
+            print(f"두루누비 API 호출 중 오류 발생: {e}")
+            return []
     
     async def get_route_detail(self, route_id: str) -> Dict[str, Any]:
         """
@@ -137,19 +140,18 @@ class DurunubiService:
             "apiKey": self.api_key
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()["data"]
-            except httpx.HTTPStatusError as e:
-                # API 오류 처리
-                print(f"두루누비 API 오류: {e}")
-                return {}
-            except Exception as e:
-                # 기타 오류 처리
-                print(f"두루누비 API 호출 중 오류 발생: {e}")
-                return {}
+        try:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()["data"]
+        except httpx.HTTPStatusError as e:
+            # API 오류 처리
+            print(f"두루누비 API 오류: {e}")
+            return {}
+        except Exception as e:
+            # 기타 오류 처리
+            print(f"두루누비 API 호출 중 오류 발생: {e}")
+            return {}
     
     def parse_facility_to_location(self, facility: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1,6 +1,10 @@
+import asyncio
 import httpx
 from typing import Dict, Any, List, Optional
+from app.core import geohash
+from app.core.cache import AsyncTTLCache, get_cache
 from app.core.config import settings
+from app.core.http import KAKAO_LOCAL, http_clients
 
 class KakaoMapService:
     """카카오 지도 API 서비스"""
@@ -12,6 +16,31 @@ class KakaoMapService:
         self.headers = {
             "Authorization": f"KakaoAK {self.api_key}"
         }
+        # 같은 검색어/좌표 요청은 캐시된 응답을 사용 (인스턴스가 달라도 이름이 같은 캐시를 공유)
+        size = settings.KAKAO_CACHE_MAX_ENTRIES
+        self.keyword_cache = get_cache("kakao_keyword", settings.KAKAO_CACHE_SEARCH_TTL_SECONDS, size)
+        self.category_cache = get_cache("kakao_category", settings.KAKAO_CACHE_SEARCH_TTL_SECONDS, size)
+        self.address_cache = get_cache("kakao_address", settings.KAKAO_CACHE_GEOCODE_TTL_SECONDS, size)
+        self.coordinates_cache = get_cache("kakao_coordinates", settings.KAKAO_CACHE_GEOCODE_TTL_SECONDS, size)
+        self.reverse_geocode_cache = get_cache("kakao_reverse_geocode", settings.KAKAO_CACHE_GEOCODE_TTL_SECONDS,
+                                               settings.GEOCODE_CACHE_MAX_ENTRIES)
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 연결 풀을 사용하는 HTTP 클라이언트"""
+        return http_clients.get(KAKAO_LOCAL)
+    
+    async def _get(self, cache: AsyncTTLCache, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        카카오 API GET 요청 - 같은 요청은 TTL 동안 캐시된 응답을 반환하고, 동시에 들어온 같은 요청은 한 번만 호출
+        """
+        key = (url, tuple(sorted((k, str(v)) for k, v in params.items())))
+        return await cache.get_or_load(key, lambda: self._request(url, params))
+    
+    async def _request(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self.client.get(url, headers=self.headers, params=params)
+        response.raise_for_status()
+        return response.json()
     
     async def search_keyword(self, query: str, x: Optional[str] = None, y: Optional[str] = None, 
                             radius: int = 1000, page: int = 1, size: int = 15) -> Dict[str, Any]:
@@ -44,10 +73,7 @@ class KakaoMapService:
                 "radius": radius
             })
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(self.keyword_cache, url, params)
     
     async def search_category(self, category_group_code: str, x: str, y: str, 
                              radius: int = 1000, page: int = 1, size: int = 15) -> Dict[str, Any]:
@@ -75,10 +101,7 @@ class KakaoMapService:
             "size": size
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(self.category_cache, url, params)
     
     async def get_address(self, x: str, y: str) -> Dict[str, Any]:
         """
@@ -97,10 +120,71 @@ class KakaoMapService:
             "y": y
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(self.address_cache, url, params)
+    
+    async def reverse_geocode(self, x: float, y: float, precision: Optional[int] = None) -> Dict[str, Any]:
+        """
+        격자 단위 좌표 -> 주소 변환
+        
+        좌표를 geohash 칸으로 양자화해 칸 중심 좌표의 주소를 조회하고 칸 단위로 캐시하므로,
+        GPS 오차로 조금씩 흔들리는 좌표들도 같은 캐시 항목을 사용합니다.
+        
+        Args:
+            x: 경도 좌표
+            y: 위도 좌표
+            precision: geohash 길이 (기본값: GEOCODE_GEOHASH_PRECISION)
+            
+        Returns:
+            주소 정보 (geohash: 좌표가 속한 칸)
+        """
+        cell = geohash.encode(y, x, precision or settings.GEOCODE_GEOHASH_PRECISION)
+        center_y, center_x = geohash.decode(cell)
+        url = f"{self.BASE_URL}/geo/coord2address.json"
+        result = await self.reverse_geocode_cache.get_or_load(
+            cell, lambda: self._request(url, {"x": round(center_x, 7), "y": round(center_y, 7)})
+        )
+        return dict(result, geohash=cell)
+    
+    async def reverse_geocode_batch(self, points: List[Dict[str, float]],
+                                    precision: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        여러 좌표의 격자 단위 주소를 한 번에 조회
+        
+        같은 칸에 속한 좌표는 한 번만 조회하고, 칸별 조회는 GEOCODE_BATCH_CONCURRENCY개까지 동시에 실행합니다.
+        일부 조회가 실패해도 나머지 결과는 반환합니다.
+        
+        Args:
+            points: 좌표 목록 [{"x": 경도, "y": 위도}, ...]
+            precision: geohash 길이 (기본값: GEOCODE_GEOHASH_PRECISION)
+            
+        Returns:
+            좌표 순서대로의 주소 정보 목록 (실패한 좌표는 error 포함)
+        """
+        semaphore = asyncio.Semaphore(settings.GEOCODE_BATCH_CONCURRENCY)
+        
+        async def lookup(point: Dict[str, float]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.reverse_geocode(point["x"], point["y"], precision)
+                except Exception as e:
+                    return {"error": str(e)}
+        
+        cells = [geohash.encode(p["y"], p["x"], precision or settings.GEOCODE_GEOHASH_PRECISION) for p in points]
+        first = {}
+        for point, cell in zip(points, cells):
+            first.setdefault(cell, point)
+        results = dict(zip(first, await asyncio.gather(*(lookup(p) for p in first.values()))))
+        
+        items = []
+        for point, cell in zip(points, cells):
+            result = results[cell]
+            item = {"x": point["x"], "y": point["y"], "geohash": cell}
+            if "error" in result:
+                item["error"] = result["error"]
+            else:
+                item["documents"] = result.get("documents", [])
+            items.append(item)
+        return items
     
     async def get_coordinates(self, address: str) -> Dict[str, Any]:
         """
@@ -117,7 +201,4 @@ class KakaoMapService:
             "query": address
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        return await self._get(self.coordinates_cache, url, params)
@@ -1,6 +1,10 @@
 import httpx
 from typing import Dict, Any, List, Optional
 from app.core.config import settings
+from app.core.http import KAKAO_MOBILITY, http_clients
+from app.services.routing_executor import RoutingExecutor
+from app.services.tashu import TashuService
+from app.services.tashu_snapshot import get_station_snapshot, load_station_snapshot
 
 class NavigationService:
     """네비게이션 서비스 - 경로 탐색 및 안내"""
@@ -8,12 +12,21 @@ class NavigationService:
     # 카카오 모빌리티 API 기반 (실제 엔드포인트는 API 문서 참조)
     BASE_URL = "https://apis-navi.kakaomobility.com/v1"
     
-    def __init__(self):
+    def __init__(self,
+                 routing_executor: Optional[RoutingExecutor] = None,
+                 tashu_service: Optional[TashuService] = None):
+        self.routing_executor = routing_executor
+        self.tashu_service = tashu_service or TashuService()
         self.api_key = settings.KAKAO_API_KEY
         self.headers = {
             "Authorization": f"KakaoAK {self.api_key}"
         }
     
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 연결 풀을 사용하는 HTTP 클라이언트"""
+        return http_clients.get(KAKAO_MOBILITY)
+    
     async def get_directions(self, 
                            origin_x: float, 
                            origin_y: float, 
@@ -66,17 +79,16 @@ class NavigationService:
         if waypoints:
             payload["waypoints"] = waypoints
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(url, headers=self.headers, json=payload)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                print(f"길찾기 API 오류: {e}")
-                return {"error": str(e)}
-            except Exception as e:
-                print(f"길찾기 API 호출 중 오류 발생: {e}")
-                return {"error": str(e)}
+        try:
+            response = await self.client.post(url, headers=self.headers, json=payload)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            print(f"길찾기 API 오류: {e}")
+            return {"error": str(e)}
+        except Exception as e:
+            print(f"길찾기 API 호출 중 오류 발생: {e}")
+            return {"error": str(e)}
     
     async def get_bike_directions(self,
                                 origin_x: float,
@@ -84,7 +96,8 @@ class NavigationService:
                                 destination_x: float,
                                 destination_y: float,
                                 waypoints: Optional[List[Dict[str, float]]] = None,
-                                priority: str = "RECOMMEND") -> Dict[str, Any]:
+                                priority: str = "RECOMMEND",
+                                optimize_waypoints: bool = False) -> Dict[str, Any]:
         """
         자전거 길찾기 API
         
@@ -95,11 +108,23 @@ class NavigationService:
             destination_y: 목적지 위도
             waypoints: 경유지 목록 [{"x": 경도, "y": 위도}, ...]
             priority: 길안내 우선순위 (RECOMMEND: 추천, SAFETY: 안전우선, DISTANCE: 최단거리)
+            optimize_waypoints: 경유지 방문 순서 최적화 여부 (로컬 경로 탐색 엔진에서만 지원)
             
         Returns:
             자전거 경로 정보
         """
-        # 실제 API가 없으므로 두루누비 데이터와 카카오 API를 조합하여 구현
+        # 로컬 경로 탐색 실행기가 있으면 외부 API 호출 없이 작업 프로세스에서 계산
+        if self.routing_executor is not None:
+            return await self.routing_executor.run(
+                "route",
+                {"x": origin_x, "y": origin_y},
+                {"x": destination_x, "y": destination_y},
+                waypoints=waypoints,
+                priority=priority,
+                optimize_waypoints=optimize_waypoints
+            )
+
+        # 로컬 엔진이 없으면 두루누비 데이터와 카카오 API를 조합하여 구현
         # 여기서는 예시로 구현
         
         # 자전거 도로 정보 가져오기
@@ -118,6 +143,212 @@ class NavigationService:
         
         return optimized_route
     
+    async def get_bike_directions_batch(self,
+                                        pairs: List[Dict[str, Dict[str, float]]],
+                                        priority: str = "RECOMMEND",
+                                        include_geometry: bool = False) -> Dict[str, Any]:
+        """
+        자전거 일괄 길찾기 - 여러 출발지/목적지 쌍을 작업 프로세스 한 번의 호출로 계산
+        
+        Args:
+            pairs: [{"origin": {"x": 경도, "y": 위도}, "destination": {"x": 경도, "y": 위도}}, ...]
+            priority: 길안내 우선순위 (RECOMMEND, SAFETY, DISTANCE)
+            include_geometry: 결과에 경로 좌표열 포함 여부
+            
+        Returns:
+            쌍 순서대로의 요약 경로 정보
+        """
+        if self.routing_executor is None:
+            return {"error": "로컬 경로 탐색 엔진이 준비되지 않았습니다"}
+        
+        return await self.routing_executor.run(
+            "route_batch", pairs, priority=priority, include_geometry=include_geometry
+        )
+    
+    async def get_isochrone(self,
+                            longitude: float,
+                            latitude: float,
+                            minutes: List[int],
+                            include_vertices: bool = False) -> Dict[str, Any]:
+        """
+        자전거 등시선 - 출발지에서 주어진 시간 안에 갈 수 있는 영역
+        
+        Args:
+            longitude: 출발지 경도
+            latitude: 출발지 위도
+            minutes: 이동 시간 목록 (분)
+            include_vertices: 도달 가능한 정점 좌표 포함 여부
+            
+        Returns:
+            GeoJSON FeatureCollection
+        """
+        if self.routing_executor is None:
+            return {"error": "로컬 경로 탐색 엔진이 준비되지 않았습니다"}
+        
+        return await self.routing_executor.run(
+            "isochrone", {"x": longitude, "y": latitude}, minutes, include_vertices=include_vertices
+        )
+    
+    async def _get_tashu_stations(self) -> List[Dict[str, Any]]:
+        """
+        경로 탐색 엔진에 넘길 운영 중인 타슈 대여소 목록
+        (자전거 수는 요청마다 바뀌므로 API 프로세스에서 조회해 작업 프로세스로 전달)
+        
+        자전거 수에는 스냅샷 이후 이 서버에서 처리한 대여/반납을 반영하고,
+        빈 거치대 수는 대여소 정보에 거치대 수(total_docks)가 있을 때만 계산합니다 (없으면 None).
+        """
+        snapshot = await load_station_snapshot(self.tashu_service)
+        if snapshot is None:
+            return []
+        manager = get_station_snapshot()
+        
+        stations = []
+        for station in snapshot.stations:
+            location = self.tashu_service.parse_station_to_location(station)
+            details = location["details"]
+            if not details["is_active"]:
+                continue
+            available_bikes = int(details["available_bikes"] or 0)
+            if manager is not None:
+                adjusted = manager.available_bikes(location["external_id"])
+                if adjusted is not None:
+                    available_bikes = adjusted
+            free_docks = None
+            if details["total_docks"] is not None:
+                free_docks = max(int(details["total_docks"]) - available_bikes, 0)
+            stations.append({
+                "id": location["external_id"],
+                "name": location["name"],
+                "latitude": location["latitude"],
+                "longitude": location["longitude"],
+                "available_bikes": available_bikes,
+                "free_docks": free_docks
+            })
+        return stations
+    
+    async def get_nearest_stations(self,
+                                   longitude: float,
+                                   latitude: float,
+                                   k: int = 5,
+                                   mode: str = "WALK",
+                                   max_distance_m: float = 2000,
+                                   include_geometry: bool = False) -> Dict[str, Any]:
+        """
+        대여 가능한 자전거가 있는 가장 가까운 타슈 대여소 - 직선 거리가 아닌 실제 이동 경로 기준
+        
+        Args:
+            longitude: 현재 위치 경도
+            latitude: 현재 위치 위도
+            k: 반환할 대여소 수
+            mode: 이동 수단 (WALK: 도보, BIKE: 자전거)
+            max_distance_m: 최대 이동 거리 (미터)
+            include_geometry: 결과에 경로 좌표열 포함 여부
+            
+        Returns:
+            이동 시간 순 대여소 목록
+        """
+        if self.routing_executor is None:
+            return {"error": "로컬 경로 탐색 엔진이 준비되지 않았습니다"}
+        
+        stations = await self._get_tashu_stations()
+        if not stations:
+            return {"error": "타슈 대여소 정보를 가져오지 못했습니다"}
+        
+        return await self.routing_executor.run(
+            "nearest_stations",
+            {"x": longitude, "y": latitude},
+            stations,
+            k=k,
+            mode=mode,
+            max_km=max_distance_m / 1000,
+            include_geometry=include_geometry
+        )
+    
+    async def get_return_stations(self,
+                                  destination_x: float,
+                                  destination_y: float,
+                                  position_x: Optional[float] = None,
+                                  position_y: Optional[float] = None,
+                                  rental_station_id: Optional[str] = None,
+                                  k: int = 5,
+                                  max_walk_m: float = 1000,
+                                  include_geometry: bool = False) -> Dict[str, Any]:
+        """
+        반납 대여소 추천 - 빈 거치대가 있는 목적지 근처 대여소를 (자전거 이동 + 도보 이동) 시간 순으로 조회
+        
+        Args:
+            destination_x: 목적지 경도
+            destination_y: 목적지 위도
+            position_x: 현재 위치 경도 (없으면 대여 대여소 위치 사용)
+            position_y: 현재 위치 위도 (없으면 대여 대여소 위치 사용)
+            rental_station_id: 대여한 대여소 ID
+            k: 반환할 대여소 수
+            max_walk_m: 반납 대여소에서 목적지까지 최대 도보 거리 (미터)
+            include_geometry: 결과에 구간별 경로 좌표열 포함 여부
+            
+        Returns:
+            총 소요 시간 순 반납 대여소 목록
+        """
+        if self.routing_executor is None:
+            return {"error": "로컬 경로 탐색 엔진이 준비되지 않았습니다"}
+        
+        stations = await self._get_tashu_stations()
+        if not stations:
+            return {"error": "타슈 대여소 정보를 가져오지 못했습니다"}
+        
+        if position_x is None or position_y is None:
+            rental_station = next((s for s in stations if s["id"] == str(rental_station_id)), None)
+            if rental_station is None:
+                return {"error": "현재 위치를 알 수 없습니다 (현재 위치 좌표를 지정해주세요)"}
+            position_x, position_y = rental_station["longitude"], rental_station["latitude"]
+        
+        return await self.routing_executor.run(
+            "return_stations",
+            {"x": position_x, "y": position_y},
+            {"x": destination_x, "y": destination_y},
+            stations,
+            k=k,
+            max_walk_km=max_walk_m / 1000,
+            include_geometry=include_geometry
+        )
+    
+    async def get_tashu_routes(self,
+                               origin_x: float,
+                               origin_y: float,
+                               destination_x: float,
+                               destination_y: float,
+                               max_walk_m: float = 1000,
+                               alternatives: int = 3) -> Dict[str, Any]:
+        """
+        타슈 복합 경로 - 도보로 대여소까지 이동, 자전거로 반납 대여소까지 이동, 도보로 목적지까지 이동
+        
+        Args:
+            origin_x: 출발지 경도
+            origin_y: 출발지 위도
+            destination_x: 목적지 경도
+            destination_y: 목적지 위도
+            max_walk_m: 대여소까지 걸어갈 수 있는 최대 거리 (미터)
+            alternatives: 반환할 경로 수
+            
+        Returns:
+            총 소요 시간 순 복합 경로 목록
+        """
+        if self.routing_executor is None:
+            return {"error": "로컬 경로 탐색 엔진이 준비되지 않았습니다"}
+        
+        stations = await self._get_tashu_stations()
+        if not stations:
+            return {"error": "타슈 대여소 정보를 가져오지 못했습니다"}
+        
+        return await self.routing_executor.run(
+            "tashu_routes",
+            {"x": origin_x, "y": origin_y},
+            {"x": destination_x, "y": destination_y},
+            stations,
+            max_walk_km=max_walk_m / 1000,
+            alternatives=alternatives
+        )
+    
     async def _get_bike_routes_near_path(self, 
                                        origin_x: float, 
                                        origin_y: float, 
@@ -241,14 +472,13 @@ class NavigationService:
         if waypoints:
             payload["waypoints"] = waypoints
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(url, headers=self.headers, json=payload)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                print(f"보행자 길찾기 API 오류: {e}")
-                return {"error": str(e)}
-            except Exception as e:
-                print(f"보행자 길찾기 API 호출 중 오류 발생: {e}")
-                return {"error": str(e)}
+        try:
+            response = await self.client.post(url, headers=self.headers, json=payload)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            print(f"보행자 길찾기 API 오류: {e}")
+            return {"error": str(e)}
+        except Exception as e:
+            print(f"보행자 길찾기 API 호출 중 오류 발생: {e}")
+            return {"error": str(e)}
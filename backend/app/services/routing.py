@@ -0,0 +1,680 @@
+import os
+import sys
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+# 경로 탐색 결과 코드 (카카오 모빌리티 길찾기 응답과 동일)
+RESULT_OK = 0
+RESULT_NO_ROUTE = 104
+
+# 자전거 주행 칼로리 추정 계수
+KCAL_PER_KM = 25.0
+KCAL_PER_CLIMB_M = 0.5
+
+# 1km당 오르막(m) 기준 난이도/지형 구분
+EASY_CLIMB_M_PER_KM = 5.0
+HARD_CLIMB_M_PER_KM = 15.0
+
+# 엔진(스냅샷 버전)별로 보관할 등시선 결과 수
+ISOCHRONE_CACHE_SIZE = 256
+
+# 자전거 대여/반납에 걸리는 시간 (분)
+DOCK_MINUTES = 1.0
+
+
+def import_find_route() -> None:
+    """
+    find-route 경로 탐색 모듈 경로를 sys.path에 추가합니다.
+    """
+    engine_path = os.path.abspath(settings.ROUTING_ENGINE_PATH)
+    if engine_path not in sys.path:
+        sys.path.insert(0, engine_path)
+
+
+class RoutingEngine:
+    """
+    로컬 경로 탐색 엔진 - find-route 스냅샷을 메모리 매핑으로 불러와 자전거 경로를 프로세스 안에서 계산
+    """
+
+    def __init__(self, snapshot_path: str):
+        import_find_route()
+        from route_metrics import BIKE_SPEED_KMH, PRIORITY_METRICS, WALK_SPEED_KMH
+        from snapshot import ROAD_CLASS, RoutingSnapshot
+
+        self.snapshot_path = snapshot_path
+        self.version = os.path.basename(os.path.normpath(snapshot_path))
+        self.snapshot = RoutingSnapshot.load(snapshot_path, mmap=True)
+        self.speed_kmh = BIKE_SPEED_KMH
+        self.walk_speed_kmh = WALK_SPEED_KMH
+        self.priority_metrics = PRIORITY_METRICS
+        self.road_class = self.snapshot.extras.get(ROAD_CLASS)
+        # 스냅샷 버전마다 엔진을 새로 만들므로 캐시도 버전별로 분리됨
+        self.isochrone_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        # 첫 요청이 느려지지 않도록 좌표 색인과 역방향 간선 배열을 시작 시 미리 생성
+        self.snapshot.spatial_index()
+        self.snapshot.reverse_arcs()
+
+    def _weights(self, priority: str) -> np.ndarray:
+        """
+        우선순위에 해당하는 메트릭 (스냅샷에 없으면 거리)
+        """
+        metric = self.priority_metrics.get(priority, "distance")
+        return self.snapshot.metrics.get(metric, self.snapshot.metrics["distance"])
+
+    def _snap(self, points: List[Dict[str, float]]) -> List[int]:
+        """
+        좌표 목록을 가장 가까운 정점 ID로 스냅합니다.
+        서로 도달할 수 없는 정점이 섞이면 모두 가장 큰 연결 요소 안으로 옮깁니다.
+        """
+        lat = np.array([p["y"] for p in points], dtype=np.float64)
+        lon = np.array([p["x"] for p in points], dtype=np.float64)
+        vertex_ids = [int(v) for v in self.snapshot.nearest_vertices(lat, lon)]
+
+        indices = [self.snapshot.index_of(v) for v in vertex_ids]
+        reachable = all(
+            self.snapshot.may_reach(indices[i], indices[i + 1]) for i in range(len(indices) - 1)
+        )
+        if not reachable:
+            vertex_ids = [self.snapshot.snap_to_largest_component(v) for v in vertex_ids]
+        return vertex_ids
+
+    def _section(self, route) -> Dict[str, Any]:
+        """
+        경로 하나를 카카오 길찾기 응답의 section 형식으로 변환합니다.
+        """
+        snapshot = self.snapshot
+        arcs = np.asarray(route.arcs, dtype=np.int64)
+        arc_distance = np.asarray(snapshot.metrics["distance"][arcs], dtype=np.float64)
+        distance_km = float(arc_distance.sum())
+
+        # 자전거 도로 비율 (거리 기준)
+        road_km = distance_km
+        if self.road_class is not None and len(arcs):
+            road_km = float(arc_distance[self.road_class[arcs] == 0].sum())
+
+        climb_m = 0.0
+        if "climb" in snapshot.metrics and len(arcs):
+            climb_m = float(np.sum(snapshot.metrics["climb"][arcs]))
+
+        vertexes: List[float] = []
+        for lat, lon in snapshot.route_geometry(route):
+            vertexes.extend((lon, lat))
+
+        distance_m = int(round(distance_km * 1000))
+        duration_s = int(round(distance_km / self.speed_kmh * 3600))
+        return {
+            "distance": distance_m,
+            "duration": duration_s,
+            "road_km": road_km,
+            "climb_m": climb_m,
+            "roads": [{
+                "name": "",
+                "distance": distance_m,
+                "duration": duration_s,
+                "vertexes": vertexes,
+            }],
+        }
+
+    def route(self,
+              origin: Dict[str, float],
+              destination: Dict[str, float],
+              waypoints: Optional[List[Dict[str, float]]] = None,
+              priority: str = "RECOMMEND",
+              optimize_waypoints: bool = False) -> Dict[str, Any]:
+        """
+        자전거 경로 탐색 (카카오 길찾기 응답 형식)
+
+        Args:
+            origin: 출발지 {"x": 경도, "y": 위도}
+            destination: 목적지 {"x": 경도, "y": 위도}
+            waypoints: 경유지 목록 [{"x": 경도, "y": 위도}, ...]
+            priority: 길안내 우선순위 (RECOMMEND, SAFETY, DISTANCE)
+            optimize_waypoints: True면 총 비용이 가장 작도록 경유지 방문 순서를 바꿈
+
+        Returns:
+            경로 정보 (순서를 바꾼 경우 summary.waypoint_order에 원래 경유지 번호 순서)
+        """
+        waypoints = list(waypoints or [])
+        points = [origin] + waypoints + [destination]
+        vertex_ids = self._snap(points)
+        weights = self._weights(priority)
+
+        summary = {
+            "origin": origin,
+            "destination": destination,
+            "waypoints": waypoints,
+            "priority": priority,
+            "distance": 0,
+            "duration": 0,
+        }
+        response = {"trans_id": uuid.uuid4().hex, "engine": "local", "snapshot_version": self.version}
+
+        if optimize_waypoints and len(waypoints) >= 2:
+            order, routes = self._optimized_routes(vertex_ids, weights)
+            if order is not None:
+                summary["waypoints"] = [waypoints[i - 1] for i in order[1:-1]]
+                summary["waypoint_order"] = [i - 1 for i in order[1:-1]]
+        else:
+            routes = []
+            for source_id, target_id in zip(vertex_ids, vertex_ids[1:]):
+                routes.append(self.snapshot.shortest_path(source_id, target_id, weights))
+                if routes[-1] is None:
+                    break
+
+        if not routes or any(route is None for route in routes):
+            response["routes"] = [{
+                "result_code": RESULT_NO_ROUTE,
+                "result_msg": "출발지와 도착지 사이에 자전거 경로가 없습니다",
+                "summary": summary,
+            }]
+            return response
+        sections = [self._section(route) for route in routes]
+
+        distance_km = sum(s["distance"] for s in sections) / 1000
+        road_km = sum(s.pop("road_km") for s in sections)
+        climb_m = sum(s.pop("climb_m") for s in sections)
+        summary["distance"] = sum(s["distance"] for s in sections)
+        summary["duration"] = sum(s["duration"] for s in sections)
+
+        # 자전거 도로 비율로 안전 점수 산출 (1-5 척도)
+        road_share = road_km / distance_km if distance_km > 0 else 1.0
+        climb_per_km = climb_m / distance_km if distance_km > 0 else 0.0
+        if climb_per_km < EASY_CLIMB_M_PER_KM:
+            difficulty, terrain = "EASY", "FLAT"
+        elif climb_per_km < HARD_CLIMB_M_PER_KM:
+            difficulty, terrain = "MEDIUM", "MIXED"
+        else:
+            difficulty, terrain = "HARD", "HILLY"
+
+        response["routes"] = [{
+            "result_code": RESULT_OK,
+            "result_msg": "길찾기 성공",
+            "summary": summary,
+            "sections": sections,
+            "bike_friendly": road_share >= 0.5,
+            "bike_safety_score": round(1.0 + 4.0 * road_share, 1),
+        }]
+        response["bike_specific"] = {
+            "bike_road_ratio": round(road_share, 3),
+            "total_climb": round(climb_m, 1),  # 미터 단위
+            "difficulty_level": difficulty,
+            "estimated_calories": int(round(distance_km * KCAL_PER_KM + climb_m * KCAL_PER_CLIMB_M)),
+            "terrain_type": terrain,
+        }
+        return response
+
+    def _optimized_routes(self, vertex_ids: List[int], weights: np.ndarray) -> Tuple[Optional[List[int]], List[Any]]:
+        """
+        출발지 + 경유지 + 도착지 간 비용표로 경유지 방문 순서를 정하고, 구간 경로를 이어 붙입니다.
+
+        지점마다 다른 모든 지점이 확정되면 멈추는 일대다 탐색을 한 번씩(지점 수만큼) 해 비용표를 만들고,
+        그 탐색 트리를 보관해 두었다가 정해진 순서의 구간 경로를 다시 탐색하지 않고 복원합니다.
+
+        Returns:
+            (방문 순서 (지점 번호, 경로가 없으면 None), 구간별 경로 목록)
+        """
+        from tour import path_cost, solve_path_order
+
+        snapshot = self.snapshot
+        vertices = [snapshot.index_of(v) for v in vertex_ids]
+        targets = sorted(set(vertices))
+        trees = {v: snapshot.search(v, weights, targets=targets) for v in targets}
+
+        cost = np.array([[trees[a][0][b] for b in vertices] for a in vertices])
+        order = solve_path_order(cost)
+        # 모든 지점을 정확히 한 번씩 방문하는 순서가 아니면(갈 수 없는 경유지) 경로 없음으로 처리
+        if order is None or len(order) != len(vertices) or sorted(order) != list(range(len(vertices))):
+            return None, []
+        if not np.isfinite(path_cost(cost, order)):
+            return None, []
+
+        routes = []
+        for a, b in zip(order, order[1:]):
+            dist, parent = trees[vertices[a]]
+            routes.append(snapshot.route_from_tree(vertices[a], vertices[b], dist, parent))
+        return order, routes
+
+    def route_batch(self,
+                    pairs: List[Dict[str, Dict[str, float]]],
+                    priority: str = "RECOMMEND",
+                    include_geometry: bool = False) -> Dict[str, Any]:
+        """
+        여러 출발지/목적지 쌍의 자전거 경로를 한 번에 탐색합니다.
+        모든 좌표를 한 번에 스냅하고, 같은 출발 정점을 가진 쌍들은 일대다 탐색 한 번으로 처리합니다.
+
+        Args:
+            pairs: [{"origin": {"x", "y"}, "destination": {"x", "y"}}, ...]
+            priority: 길안내 우선순위 (RECOMMEND, SAFETY, DISTANCE)
+            include_geometry: 결과에 경로 좌표열(vertexes) 포함 여부
+
+        Returns:
+            쌍 순서대로의 요약 결과 목록
+        """
+        snapshot = self.snapshot
+        lat = np.array([p["origin"]["y"] for p in pairs] + [p["destination"]["y"] for p in pairs])
+        lon = np.array([p["origin"]["x"] for p in pairs] + [p["destination"]["x"] for p in pairs])
+        nearest, _ = snapshot.spatial_index().nearest_vertices(lat, lon)
+        sources = nearest[:len(pairs), 0].tolist()
+        targets = nearest[len(pairs):, 0].tolist()
+
+        # 서로 도달할 수 없는 쌍은 가장 큰 연결 요소 안으로 옮김
+        for i, (source, target) in enumerate(zip(sources, targets)):
+            if not snapshot.may_reach(source, target):
+                sources[i] = snapshot.index_of(snapshot.snap_to_largest_component(int(snapshot.vertex_ids[source])))
+                targets[i] = snapshot.index_of(snapshot.snap_to_largest_component(int(snapshot.vertex_ids[target])))
+
+        groups: Dict[int, List[int]] = {}
+        for i, source in enumerate(sources):
+            groups.setdefault(source, []).append(i)
+
+        weights = self._weights(priority)
+        distance = snapshot.metrics["distance"]
+        results: List[Dict[str, Any]] = [{} for _ in pairs]
+        for source, members in groups.items():
+            dist, parent_arc = snapshot.search(source, weights, targets=[targets[i] for i in members])
+            for i in members:
+                route = snapshot.route_from_tree(source, targets[i], dist, parent_arc)
+                if route is None:
+                    results[i] = {"index": i, "result_code": RESULT_NO_ROUTE}
+                    continue
+                distance_km = float(np.sum(distance[route.arcs])) if route.arcs else 0.0
+                result = {
+                    "index": i,
+                    "result_code": RESULT_OK,
+                    "distance": int(round(distance_km * 1000)),
+                    "duration": int(round(distance_km / self.speed_kmh * 3600)),
+                }
+                if include_geometry:
+                    result["vertexes"] = [c for lat, lon in snapshot.route_geometry(route) for c in (lon, lat)]
+                results[i] = result
+
+        return {
+            "engine": "local",
+            "snapshot_version": self.version,
+            "priority": priority,
+            "results": results,
+        }
+
+    def isochrone(self,
+                  origin: Dict[str, float],
+                  minutes: List[int],
+                  include_vertices: bool = False) -> Dict[str, Any]:
+        """
+        출발지에서 자전거로 주어진 시간 안에 갈 수 있는 영역 (GeoJSON FeatureCollection)
+        출발지를 정점으로 스냅한 결과를 키로 캐시하므로 가까운 좌표의 요청은 같은 결과를 공유합니다.
+
+        Args:
+            origin: 출발지 {"x": 경도, "y": 위도}
+            minutes: 이동 시간 목록 (분)
+            include_vertices: 도달 가능한 정점 좌표 포함 여부
+
+        Returns:
+            시간별 볼록 다각형 Feature 목록
+        """
+        snapshot = self.snapshot
+        nearest, _ = snapshot.spatial_index().nearest_vertices([origin["y"]], [origin["x"]])
+        source = int(nearest[0, 0])
+        minutes = sorted(set(minutes))
+
+        key = (source, tuple(minutes), include_vertices)
+        cached = self.isochrone_cache.get(key)
+        if cached is not None:
+            self.isochrone_cache.move_to_end(key)
+            return cached
+
+        from isochrone import compute_isochrones
+
+        # 이동 시간(분)을 거리(km) 상한으로 바꿔 한 번의 탐색으로 계산
+        cutoffs = [m / 60 * self.speed_kmh for m in minutes]
+        isochrones = compute_isochrones(snapshot, source, cutoffs, include_vertices=include_vertices)
+
+        features = []
+        for m, isochrone in zip(minutes, isochrones):
+            properties = {"minutes": m, "distance_km": round(isochrone["cutoff"], 3),
+                          "vertex_count": isochrone["vertex_count"]}
+            if include_vertices:
+                properties["vertices"] = isochrone["vertices"]
+            features.append({
+                "type": "Feature",
+                "geometry": {"type": "Polygon", "coordinates": [isochrone["polygon"]]},
+                "properties": properties,
+            })
+        result = {
+            "type": "FeatureCollection",
+            "features": features,
+            "origin": {"x": float(snapshot.lon[source]), "y": float(snapshot.lat[source])},
+            "engine": "local",
+            "snapshot_version": self.version,
+        }
+
+        self.isochrone_cache[key] = result
+        if len(self.isochrone_cache) > ISOCHRONE_CACHE_SIZE:
+            self.isochrone_cache.popitem(last=False)
+        return result
+
+    def _ride_km(self, pickup_vertices: np.ndarray, dropoff_vertices: np.ndarray) -> np.ndarray:
+        """
+        대여 대여소 -> 반납 대여소 자전거 거리 행렬 (스냅샷에 거리표가 없을 때 사용)
+        대여 대여소 정점마다 반납 대여소 정점들에 모두 도달하면 멈추는 탐색을 한 번씩 합니다.
+        """
+        distance = self.snapshot.metrics["distance"]
+        targets = np.unique(dropoff_vertices).tolist()
+        ride_km = np.full((len(pickup_vertices), len(dropoff_vertices)), np.inf)
+        for source in np.unique(pickup_vertices).tolist():
+            dist, _ = self.snapshot.search(source, distance, targets=targets)
+            ride_km[pickup_vertices == source] = dist[dropoff_vertices]
+        return ride_km
+
+    def _vertexes(self, route) -> List[float]:
+        return [c for lat, lon in self.snapshot.route_geometry(route) for c in (lon, lat)]
+
+    def _leg(self, mode: str, route, speed_kmh: float) -> Dict[str, Any]:
+        distance = self.snapshot.metrics["distance"]
+        distance_km = float(np.sum(distance[route.arcs])) if route.arcs else 0.0
+        return {
+            "mode": mode,
+            "distance": int(round(distance_km * 1000)),
+            "duration": int(round(distance_km / speed_kmh * 3600)),
+            "vertexes": self._vertexes(route),
+        }
+
+    def nearest_stations(self,
+                         origin: Dict[str, float],
+                         stations: List[Dict[str, Any]],
+                         k: int = 5,
+                         mode: str = "WALK",
+                         max_km: float = 2.0,
+                         include_geometry: bool = False) -> Dict[str, Any]:
+        """
+        대여 가능한 자전거가 있는 대여소를 실제 이동 거리 순으로 k개 찾습니다.
+
+        경로 거리는 직선 거리보다 짧을 수 없으므로 직선 거리가 max_km 안인 대여소만 후보로 남기고,
+        후보를 좌표 색인으로 한 번에 정점에 스냅한 뒤 출발 정점에서 일대다 탐색을 한 번만 합니다
+        (후보 정점이 모두 확정되거나 max_km를 넘으면 멈춤).
+
+        Args:
+            origin: 현재 위치 {"x": 경도, "y": 위도}
+            stations: 대여소 목록 [{"id", "name", "latitude", "longitude", "available_bikes"}, ...]
+            k: 반환할 대여소 수
+            mode: 이동 수단 (WALK: 도보, BIKE: 자전거) - 소요 시간 계산에 사용
+            max_km: 최대 이동 거리 (km)
+            include_geometry: 결과에 경로 좌표열 포함 여부
+
+        Returns:
+            이동 시간 순 대여소 목록
+        """
+        from snapshot import haversine_km
+
+        snapshot = self.snapshot
+        speed_kmh = self.walk_speed_kmh if mode == "WALK" else self.speed_kmh
+        response = {"items": [], "total": 0, "mode": mode, "engine": "local", "snapshot_version": self.version}
+
+        available = [s for s in stations if int(s.get("available_bikes") or 0) > 0]
+        if available:
+            lat = np.array([s["latitude"] for s in available], dtype=np.float64)
+            lon = np.array([s["longitude"] for s in available], dtype=np.float64)
+            straight_km = haversine_km(origin["y"], origin["x"], lat, lon)
+            candidates = np.flatnonzero(straight_km <= max_km)
+        else:
+            candidates = np.empty(0, dtype=np.int64)
+        if len(candidates) == 0:
+            response.update({"result_code": RESULT_NO_ROUTE,
+                             "result_msg": f"{max_km}km 안에 대여 가능한 대여소가 없습니다"})
+            return response
+
+        spatial = snapshot.spatial_index()
+        nearest, _ = spatial.nearest_vertices(np.concatenate([[origin["y"]], lat[candidates]]),
+                                              np.concatenate([[origin["x"]], lon[candidates]]))
+        source = int(nearest[0, 0])
+        station_vertex = nearest[1:, 0]
+
+        distance = snapshot.metrics["distance"]
+        dist, parent = snapshot.search(source, distance, targets=np.unique(station_vertex).tolist(),
+                                       cutoff=max_km)
+        network_km = dist[station_vertex]
+        order = [i for i in np.argsort(network_km, kind="stable")[:k].tolist() if np.isfinite(network_km[i])]
+
+        items = []
+        for i in order:
+            station = available[int(candidates[i])]
+            item = {
+                "id": str(station["id"]),
+                "name": station.get("name", ""),
+                "available_bikes": int(station.get("available_bikes") or 0),
+                "coordinates": {"latitude": station["latitude"], "longitude": station["longitude"]},
+                "distance": int(round(float(network_km[i]) * 1000)),
+                "straight_distance": int(round(float(straight_km[candidates[i]]) * 1000)),
+                "duration": int(round(float(network_km[i]) / speed_kmh * 3600)),
+            }
+            if include_geometry:
+                route = snapshot.route_from_tree(source, int(station_vertex[i]), dist, parent)
+                item["vertexes"] = self._vertexes(route)
+            items.append(item)
+
+        if not items:
+            response.update({"result_code": RESULT_NO_ROUTE,
+                             "result_msg": f"{max_km}km 안에 경로로 갈 수 있는 대여소가 없습니다"})
+            return response
+
+        response.update({"result_code": RESULT_OK, "items": items, "total": len(items)})
+        return response
+
+    def return_stations(self,
+                        position: Dict[str, float],
+                        destination: Dict[str, float],
+                        stations: List[Dict[str, Any]],
+                        k: int = 5,
+                        max_walk_km: float = 1.0,
+                        include_geometry: bool = False) -> Dict[str, Any]:
+        """
+        반납 대여소 추천 - 목적지 근처 대여소를 (자전거 이동 + 반납 + 도보 이동) 시간 순으로 찾습니다.
+        빈 거치대 수를 아는 대여소는 빈 거치대가 있을 때만 후보로 삼습니다.
+
+        목적지로 도보 다대일 탐색을 한 번 해 후보 대여소에서 목적지까지의 도보 거리를 구하고,
+        현재 위치에서 후보 대여소까지 자전거 일대다 탐색을 한 번 해 자전거 거리를 구합니다.
+
+        Args:
+            position: 현재 위치 {"x": 경도, "y": 위도}
+            destination: 목적지 {"x": 경도, "y": 위도}
+            stations: 대여소 목록 [{"id", "name", "latitude", "longitude", "free_docks"}, ...]
+                (free_docks가 None이면 빈 거치대 수를 모르는 대여소로 보고 후보에서 빼지 않음)
+            k: 반환할 대여소 수
+            max_walk_km: 반납 대여소에서 목적지까지 최대 도보 거리 (km)
+            include_geometry: 결과에 구간별 경로 좌표열 포함 여부
+
+        Returns:
+            총 소요 시간 순 반납 대여소 목록
+        """
+        from snapshot import haversine_km
+
+        snapshot = self.snapshot
+        response = {"items": [], "total": 0, "engine": "local", "snapshot_version": self.version}
+
+        # 도보 거리는 직선 거리보다 짧을 수 없으므로 직선 거리가 max_walk_km 안인 대여소만 후보
+        docks = [s for s in stations if s.get("free_docks") is None or int(s["free_docks"]) > 0]
+        lat = np.array([s["latitude"] for s in docks], dtype=np.float64)
+        lon = np.array([s["longitude"] for s in docks], dtype=np.float64)
+        candidates = np.flatnonzero(haversine_km(destination["y"], destination["x"], lat, lon) <= max_walk_km)
+        if len(candidates) == 0:
+            response.update({"result_code": RESULT_NO_ROUTE,
+                             "result_msg": f"목적지 {max_walk_km}km 안에 반납 가능한 대여소가 없습니다"})
+            return response
+
+        nearest, _ = snapshot.spatial_index().nearest_vertices(
+            np.concatenate([[position["y"], destination["y"]], lat[candidates]]),
+            np.concatenate([[position["x"], destination["x"]], lon[candidates]])
+        )
+        source, target = int(nearest[0, 0]), int(nearest[1, 0])
+        station_vertex = nearest[2:, 0]
+
+        distance = snapshot.metrics["distance"]
+        walk_dist, walk_parent = snapshot.search(target, distance, cutoff=max_walk_km, reverse=True)
+        walk_km = walk_dist[station_vertex]
+        reachable = np.isfinite(walk_km)
+        if not reachable.any():
+            response.update({"result_code": RESULT_NO_ROUTE,
+                             "result_msg": f"목적지 {max_walk_km}km 안에 걸어갈 수 있는 반납 대여소가 없습니다"})
+            return response
+
+        ride_dist, ride_parent = snapshot.search(source, distance,
+                                                 targets=np.unique(station_vertex[reachable]).tolist())
+        ride_km = ride_dist[station_vertex]
+
+        # 총 소요 시간(초) = 자전거 + 반납 + 도보
+        duration = (ride_km / self.speed_kmh + walk_km / self.walk_speed_kmh) * 3600 + DOCK_MINUTES * 60
+        order = [i for i in np.argsort(duration, kind="stable")[:k].tolist() if np.isfinite(duration[i])]
+
+        items = []
+        for i in order:
+            station = docks[int(candidates[i])]
+            item = {
+                "id": str(station["id"]),
+                "name": station.get("name", ""),
+                "free_docks": station.get("free_docks"),
+                "coordinates": {"latitude": station["latitude"], "longitude": station["longitude"]},
+                "ride_distance": int(round(float(ride_km[i]) * 1000)),
+                "walk_distance": int(round(float(walk_km[i]) * 1000)),
+                "duration": int(round(float(duration[i]))),
+            }
+            if include_geometry:
+                vertex = int(station_vertex[i])
+                item["legs"] = [
+                    self._leg("BIKE", snapshot.route_from_tree(source, vertex, ride_dist, ride_parent),
+                              self.speed_kmh),
+                    self._leg("WALK", snapshot.route_from_tree(target, vertex, walk_dist, walk_parent,
+                                                               reverse=True), self.walk_speed_kmh),
+                ]
+            items.append(item)
+
+        if not items:
+            response.update({"result_code": RESULT_NO_ROUTE,
+                             "result_msg": "현재 위치에서 자전거로 갈 수 있는 반납 대여소가 없습니다"})
+            return response
+
+        response.update({"result_code": RESULT_OK, "items": items, "total": len(items)})
+        return response
+
+    def tashu_routes(self,
+                     origin: Dict[str, float],
+                     destination: Dict[str, float],
+                     stations: List[Dict[str, Any]],
+                     max_walk_km: float = 1.0,
+                     alternatives: int = 3) -> Dict[str, Any]:
+        """
+        도보 -> 타슈 자전거 -> 도보 복합 경로 탐색
+
+        출발지에서 도보 일대다 탐색, 목적지로 도보 다대일 탐색을 한 번씩 해 걸어갈 수 있는
+        대여소까지의 거리를 구하고, 대여소 간 자전거 거리표(스냅샷에 없으면 대여 후보 대여소에서만 탐색)와 더해
+        (대여 대여소 x 반납 대여소) 총 소요 시간 행렬에서 가장 빠른 조합을 고릅니다.
+
+        Args:
+            origin: 출발지 {"x": 경도, "y": 위도}
+            destination: 목적지 {"x": 경도, "y": 위도}
+            stations: 대여소 목록 [{"id", "name", "latitude", "longitude", "available_bikes"}, ...]
+            max_walk_km: 대여소까지 걸어갈 수 있는 최대 거리 (km)
+            alternatives: 반환할 경로 수
+
+        Returns:
+            총 소요 시간 순 복합 경로 목록
+        """
+        from stations import StationTable, best_combinations
+
+        snapshot = self.snapshot
+        response = {"routes": [], "total": 0, "engine": "local", "snapshot_version": self.version}
+        if not stations:
+            response.update({"result_code": RESULT_NO_ROUTE, "result_msg": "대여소 정보가 없습니다"})
+            return response
+
+        nearest, _ = snapshot.spatial_index().nearest_vertices([origin["y"], destination["y"]],
+                                                               [origin["x"], destination["x"]])
+        source, target = int(nearest[0, 0]), int(nearest[1, 0])
+        distance = snapshot.metrics["distance"]
+        walk_from_origin, origin_parent = snapshot.search(source, distance, cutoff=max_walk_km)
+        walk_to_destination, destination_parent = snapshot.search(target, distance, cutoff=max_walk_km,
+                                                                  reverse=True)
+
+        # 스냅샷에 저장된 대여소 거리표가 요청 대여소를 모두 포함하면 그대로 사용
+        table = StationTable.from_snapshot(snapshot)
+        rows = table.rows([s["id"] for s in stations]) if table is not None else None
+        if rows is not None and (rows >= 0).all():
+            station_vertex = np.asarray(table.vertices)[rows]
+        else:
+            table = None
+            nearest, _ = snapshot.spatial_index().nearest_vertices(
+                np.array([s["latitude"] for s in stations]), np.array([s["longitude"] for s in stations])
+            )
+            station_vertex = nearest[:, 0]
+        walk_origin_km = walk_from_origin[station_vertex]
+        walk_destination_km = walk_to_destination[station_vertex]
+        has_bikes = np.array([int(s.get("available_bikes") or 0) > 0 for s in stations])
+
+        pickup = np.flatnonzero(has_bikes & np.isfinite(walk_origin_km))
+        dropoff = np.flatnonzero(np.isfinite(walk_destination_km))
+
+        # 총 소요 시간(분) = 도보 + 대여 + 자전거 + 반납 + 도보
+        first = walk_origin_km[pickup] / self.walk_speed_kmh * 60 + DOCK_MINUTES
+        if len(pickup) == 0 or len(dropoff) == 0:
+            ride_km = np.empty((len(pickup), len(dropoff)))
+        elif table is not None:
+            ride_km = np.asarray(table.bike_km)[rows[pickup]][:, rows[dropoff]].astype(np.float64)
+        else:
+            ride_km = self._ride_km(station_vertex[pickup], station_vertex[dropoff])
+        middle = ride_km / self.speed_kmh * 60
+        middle[np.equal.outer(pickup, dropoff)] = np.inf  # 같은 대여소 반납 제외
+        last = walk_destination_km[dropoff] / self.walk_speed_kmh * 60 + DOCK_MINUTES
+        combinations = best_combinations(first, middle, last, k=alternatives)
+
+        if not combinations:
+            response.update({
+                "result_code": RESULT_NO_ROUTE,
+                "result_msg": f"{max_walk_km}km 안에 이용할 수 있는 대여소 조합이 없습니다",
+            })
+            return response
+
+        # 자전거 구간 경로: 같은 대여 대여소에서 출발하는 조합은 탐색 한 번으로 복원
+        ride_targets: Dict[int, List[int]] = {}
+        for i, j, _ in combinations:
+            ride_targets.setdefault(int(station_vertex[pickup[i]]), []).append(int(station_vertex[dropoff[j]]))
+        ride_trees = {
+            pick_vertex: snapshot.search(pick_vertex, distance, targets=drop_vertices)
+            for pick_vertex, drop_vertices in ride_targets.items()
+        }
+
+        routes = []
+        for i, j, total_minutes in combinations:
+            pick, drop = int(pickup[i]), int(dropoff[j])
+            walk_to_station = snapshot.route_from_tree(source, int(station_vertex[pick]),
+                                                       walk_from_origin, origin_parent)
+            ride_dist, ride_parent = ride_trees[int(station_vertex[pick])]
+            ride = snapshot.route_from_tree(int(station_vertex[pick]), int(station_vertex[drop]),
+                                            ride_dist, ride_parent)
+            walk_from_station = snapshot.route_from_tree(target, int(station_vertex[drop]),
+                                                         walk_to_destination, destination_parent, reverse=True)
+            legs = [
+                self._leg("WALK", walk_to_station, self.walk_speed_kmh),
+                self._leg("BIKE", ride, self.speed_kmh),
+                self._leg("WALK", walk_from_station, self.walk_speed_kmh),
+            ]
+            routes.append({
+                "distance": sum(leg["distance"] for leg in legs),
+                "duration": int(round(total_minutes * 60)),
+                "stations": [
+                    {
+                        "id": str(stations[k]["id"]),
+                        "name": stations[k].get("name", ""),
+                        "available_bikes": int(stations[k].get("available_bikes") or 0),
+                        "coordinates": {"latitude": stations[k]["latitude"],
+                                        "longitude": stations[k]["longitude"]},
+                    }
+                    for k in (pick, drop)
+                ],
+                "legs": legs,
+            })
+
+        response.update({"result_code": RESULT_OK, "routes": routes, "total": len(routes)})
+        return response
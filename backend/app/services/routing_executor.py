@@ -0,0 +1,204 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, List, Optional
+
+from app.core.config import settings
+from app.services.routing import RoutingEngine, import_find_route
+
+
+class RoutingBusyError(Exception):
+    """경로 탐색 대기열이 가득 찬 경우"""
+
+
+class RoutingTimeoutError(Exception):
+    """경로 탐색이 제한 시간 안에 끝나지 않은 경우"""
+
+
+# 작업 프로세스별 스냅샷 관리자 (프로세스 초기화 시 한 번만 생성)
+_worker_manager = None
+
+
+def _init_worker(snapshot_path: str, refresh_seconds: float) -> None:
+    """
+    작업 프로세스 초기화 - 현재 버전의 스냅샷을 메모리 매핑으로 불러오고,
+    새 버전이 게시되면 질의를 멈추지 않고 교체하도록 갱신 스레드를 시작합니다.
+    같은 스냅샷 파일을 매핑한 프로세스들은 운영체제 페이지 캐시를 공유합니다.
+    """
+    global _worker_manager
+    import_find_route()
+    from store import SnapshotManager
+
+    _worker_manager = SnapshotManager(snapshot_path, loader=RoutingEngine)
+    if refresh_seconds > 0:
+        _worker_manager.start_refresher(refresh_seconds)
+
+
+def _ping() -> Optional[str]:
+    return _worker_manager.version
+
+
+def _call_engine(method: str, args: tuple, kwargs: dict, deadline: Optional[float] = None) -> Any:
+    """
+    작업 프로세스에서 현재 버전의 경로 탐색 엔진 메서드를 실행합니다.
+    deadline(time.time() 기준)을 넘기면 탐색을 멈추고 RoutingTimeoutError를 발생시켜 작업 프로세스를 비웁니다.
+    """
+    from snapshot import SearchTimeout, search_deadline
+
+    if deadline is not None and time.time() > deadline:
+        # 대기열에서 기다리는 동안 이미 제한 시간이 지난 요청
+        raise RoutingTimeoutError("경로 탐색 대기 중 제한 시간을 넘겼습니다")
+    try:
+        with search_deadline(deadline), _worker_manager.acquire() as engine:
+            return getattr(engine, method)(*args, **kwargs)
+    except SearchTimeout as e:
+        # 메인 프로세스에서 find-route 모듈 없이 받을 수 있도록 실행기 예외로 바꿔 전달
+        raise RoutingTimeoutError(str(e))
+
+
+class RoutingExecutor:
+    """
+    경로 탐색 실행기 - CPU를 많이 쓰는 경로 탐색을 작업 프로세스 풀에서 실행
+
+    비동기 엔드포인트는 결과를 기다리는 동안 이벤트 루프를 막지 않으므로,
+    경로 탐색 부하가 다른 엔드포인트의 응답 시간에 영향을 주지 않습니다.
+    처리 중인 요청 수가 max_pending에 이르면 즉시 RoutingBusyError를 발생시키고,
+    timeout 안에 끝나지 않은 요청은 RoutingTimeoutError를 발생시킵니다.
+    아직 대기열에 있던 작업은 취소되고, 이미 실행 중인 작업은 탐색 루프가 같은 제한 시각을 확인해 멈추므로
+    작업 프로세스와 대기열 자리를 곧바로 돌려받습니다.
+    """
+
+    def __init__(self, snapshot_path: str, workers: int, max_pending: int, timeout: float,
+                 refresh_seconds: float = 0):
+        self.snapshot_path = snapshot_path
+        self.refresh_seconds = refresh_seconds
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.pending = 0
+        self._pool = self._create_pool()
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        # 이벤트 루프와 스레드를 가진 프로세스를 fork하지 않도록 spawn 사용
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.snapshot_path, self.refresh_seconds)
+        )
+
+    async def start(self) -> List[Optional[str]]:
+        """
+        모든 작업 프로세스를 띄우고 스냅샷 로드가 끝날 때까지 기다립니다.
+
+        Returns:
+            작업 프로세스들이 불러온 스냅샷 버전
+        """
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _ping) for _ in range(self.workers)
+        ))
+
+    async def run(self, method: str, *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """
+        경로 탐색 엔진 메서드를 작업 프로세스에서 실행하고 결과를 기다립니다.
+
+        Args:
+            method: RoutingEngine 메서드 이름
+            *args, **kwargs: 메서드 인자
+            timeout: 제한 시간 (초, 기본값: 실행기 설정)
+
+        Returns:
+            메서드 반환값
+        """
+        if self.pending >= self.max_pending:
+            raise RoutingBusyError(f"경로 탐색 대기 요청이 너무 많습니다 ({self.pending}건)")
+
+        loop = asyncio.get_running_loop()
+        timeout = timeout or self.timeout
+        # 대기 시간을 포함한 제한 시각 (작업 프로세스와 함께 쓰므로 time.time() 기준)
+        deadline = time.time() + timeout
+        pool = self._pool
+        try:
+            future = pool.submit(_call_engine, method, args, kwargs, deadline)
+        except BrokenProcessPool:
+            # 작업 프로세스가 비정상 종료된 경우 풀을 다시 만듦
+            self._replace_broken_pool(pool)
+            pool = self._pool
+            future = pool.submit(_call_engine, method, args, kwargs, deadline)
+
+        # 대기열 자리는 작업이 실제로 끝나거나 취소될 때 반환
+        self.pending += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+
+        try:
+            # 제한 시간 초과나 요청 취소 시 대기열에 있는 작업은 취소되고, 이미 실행 중인 작업은
+            # 탐색 루프가 deadline을 넘기는 즉시 멈춤 (대기열 자리는 작업이 실제로 끝날 때 반환)
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            raise RoutingTimeoutError(f"경로 탐색이 {timeout}초 안에 끝나지 않았습니다")
+        except BrokenProcessPool:
+            self._replace_broken_pool(pool)
+            raise
+
+    def _replace_broken_pool(self, pool: ProcessPoolExecutor) -> None:
+        # 같은 풀에서 실패한 여러 요청이 동시에 풀을 다시 만들지 않도록 현재 풀이 실패한 풀일 때만 교체
+        if self._pool is pool:
+            pool.shutdown(wait=False)
+            self._pool = self._create_pool()
+
+    def _release(self) -> None:
+        self.pending -= 1
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# 애플리케이션 시작 시 만든 경로 탐색 실행기 (없으면 외부 API 사용)
+_routing_executor: Optional[RoutingExecutor] = None
+
+
+async def start_routing_executor() -> Optional[RoutingExecutor]:
+    """
+    설정에 따라 로컬 경로 탐색 실행기를 시작합니다.
+
+    ROUTING_MODE가 "remote"면 시작하지 않고, "auto"면 스냅샷을 불러올 수 있을 때만 사용하며,
+    "local"이면 스냅샷을 불러오지 못할 때 예외를 발생시킵니다.
+    """
+    global _routing_executor
+    if settings.ROUTING_MODE == "remote":
+        return None
+
+    executor = RoutingExecutor(
+        settings.ROUTING_SNAPSHOT_PATH,
+        workers=settings.ROUTING_WORKERS,
+        max_pending=settings.ROUTING_MAX_PENDING,
+        timeout=settings.ROUTING_TIMEOUT_SECONDS,
+        refresh_seconds=settings.ROUTING_REFRESH_SECONDS
+    )
+    try:
+        versions = await executor.start()
+        print(f"로컬 경로 탐색 실행기 시작: {settings.ROUTING_SNAPSHOT_PATH} "
+              f"(버전 {versions[0]}, 작업 프로세스 {settings.ROUTING_WORKERS}개)")
+    except Exception as e:
+        executor.shutdown()
+        if settings.ROUTING_MODE == "local":
+            raise
+        print(f"로컬 경로 탐색 엔진을 불러오지 못해 외부 API를 사용합니다: {e}")
+        return None
+
+    _routing_executor = executor
+    return executor
+
+
+def stop_routing_executor() -> None:
+    global _routing_executor
+    if _routing_executor is not None:
+        _routing_executor.shutdown()
+        _routing_executor = None
+
+
+def get_routing_executor() -> Optional[RoutingExecutor]:
+    return _routing_executor
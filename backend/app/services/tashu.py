@@ -1,6 +1,9 @@
+import asyncio
 import httpx
 from typing import Dict, Any, List, Optional
+from app.core.cache import get_cache
 from app.core.config import settings
+from app.core.http import TASHU, http_clients
 import json
 
 class TashuService:
@@ -11,6 +14,13 @@ class TashuService:
     
     def __init__(self):
         self.api_key = settings.TASHU_API_KEY
+        self.availability_cache = get_cache("tashu_availability", settings.TASHU_AVAILABILITY_CACHE_TTL_SECONDS,
+                                            settings.TASHU_AVAILABILITY_CACHE_MAX_ENTRIES)
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 연결 풀을 사용하는 HTTP 클라이언트"""
+        return http_clients.get(TASHU)
     
     async def get_stations(self, latitude: Optional[float] = None, 
                           longitude: Optional[float] = None, 
@@ -39,19 +49,18 @@ class TashuService:
                 "radius": radius
             })
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()["data"]
-            except httpx.HTTPStatusError as e:
-                # API 오류 처리
-                print(f"타슈 API 오류: {e}")
-                return []
-            except Exception as e:
-                # 기타 오류 처리
-                print(f"타슈 API 호출 중 오류 발생: {e}")
-                return []
+        try:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()["data"]
+        except httpx.HTTPStatusError as e:
+            # API 오류 처리
+            print(f"타슈 API 오류: {e}")
+            return []
+        except Exception as e:
+            # 기타 오류 처리
+            print(f"타슈 API 호출 중 오류 발생: {e}")
+            return []
     
     async def get_station_detail(self, station_id: str) -> Dict[str, Any]:
         """
@@ -68,19 +77,18 @@ class TashuService:
             "apiKey": self.api_key
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()["data"]
-            except httpx.HTTPStatusError as e:
-                # API 오류 처리
-                print(f"타슈 API 오류: {e}")
-                return {}
-            except Exception as e:
-                # 기타 오류 처리
-                print(f"타슈 API 호출 중 오류 발생: {e}")
-                return {}
+        try:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()["data"]
+        except httpx.HTTPStatusError as e:
+            # API 오류 처리
+            print(f"타슈 API 오류: {e}")
+            return {}
+        except Exception as e:
+            # 기타 오류 처리
+            print(f"타슈 API 호출 중 오류 발생: {e}")
+            return {}
     
     async def get_available_bikes(self, station_id: str) -> Dict[str, Any]:
         """
@@ -97,19 +105,56 @@ class TashuService:
             "apiKey": self.api_key
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()["data"]
-            except httpx.HTTPStatusError as e:
-                # API 오류 처리
-                print(f"타슈 API 오류: {e}")
-                return {}
-            except Exception as e:
-                # 기타 오류 처리
-                print(f"타슈 API 호출 중 오류 발생: {e}")
-                return {}
+        try:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()["data"]
+        except httpx.HTTPStatusError as e:
+            # API 오류 처리
+            print(f"타슈 API 오류: {e}")
+            return {}
+        except Exception as e:
+            # 기타 오류 처리
+            print(f"타슈 API 호출 중 오류 발생: {e}")
+            return {}
+    
+    async def get_availability_batch(self, station_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 대여소의 자전거 정보를 동시에 조회
+        
+        대여소별 조회는 TASHU_AVAILABILITY_CONCURRENCY개까지 동시에 실행하고, 각 조회는
+        TASHU_AVAILABILITY_TIMEOUT_SECONDS 안에 끝나지 않으면 실패로 처리합니다.
+        일부 조회가 실패해도 나머지 결과는 반환합니다. 성공한 결과는 짧게 캐시합니다.
+        
+        Args:
+            station_ids: 대여소 ID 목록
+            
+        Returns:
+            대여소 ID별 자전거 정보 (실패한 대여소는 error 포함)
+        """
+        semaphore = asyncio.Semaphore(settings.TASHU_AVAILABILITY_CONCURRENCY)
+        
+        async def load(station_id: str) -> Dict[str, Any]:
+            bikes_info = await self.get_available_bikes(station_id)
+            # get_available_bikes는 실패 시 빈 결과를 반환하므로 캐시하지 않도록 예외로 변환
+            if not bikes_info:
+                raise ValueError("자전거 정보를 가져오지 못했습니다")
+            return bikes_info
+        
+        async def lookup(station_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.availability_cache.get_or_load(station_id, lambda: load(station_id)),
+                        settings.TASHU_AVAILABILITY_TIMEOUT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    return {"error": "자전거 정보 조회 시간 초과"}
+                except Exception as e:
+                    return {"error": str(e)}
+        
+        station_ids = list(dict.fromkeys(str(station_id) for station_id in station_ids))
+        return dict(zip(station_ids, await asyncio.gather(*(lookup(i) for i in station_ids))))
     
     def parse_station_to_location(self, station: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -131,6 +176,7 @@ class TashuService:
             "details": {
                 "total_bikes": station.get("total_bikes", 0),
                 "available_bikes": station.get("available_bikes", 0),
+                "total_docks": station.get("total_docks"),  # 거치대 수 (API가 제공하지 않으면 None)
                 "is_active": station.get("is_active", True)
             }
         }
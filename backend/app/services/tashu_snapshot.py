@@ -0,0 +1,299 @@
+import asyncio
+import math
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.tashu import TashuService
+
+# 격자 칸 크기 (도 단위, 약 500m)
+GRID_CELL_DEG = 0.005
+
+EARTH_RADIUS_M = 6371000.0
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+class StationSnapshot:
+    """
+    한 시점의 타슈 대여소 목록과 격자 색인 (만든 뒤에는 바꾸지 않음)
+    """
+
+    def __init__(self, stations: List[Dict[str, Any]], fetched_at: float):
+        self.stations = stations
+        self.fetched_at = fetched_at
+        self.by_id: Dict[str, Dict[str, Any]] = {str(s.get("id", "")): s for s in stations}
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        self._coords: List[Tuple[float, float]] = []
+        for i, station in enumerate(stations):
+            lat, lon = float(station.get("latitude", 0)), float(station.get("longitude", 0))
+            self._coords.append((lat, lon))
+            self._grid.setdefault(self._cell(lat, lon), []).append(i)
+
+    @staticmethod
+    def _cell(lat: float, lon: float) -> Tuple[int, int]:
+        return int(math.floor(lat / GRID_CELL_DEG)), int(math.floor(lon / GRID_CELL_DEG))
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+    def get(self, station_id: str) -> Optional[Dict[str, Any]]:
+        return self.by_id.get(str(station_id))
+
+    def _ring(self, lat: float, lon: float, ring: int) -> List[int]:
+        # 지점이 속한 칸에서 ring칸 떨어진 테두리 칸들의 대여소
+        row, col = self._cell(lat, lon)
+        items = []
+        for r in range(row - ring, row + ring + 1):
+            for c in range(col - ring, col + ring + 1):
+                if max(abs(r - row), abs(c - col)) == ring:
+                    items.extend(self._grid.get((r, c), ()))
+        return items
+
+    def within(self, latitude: float, longitude: float, radius_m: float) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        반경 안의 대여소 (가까운 순)
+
+        Returns:
+            (대여소, 거리(m)) 목록
+        """
+        # 반경을 덮는 칸 수 (경도 방향 칸이 더 좁으므로 위도로 보정)
+        cell_m = GRID_CELL_DEG * math.radians(1) * EARTH_RADIUS_M * math.cos(math.radians(latitude))
+        rings = int(math.ceil(radius_m / max(cell_m, 1.0)))
+        found = []
+        for ring in range(rings + 1):
+            for i in self._ring(latitude, longitude, ring):
+                distance = haversine_m(latitude, longitude, *self._coords[i])
+                if distance <= radius_m:
+                    found.append((self.stations[i], distance))
+        found.sort(key=lambda item: item[1])
+        return found
+
+    def nearest(self, latitude: float, longitude: float, k: int = 5) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        가장 가까운 대여소 k개 (직선 거리 기준)
+
+        Returns:
+            (대여소, 거리(m)) 목록
+        """
+        k = min(k, len(self.stations))
+        if k == 0:
+            return []
+        cell_m = GRID_CELL_DEG * math.radians(1) * EARTH_RADIUS_M * math.cos(math.radians(latitude))
+        found: List[Tuple[Dict[str, Any], float]] = []
+        ring = 0
+        while True:
+            for i in self._ring(latitude, longitude, ring):
+                found.append((self.stations[i], haversine_m(latitude, longitude, *self._coords[i])))
+            found.sort(key=lambda item: item[1])
+            # ring칸까지 찾았으면 (ring x 칸 크기)보다 가까운 대여소는 모두 찾은 것
+            if len(found) >= k and found[k - 1][1] <= ring * cell_m:
+                return found[:k]
+            if len(found) == len(self.stations):
+                return found[:k]
+            ring += 1
+
+
+class AvailabilityLedger:
+    """
+    대여/반납으로 생긴 대여소별 자전거 수 변화 장부
+
+    스냅샷의 자전거 수에 스냅샷 이후 이 서버에서 처리한 대여(-1)/반납(+1)을 더해 현재 자전거 수를 추정합니다.
+    새 스냅샷을 받으면 그 이전의 변화는 타슈 API에 이미 반영되었으므로 버립니다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, List[Tuple[float, int]]] = {}
+
+    def adjust(self, station_id: str, delta: int) -> None:
+        self._entries.setdefault(str(station_id), []).append((time.monotonic(), delta))
+
+    def delta(self, station_id: str, since: float) -> int:
+        return sum(d for t, d in self._entries.get(str(station_id), ()) if t >= since)
+
+    def reconcile(self, since: float) -> None:
+        """
+        since(스냅샷 조회 시작 시각) 이전의 변화를 버립니다.
+        """
+        entries = {}
+        for station_id, items in self._entries.items():
+            items = [(t, d) for t, d in items if t >= since]
+            if items:
+                entries[station_id] = items
+        self._entries = entries
+
+
+class StationSnapshotManager:
+    """
+    타슈 대여소 목록을 주기적으로 새로 받아 메모리에 보관하는 관리자
+
+    대여소 목록은 자주 읽히지만 천천히 바뀌므로, 백그라운드 작업이 refresh_seconds(± jitter)마다
+    전체 목록을 받아 새 스냅샷으로 교체하고 요청은 메모리의 스냅샷으로 처리합니다.
+    외부 API가 실패하면 이전 스냅샷을 계속 사용하고(stale-while-revalidate),
+    스냅샷이 max_age_seconds보다 오래되면 요청을 막지 않고 백그라운드에서 다시 받습니다.
+    """
+
+    def __init__(self,
+                 tashu_service: TashuService,
+                 refresh_seconds: float,
+                 jitter_seconds: float = 0,
+                 max_age_seconds: Optional[float] = None):
+        self.tashu_service = tashu_service
+        self.refresh_seconds = refresh_seconds
+        self.jitter_seconds = jitter_seconds
+        self.max_age_seconds = max_age_seconds or refresh_seconds * 4
+        self.snapshot: Optional[StationSnapshot] = None
+        self.ledger = AvailabilityLedger()
+        self.failures = 0
+        self._refreshing: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _fetch(self) -> bool:
+        # 조회 중에 처리된 대여/반납이 목록에 반영되었는지 알 수 없으므로 조회 시작 시각을 스냅샷 시각으로 사용
+        started = time.monotonic()
+        stations = await self.tashu_service.get_stations()
+        # get_stations는 실패 시 빈 목록을 반환하므로 빈 목록이면 이전 스냅샷 유지
+        if not stations:
+            self.failures += 1
+            return False
+        self.snapshot = StationSnapshot(stations, started)
+        self.ledger.reconcile(started)
+        self.failures = 0
+        return True
+
+    async def refresh(self) -> bool:
+        """
+        대여소 목록을 새로 받아 스냅샷을 교체합니다. 동시에 여러 번 호출되어도 외부 호출은 한 번만 합니다.
+
+        Returns:
+            새 스냅샷으로 교체했으면 True
+        """
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.ensure_future(self._fetch())
+        return await asyncio.shield(self._refreshing)
+
+    async def get_snapshot(self) -> Optional[StationSnapshot]:
+        """
+        현재 스냅샷 (없으면 받아올 때까지 기다리고, 오래되었으면 그대로 반환하며 백그라운드에서 갱신)
+        """
+        if self.snapshot is None:
+            await self.refresh()
+        elif self.snapshot.age > self.max_age_seconds and (self._refreshing is None or self._refreshing.done()):
+            self._refreshing = asyncio.ensure_future(self._fetch())
+        return self.snapshot
+
+    def available_bikes(self, station_id: str) -> Optional[int]:
+        """
+        스냅샷의 자전거 수에 이후 대여/반납을 반영한 현재 자전거 수 (스냅샷에 없는 대여소면 None)
+        """
+        station = self.snapshot.get(station_id) if self.snapshot is not None else None
+        if station is None:
+            return None
+        return max(int(station.get("available_bikes") or 0) + self.ledger.delta(station_id, self.snapshot.fetched_at), 0)
+
+    def reserve_bike(self, station_id: str) -> bool:
+        """
+        대여할 자전거가 있으면 장부에서 한 대를 차감합니다.
+
+        Returns:
+            차감했으면 True, 대여 가능한 자전거가 없으면 False
+        """
+        if not self.available_bikes(station_id):
+            return False
+        self.ledger.adjust(station_id, -1)
+        return True
+
+    def release_bike(self, station_id: str) -> None:
+        """
+        반납 또는 대여 취소로 대여소에 자전거 한 대를 더합니다.
+        """
+        if self.snapshot is not None and self.snapshot.get(station_id) is not None:
+            self.ledger.adjust(station_id, 1)
+
+    async def _run(self) -> None:
+        while True:
+            # 여러 프로세스가 같은 시각에 외부 API를 호출하지 않도록 주기에 무작위 지연을 더함
+            delay = self.refresh_seconds + random.uniform(-self.jitter_seconds, self.jitter_seconds)
+            await asyncio.sleep(max(delay, 1.0))
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.failures += 1
+                print(f"타슈 대여소 목록 갱신 실패 (이전 목록 유지): {e}")
+
+    async def start(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            print(f"타슈 대여소 목록을 불러오지 못했습니다 (요청 시 다시 시도): {e}")
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "stations": len(self.snapshot.stations) if self.snapshot is not None else 0,
+            "age_seconds": round(self.snapshot.age, 1) if self.snapshot is not None else None,
+            "stale": self.snapshot is not None and self.snapshot.age > self.max_age_seconds,
+            "consecutive_failures": self.failures,
+        }
+
+
+# 애플리케이션 시작 시 만든 대여소 스냅샷 관리자 (없으면 요청마다 외부 API 호출)
+_station_snapshot: Optional[StationSnapshotManager] = None
+
+
+async def start_station_snapshot(tashu_service: TashuService) -> Optional[StationSnapshotManager]:
+    """
+    TASHU_SNAPSHOT_REFRESH_SECONDS가 0보다 크면 대여소 스냅샷 갱신 작업을 시작합니다.
+    """
+    global _station_snapshot
+    if settings.TASHU_SNAPSHOT_REFRESH_SECONDS <= 0:
+        return None
+
+    manager = StationSnapshotManager(
+        tashu_service,
+        refresh_seconds=settings.TASHU_SNAPSHOT_REFRESH_SECONDS,
+        jitter_seconds=settings.TASHU_SNAPSHOT_JITTER_SECONDS,
+        max_age_seconds=settings.TASHU_SNAPSHOT_MAX_AGE_SECONDS
+    )
+    await manager.start()
+    _station_snapshot = manager
+    return manager
+
+
+async def stop_station_snapshot() -> None:
+    global _station_snapshot
+    if _station_snapshot is not None:
+        await _station_snapshot.stop()
+        _station_snapshot = None
+
+
+def get_station_snapshot() -> Optional[StationSnapshotManager]:
+    return _station_snapshot
+
+
+async def load_station_snapshot(tashu_service: TashuService) -> Optional[StationSnapshot]:
+    """
+    현재 대여소 스냅샷 (스냅샷 갱신 작업이 없으면 타슈 API에서 전체 목록을 받아 이번 요청용으로 생성)
+
+    Returns:
+        대여소 스냅샷 (목록을 받지 못했으면 None)
+    """
+    if _station_snapshot is not None:
+        return await _station_snapshot.get_snapshot()
+    stations = await tashu_service.get_stations()
+    return StationSnapshot(stations, time.monotonic()) if stations else None
@@ -0,0 +1,21 @@
+from app.services.routing import RESULT_OK, RoutingEngine
+
+from test_routing_waypoints import LON, line_snapshot, point
+
+
+def station(station_id, i, free_docks):
+    return {"id": station_id, "name": station_id, "latitude": 36.35, "longitude": float(LON[i]),
+            "free_docks": free_docks}
+
+
+def test_return_stations_skip_only_known_full_stations(tmp_path):
+    line_snapshot().save(str(tmp_path / "line"))
+    engine = RoutingEngine(str(tmp_path / "line"))
+
+    stations = [station("full", 4, 0), station("unknown", 5, None), station("open", 3, 2)]
+    result = engine.return_stations(point(0), point(4), stations, max_walk_km=2.0)
+
+    assert result["result_code"] == RESULT_OK
+    # 빈 거치대가 없는 대여소만 빠지고, 거치대 수를 모르는 대여소는 후보로 남음
+    assert [item["id"] for item in result["items"]] == ["open", "unknown"]
+    assert [item["free_docks"] for item in result["items"]] == [2, None]
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from app.services.routing import RESULT_NO_ROUTE, RESULT_OK, RoutingEngine, import_find_route
+
+import_find_route()
+from snapshot import RoutingSnapshot  # noqa: E402
+
+# 경도 방향으로 0.01도(약 0.9km) 간격의 정점 6개
+LON = 127.30 + 0.01 * np.arange(6)
+
+
+def line_snapshot(one_way_into=None) -> RoutingSnapshot:
+    """
+    0-1-2-3-4-5 일직선 양방향 그래프 (one_way_into 정점으로 들어가는 간선은 제외)
+    """
+    arcs = []
+    for v in range(5):
+        arcs.append((v, v + 1))
+        arcs.append((v + 1, v))
+    arcs = sorted(a for a in arcs if a[1] != one_way_into)
+    tails = np.array([a[0] for a in arcs])
+    heads = np.array([a[1] for a in arcs], dtype=np.int64)
+    offsets = np.zeros(7, dtype=np.int64)
+    np.add.at(offsets, tails + 1, 1)
+    np.cumsum(offsets, out=offsets)
+    distance = np.full(len(arcs), 0.9, dtype=np.float32)
+    return RoutingSnapshot(
+        vertex_ids=np.arange(6, dtype=np.int64) + 100,
+        lat=np.full(6, 36.35),
+        lon=LON.copy(),
+        offsets=offsets,
+        heads=heads,
+        metrics={"distance": distance},
+    )
+
+
+@pytest.fixture
+def engine(tmp_path):
+    line_snapshot().save(str(tmp_path / "line"))
+    return RoutingEngine(str(tmp_path / "line"))
+
+
+def point(i):
+    return {"x": float(LON[i]), "y": 36.35}
+
+
+def test_optimized_waypoints_are_reordered(engine):
+    waypoints = [point(4), point(1), point(3)]
+    result = engine.route(point(0), point(5), waypoints, optimize_waypoints=True)
+    route = result["routes"][0]
+    assert route["result_code"] == RESULT_OK
+    assert route["summary"]["waypoint_order"] == [1, 2, 0]
+    assert route["summary"]["waypoints"] == [waypoints[1], waypoints[2], waypoints[0]]
+    # 되돌아가지 않는 순서이므로 출발지에서 도착지까지 직선 거리와 같음
+    assert route["summary"]["distance"] == 4500
+    assert len(route["sections"]) == 4
+
+
+def test_unreachable_waypoint_is_no_route(engine):
+    # 3번 정점으로 들어가는 간선이 없는 그래프 (스냅은 건너뛰고 비용표 단계만 확인)
+    engine.snapshot = line_snapshot(one_way_into=3)
+    weights = engine.snapshot.metrics["distance"]
+    order, routes = engine._optimized_routes([100, 101, 103, 102, 105], weights)
+    assert order is None and routes == []
+
+
+def test_unreachable_waypoint_response(engine, monkeypatch):
+    engine.snapshot = line_snapshot(one_way_into=3)
+    monkeypatch.setattr(engine, "_snap", lambda points: [100, 101, 103, 102, 105])
+    result = engine.route(point(0), point(5), [point(1), point(3), point(2)], optimize_waypoints=True)
+    route = result["routes"][0]
+    assert route["result_code"] == RESULT_NO_ROUTE
+    assert "waypoint_order" not in route["summary"]
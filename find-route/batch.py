@@ -0,0 +1,263 @@
+import csv
+import json
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional, TextIO
+
+import numpy as np
+
+from profiles import MetricProfiles
+from route_metrics import BIKE_SPEED_KMH
+from snapshot import RoutingSnapshot
+
+# 작업 하나에 담을 OD 쌍 수
+DEFAULT_CHUNK_SIZE = 1000
+
+# 결과 출력 필드 (CSV 헤더 순서)
+OUTPUT_FIELDS = ["id", "origin_id", "destination_id", "distance_km", "time_min", "status", "geometry"]
+
+# 작업 프로세스별 스냅샷 (프로세스 초기화 시 한 번만 불러옴)
+_worker_snapshot: Optional[RoutingSnapshot] = None
+_worker_profiles: Optional[MetricProfiles] = None
+
+
+def _init_worker(snapshot_dir: str) -> None:
+    """
+    작업 프로세스 초기화 - 스냅샷을 메모리 매핑으로 한 번만 불러옵니다.
+    """
+    global _worker_snapshot, _worker_profiles
+    _worker_snapshot = RoutingSnapshot.load(snapshot_dir, mmap=True)
+    _worker_profiles = MetricProfiles.from_snapshot(_worker_snapshot)
+
+
+def read_od_pairs(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    OD 쌍 파일을 한 줄씩 읽습니다 (.csv 또는 .ndjson/.jsonl).
+
+    각 행은 정점 ID(origin_id, destination_id) 또는 좌표
+    (origin_lat, origin_lon, destination_lat, destination_lon)를 가지며,
+    선택적으로 id와 departure(ISO 8601 출발 시각)를 가질 수 있습니다.
+
+    Args:
+        path: 입력 파일 경로
+
+    Returns:
+        OD 쌍 딕셔너리 이터레이터
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            for i, row in enumerate(csv.DictReader(f)):
+                row.setdefault("id", i)
+                yield row
+        else:
+            for i, line in enumerate(f):
+                line = line.strip()
+                if line:
+                    row = json.loads(line)
+                    row.setdefault("id", i)
+                    yield row
+
+
+def _chunks(rows: Iterator[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _has_value(row: Dict[str, Any], key: str) -> bool:
+    return row.get(key) not in (None, "")
+
+
+def route_chunk(rows: List[Dict[str, Any]], include_geometry: bool = False) -> List[Dict[str, Any]]:
+    """
+    OD 쌍 묶음의 경로를 계산합니다 (작업 프로세스에서 실행).
+    좌표로 주어진 출발/도착지는 묶음 단위로 한 번에 정점에 스냅합니다.
+
+    Args:
+        rows: OD 쌍 목록
+        include_geometry: 결과에 경로 좌표열 포함 여부
+
+    Returns:
+        결과 목록 (각 결과에 질의 지연 시간 latency_ms 포함)
+    """
+    snapshot = _worker_snapshot
+    distance = snapshot.metrics["distance"]
+
+    # 좌표 기반 출발/도착지를 한 번에 스냅 (좌표가 잘못된 행은 오류로 기록하고 나머지만 스냅)
+    parse_errors: Dict[int, str] = {}
+    coordinate_rows = []
+    coordinates = []
+    for i, row in enumerate(rows):
+        if _has_value(row, "origin_id") and _has_value(row, "destination_id"):
+            continue
+        try:
+            point = (float(row["origin_lat"]), float(row["origin_lon"]),
+                     float(row["destination_lat"]), float(row["destination_lon"]))
+            if not all(map(math.isfinite, point)):
+                raise ValueError(f"invalid coordinates {point}")
+            coordinates.append(point)
+            coordinate_rows.append(row)
+        except (KeyError, TypeError, ValueError) as e:
+            parse_errors[i] = f"error: {e}"
+    if coordinate_rows:
+        points = np.array(coordinates, dtype=np.float64)
+        snapped = snapshot.nearest_vertices(np.concatenate([points[:, 0], points[:, 2]]),
+                                            np.concatenate([points[:, 1], points[:, 3]]))
+        for i, row in enumerate(coordinate_rows):
+            row["origin_id"] = int(snapped[i])
+            row["destination_id"] = int(snapped[len(coordinate_rows) + i])
+
+    results = []
+    for i, row in enumerate(rows):
+        started = time.perf_counter()
+        result = {"id": row["id"], "origin_id": None, "destination_id": None,
+                  "distance_km": None, "time_min": None, "status": "ok", "geometry": None}
+        if i in parse_errors:
+            result["status"] = parse_errors[i]
+            result["latency_ms"] = (time.perf_counter() - started) * 1000
+            results.append(result)
+            continue
+        try:
+            origin_id = int(row["origin_id"])
+            destination_id = int(row["destination_id"])
+            result["origin_id"] = origin_id
+            result["destination_id"] = destination_id
+
+            # 출발 시각이 있으면 해당 시간대 프로필로 탐색
+            weights = None
+            if _worker_profiles is not None and _has_value(row, "departure"):
+                weights = _worker_profiles.weights_at(datetime.fromisoformat(str(row["departure"])))
+            route = snapshot.shortest_path(origin_id, destination_id, weights)
+
+            if route is None:
+                result["status"] = "unreachable"
+            else:
+                distance_km = float(np.sum(distance[route.arcs])) if route.arcs else 0.0
+                cost_km = distance_km
+                if weights is not None:
+                    scale = _worker_profiles.scale if _worker_profiles.quantized else 1.0
+                    cost_km = route.cost * scale
+                result["distance_km"] = round(distance_km, 4)
+                result["time_min"] = round(cost_km / BIKE_SPEED_KMH * 60, 2)
+                if include_geometry:
+                    result["geometry"] = snapshot.route_geometry(route)
+        except (KeyError, TypeError, ValueError) as e:
+            result["status"] = f"error: {e}"
+        result["latency_ms"] = (time.perf_counter() - started) * 1000
+        results.append(result)
+    return results
+
+
+class _ResultWriter:
+    """
+    결과를 CSV 또는 NDJSON으로 스트리밍 기록합니다.
+    """
+
+    def __init__(self, f: TextIO, path: str):
+        self.f = f
+        self.csv_writer = None
+        if path.endswith(".csv"):
+            self.csv_writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDS, extrasaction="ignore")
+            self.csv_writer.writeheader()
+
+    def write(self, results: List[Dict[str, Any]]) -> None:
+        for result in results:
+            if self.csv_writer is not None:
+                row = dict(result)
+                if row.get("geometry") is not None:
+                    row["geometry"] = json.dumps(row["geometry"])
+                self.csv_writer.writerow(row)
+            else:
+                record = {k: result[k] for k in OUTPUT_FIELDS if result.get(k) is not None}
+                self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.f.flush()
+
+
+def run_batch(snapshot_dir: str,
+              input_path: str,
+              output_path: str,
+              workers: Optional[int] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE,
+              include_geometry: bool = False) -> Dict[str, Any]:
+    """
+    OD 쌍 파일 전체의 경로를 작업 프로세스 풀로 계산해 결과 파일에 기록합니다.
+    입력은 묶음 단위로 읽어 처리 중인 묶음 수를 제한하고, 결과는 입력 순서대로 기록합니다.
+
+    Args:
+        snapshot_dir: 스냅샷 디렉터리
+        input_path: OD 쌍 입력 파일 (.csv 또는 .ndjson)
+        output_path: 결과 파일 (.csv 또는 .ndjson)
+        workers: 작업 프로세스 수 (기본값: CPU 수)
+        chunk_size: 작업 하나에 담을 OD 쌍 수
+        include_geometry: 결과에 경로 좌표열 포함 여부
+
+    Returns:
+        처리 통계 (처리량, 지연 시간 백분위수 등)
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    latencies: List[float] = []
+    status_counts: Dict[str, int] = {}
+    started = time.perf_counter()
+
+    with open(output_path, "w", newline="", encoding="utf-8") as f, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(snapshot_dir,)) as executor:
+        writer = _ResultWriter(f, output_path)
+        pending: Deque[Future] = deque()
+
+        def drain_one() -> None:
+            results = pending.popleft().result()
+            writer.write(results)
+            for result in results:
+                latencies.append(result["latency_ms"])
+                status = result["status"] if not result["status"].startswith("error") else "error"
+                status_counts[status] = status_counts.get(status, 0) + 1
+
+        for chunk in _chunks(read_od_pairs(input_path), chunk_size):
+            pending.append(executor.submit(route_chunk, chunk, include_geometry))
+            if len(pending) >= max_pending:
+                drain_one()
+        while pending:
+            drain_one()
+
+    elapsed = time.perf_counter() - started
+    latency_array = np.array(latencies) if latencies else np.zeros(1)
+    return {
+        "queries": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_qps": round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": round(float(np.percentile(latency_array, 50)), 3),
+            "p90": round(float(np.percentile(latency_array, 90)), 3),
+            "p99": round(float(np.percentile(latency_array, 99)), 3),
+            "max": round(float(latency_array.max()), 3),
+        },
+        "status": status_counts,
+    }
+
+
+def print_batch_report(report: Dict[str, Any]) -> None:
+    """
+    일괄 처리 통계를 출력합니다.
+
+    Args:
+        report: run_batch의 반환값
+    """
+    print("\n일괄 경로 계산 완료:")
+    print(f"  질의 수: {report['queries']}개, 소요 시간: {report['elapsed_s']}초")
+    print(f"  처리량: {report['throughput_qps']} 질의/초")
+    latency = report["latency_ms"]
+    print(f"  지연 시간(ms): p50 {latency['p50']}, p90 {latency['p90']}, "
+          f"p99 {latency['p99']}, 최대 {latency['max']}")
+    for status, count in sorted(report["status"].items()):
+        print(f"  {status}: {count}개")
@@ -21,6 +21,7 @@ class Arc:
     source: Vertex
     target: Vertex
     cost: int
+    kind: str = "road"  # "road": 자전거 도로, "link": 가까운 정점을 잇는 연결 간선
     
     def get_cost(self) -> int:
         return self.cost
@@ -311,9 +311,9 @@ class DaejeonBikeAPI:
                     
                     # 일정 거리 이내의 정점만 연결 (2km 이내)
                     if distance < 2.0:
-                        # 간선 추가
-                        arc1 = Arc(v1, v2, distance)
-                        arc2 = Arc(v2, v1, distance)
+                        # 간선 추가 (자전거 도로가 아닌 연결 간선)
+                        arc1 = Arc(v1, v2, distance, kind="link")
+                        arc2 = Arc(v2, v1, distance, kind="link")
                         graph.add_arc(arc1)
                         graph.add_arc(arc2)
                         connection_count += 1
@@ -0,0 +1,418 @@
+import math
+import struct
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from customer import RoutePreference
+from snapshot import GEOMETRY_LAT, GEOMETRY_LON, GEOMETRY_OFFSETS, RoutingSnapshot, haversine_km
+
+# 고도 관련 메트릭 이름
+CLIMB_METRIC = "climb"          # 간선별 누적 상승 고도 (m)
+GRADE_METRIC = "max_grade"      # 간선별 최대 오르막 경사 (%)
+ELEVATION_METRIC = "elevation"  # 거리 + 고도 가중 비용 (km 환산)
+
+# 상승 고도 1m를 평지 거리로 환산한 값 (km) - 100m 오르막을 약 1km 평지 주행으로 간주
+CLIMB_EQUIVALENT_KM_PER_M = 0.01
+
+# 간선 위 고도 샘플 간격 (km)
+DEFAULT_SAMPLE_STEP_KM = 0.05
+
+# 한 번에 처리할 간선 수 (샘플 좌표 배열의 메모리 사용량 제한)
+DEFAULT_BATCH_ARCS = 100_000
+
+# TIFF 태그 번호
+_TIFF_TAGS = {
+    256: "width",
+    257: "height",
+    258: "bits_per_sample",
+    259: "compression",
+    273: "strip_offsets",
+    277: "samples_per_pixel",
+    279: "strip_byte_counts",
+    322: "tile_width",
+    339: "sample_format",
+    33550: "pixel_scale",
+    33922: "tiepoint",
+    42113: "nodata",
+}
+
+# TIFF 필드 타입 -> (struct 형식, 바이트 수)
+_TIFF_TYPES = {
+    1: ("B", 1), 2: ("s", 1), 3: ("H", 2), 4: ("I", 4),
+    6: ("b", 1), 8: ("h", 2), 9: ("i", 4), 11: ("f", 4), 12: ("d", 8), 16: ("Q", 8),
+}
+
+# (SampleFormat, BitsPerSample) -> numpy 자료형 문자
+_TIFF_DTYPES = {
+    (1, 8): "u1", (1, 16): "u2", (1, 32): "u4",
+    (2, 8): "i1", (2, 16): "i2", (2, 32): "i4",
+    (3, 32): "f4", (3, 64): "f8",
+}
+
+
+class DEMRaster:
+    """
+    메모리 매핑된 수치표고모델(DEM) 래스터
+
+    래스터 전체를 읽지 않고 np.memmap으로 열어 두며, 샘플링 시 필요한 픽셀이 있는
+    페이지만 디스크에서 읽습니다. 좌표는 기본적으로 경위도(EPSG:4326) 격자를 가정하며,
+    다른 좌표계 래스터는 project 함수로 (위도, 경도) -> (x, y) 변환을 지정합니다.
+    """
+
+    def __init__(self,
+                 data: np.ndarray,
+                 origin_x: float,
+                 origin_y: float,
+                 pixel_width: float,
+                 pixel_height: float,
+                 nodata: Optional[float] = None,
+                 project: Optional[Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]] = None):
+        """
+        DEMRaster 초기화
+
+        Args:
+            data: (행, 열) 고도 배열 (일반적으로 np.memmap)
+            origin_x, origin_y: 좌상단 픽셀 모서리 좌표 (경도, 위도)
+            pixel_width, pixel_height: 픽셀 크기 (양수)
+            nodata: 자료 없음 값
+            project: (위도, 경도) 배열을 래스터 좌표 (x, y) 배열로 변환하는 함수
+        """
+        self.data = data
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.pixel_width = pixel_width
+        self.pixel_height = pixel_height
+        self.nodata = nodata
+        self.project = project
+
+    @classmethod
+    def open_raw(cls,
+                 path: str,
+                 width: int,
+                 height: int,
+                 dtype: str,
+                 origin_x: float,
+                 origin_y: float,
+                 pixel_width: float,
+                 pixel_height: float,
+                 offset: int = 0,
+                 nodata: Optional[float] = None) -> "DEMRaster":
+        """
+        헤더 없는 원시 격자 파일(BIL/.raw 등)을 메모리 매핑으로 엽니다.
+
+        Args:
+            path: 파일 경로
+            width, height: 열/행 수
+            dtype: numpy 자료형 문자열 (예: "<i2", "<f4")
+            origin_x, origin_y: 좌상단 픽셀 모서리 좌표
+            pixel_width, pixel_height: 픽셀 크기
+            offset: 데이터 시작 위치 (바이트)
+            nodata: 자료 없음 값
+
+        Returns:
+            DEMRaster 객체
+        """
+        data = np.memmap(path, dtype=np.dtype(dtype), mode="r", offset=offset, shape=(height, width))
+        return cls(data, origin_x, origin_y, pixel_width, pixel_height, nodata)
+
+    @classmethod
+    def open_geotiff(cls, path: str) -> "DEMRaster":
+        """
+        GeoTIFF 파일을 메모리 매핑으로 엽니다.
+        단일 밴드, 무압축, 스트립이 연속으로 저장된 래스터만 지원합니다.
+        (타일/압축 래스터는 gdal_translate -co TILED=NO -co COMPRESS=NONE 으로 변환 후 사용)
+
+        Args:
+            path: GeoTIFF 파일 경로
+
+        Returns:
+            DEMRaster 객체
+        """
+        tags, byte_order = _read_tiff_tags(path)
+
+        if tags.get("compression", (1,))[0] != 1:
+            raise ValueError("압축된 GeoTIFF는 메모리 매핑할 수 없습니다.")
+        if "tile_width" in tags:
+            raise ValueError("타일 형식 GeoTIFF는 지원하지 않습니다.")
+        if tags.get("samples_per_pixel", (1,))[0] != 1:
+            raise ValueError("단일 밴드 GeoTIFF만 지원합니다.")
+        if "pixel_scale" not in tags or "tiepoint" not in tags:
+            raise ValueError("GeoTIFF 좌표 정보(ModelPixelScale, ModelTiepoint)가 없습니다.")
+
+        width = tags["width"][0]
+        height = tags["height"][0]
+        bits = tags["bits_per_sample"][0]
+        sample_format = tags.get("sample_format", (1,))[0]
+        if (sample_format, bits) not in _TIFF_DTYPES:
+            raise ValueError(f"지원하지 않는 픽셀 형식입니다: format={sample_format}, bits={bits}")
+        dtype = np.dtype(byte_order + _TIFF_DTYPES[(sample_format, bits)])
+
+        # 스트립이 파일 안에서 연속인지 확인
+        offsets = tags["strip_offsets"]
+        counts = tags["strip_byte_counts"]
+        for i in range(len(offsets) - 1):
+            if offsets[i] + counts[i] != offsets[i + 1]:
+                raise ValueError("스트립이 연속으로 저장되지 않은 GeoTIFF는 지원하지 않습니다.")
+
+        scale_x, scale_y = tags["pixel_scale"][0], tags["pixel_scale"][1]
+        tie_i, tie_j, _, tie_x, tie_y, _ = tags["tiepoint"][:6]
+        nodata = None
+        if "nodata" in tags:
+            nodata = float(tags["nodata"].strip("\x00").strip() or "nan")
+
+        data = np.memmap(path, dtype=dtype, mode="r", offset=offsets[0], shape=(height, width))
+        return cls(
+            data,
+            origin_x=tie_x - tie_i * scale_x,
+            origin_y=tie_y + tie_j * scale_y,
+            pixel_width=scale_x,
+            pixel_height=scale_y,
+            nodata=nodata,
+        )
+
+    def sample(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """
+        여러 지점의 고도를 한 번에 샘플링합니다 (쌍선형 보간).
+
+        Args:
+            lat, lon: 위도/경도 배열
+
+        Returns:
+            고도 배열 (m, 래스터 밖이거나 자료 없음이면 NaN)
+        """
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        x, y = (lon, lat) if self.project is None else self.project(lat, lon)
+
+        # 픽셀 중심 기준 실수 좌표
+        col = (x - self.origin_x) / self.pixel_width - 0.5
+        row = (self.origin_y - y) / self.pixel_height - 0.5
+
+        height, width = self.data.shape
+        inside = (col >= 0) & (row >= 0) & (col <= width - 1) & (row <= height - 1)
+
+        c0 = np.clip(np.floor(col), 0, max(width - 2, 0)).astype(np.int64)
+        r0 = np.clip(np.floor(row), 0, max(height - 2, 0)).astype(np.int64)
+        c1 = np.minimum(c0 + 1, width - 1)
+        r1 = np.minimum(r0 + 1, height - 1)
+        fc = np.clip(col - c0, 0.0, 1.0)
+        fr = np.clip(row - r0, 0.0, 1.0)
+
+        # 필요한 픽셀만 읽음 (memmap 팬시 인덱싱)
+        z00 = self.data[r0, c0].astype(np.float64)
+        z01 = self.data[r0, c1].astype(np.float64)
+        z10 = self.data[r1, c0].astype(np.float64)
+        z11 = self.data[r1, c1].astype(np.float64)
+
+        if self.nodata is not None and not math.isnan(self.nodata):
+            for z in (z00, z01, z10, z11):
+                z[z == self.nodata] = np.nan
+
+        top = z00 * (1 - fc) + z01 * fc
+        bottom = z10 * (1 - fc) + z11 * fc
+        elevation = top * (1 - fr) + bottom * fr
+        elevation[~inside] = np.nan
+        return elevation
+
+
+def _read_tiff_tags(path: str) -> Tuple[Dict[str, tuple], str]:
+    """
+    TIFF 첫 번째 IFD에서 필요한 태그만 읽습니다.
+
+    Args:
+        path: TIFF 파일 경로
+
+    Returns:
+        (태그 이름 -> 값 튜플 또는 문자열, numpy 바이트 순서 문자)
+    """
+    with open(path, "rb") as f:
+        header = f.read(8)
+        if header[:2] == b"II":
+            endian, byte_order = "<", "<"
+        elif header[:2] == b"MM":
+            endian, byte_order = ">", ">"
+        else:
+            raise ValueError("TIFF 파일이 아닙니다.")
+
+        magic, ifd_offset = struct.unpack(endian + "HI", header[2:8])
+        if magic != 42:
+            raise ValueError("BigTIFF 또는 잘못된 TIFF 형식입니다.")
+
+        f.seek(ifd_offset)
+        (num_entries,) = struct.unpack(endian + "H", f.read(2))
+        entries = [struct.unpack(endian + "HHI4s", f.read(12)) for _ in range(num_entries)]
+
+        tags: Dict[str, tuple] = {}
+        for tag, field_type, count, value in entries:
+            if tag not in _TIFF_TAGS or field_type not in _TIFF_TYPES:
+                continue
+            fmt, size = _TIFF_TYPES[field_type]
+            raw = value
+            if size * count > 4:
+                (offset,) = struct.unpack(endian + "I", value)
+                f.seek(offset)
+                raw = f.read(size * count)
+            if field_type == 2:
+                tags[_TIFF_TAGS[tag]] = raw[:count].decode("ascii", errors="ignore")
+            else:
+                tags[_TIFF_TAGS[tag]] = struct.unpack(endian + fmt * count, raw[:size * count])
+
+    return tags, byte_order
+
+
+def arc_segments(snapshot: RoutingSnapshot,
+                 arcs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    간선을 이루는 직선 구간 목록을 만듭니다.
+    체인 압축된 간선은 중간 정점을 따라 여러 구간으로 나뉩니다.
+
+    Args:
+        snapshot: 경로 탐색 스냅샷
+        arcs: 대상 간선 인덱스 배열
+
+    Returns:
+        (시작 위도, 시작 경도, 끝 위도, 끝 경도, 구간별 소속 위치(arcs 내 순번)) 배열
+    """
+    tails = snapshot.arc_tails()[arcs]
+    heads = snapshot.heads[arcs]
+    if not snapshot.has_geometry():
+        return (snapshot.lat[tails], snapshot.lon[tails],
+                snapshot.lat[heads], snapshot.lon[heads], np.arange(len(arcs)))
+
+    # 간선별 좌표열 = 출발 정점 + 중간 정점들 + 도착 정점
+    geom_offsets = snapshot.extras[GEOMETRY_OFFSETS]
+    interior_counts = geom_offsets[arcs + 1] - geom_offsets[arcs]
+    point_counts = interior_counts + 2
+    point_starts = np.concatenate(([0], np.cumsum(point_counts)[:-1]))
+    total = int(point_counts.sum())
+
+    lat = np.empty(total, dtype=np.float64)
+    lon = np.empty(total, dtype=np.float64)
+    lat[point_starts] = snapshot.lat[tails]
+    lon[point_starts] = snapshot.lon[tails]
+    last = point_starts + point_counts - 1
+    lat[last] = snapshot.lat[heads]
+    lon[last] = snapshot.lon[heads]
+
+    interior_owner = np.repeat(np.arange(len(arcs)), interior_counts)
+    interior_rank = np.arange(int(interior_counts.sum())) - np.repeat(
+        np.concatenate(([0], np.cumsum(interior_counts)[:-1])), interior_counts)
+    positions = point_starts[interior_owner] + 1 + interior_rank
+    geom_index = geom_offsets[arcs][interior_owner] + interior_rank
+    lat[positions] = snapshot.extras[GEOMETRY_LAT][geom_index]
+    lon[positions] = snapshot.extras[GEOMETRY_LON][geom_index]
+
+    # 각 간선의 마지막 점을 제외한 모든 점이 구간의 시작점
+    is_start = np.ones(total, dtype=bool)
+    is_start[last] = False
+    begin = np.flatnonzero(is_start)
+    owner = np.repeat(np.arange(len(arcs)), point_counts - 1)
+    return lat[begin], lon[begin], lat[begin + 1], lon[begin + 1], owner
+
+
+def segment_sample_points(lat0: np.ndarray,
+                          lon0: np.ndarray,
+                          lat1: np.ndarray,
+                          lon1: np.ndarray,
+                          length_km: np.ndarray,
+                          step_km: float = DEFAULT_SAMPLE_STEP_KM) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    직선 구간을 따라 일정 간격으로 샘플 지점을 만듭니다 (양 끝점 포함).
+
+    Args:
+        lat0, lon0, lat1, lon1: 구간 시작/끝 좌표 배열
+        length_km: 구간 길이 배열 (km)
+        step_km: 샘플 간격 (km)
+
+    Returns:
+        (위도 배열, 경도 배열, 구간별 샘플 시작 위치 배열, 구간별 분할 수 배열)
+    """
+    # 구간별 분할 수 (최소 1) -> 샘플 수 = 분할 수 + 1
+    pieces = np.maximum(np.ceil(length_km / step_km), 1).astype(np.int64)
+    counts = pieces + 1
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    owner = np.repeat(np.arange(len(pieces)), counts)
+    t = (np.arange(counts.sum()) - starts[owner]) / pieces[owner]
+
+    lat = lat0[owner] * (1 - t) + lat1[owner] * t
+    lon = lon0[owner] * (1 - t) + lon1[owner] * t
+    return lat, lon, starts, pieces
+
+
+def compute_arc_elevation_metrics(snapshot: RoutingSnapshot,
+                                  dem: DEMRaster,
+                                  step_km: float = DEFAULT_SAMPLE_STEP_KM,
+                                  batch_arcs: int = DEFAULT_BATCH_ARCS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    모든 간선의 누적 상승 고도와 최대 경사를 계산합니다.
+    간선을 batch_arcs개씩 묶어 간선 좌표열 위의 샘플 좌표를 만들고 DEM을 한 번에 샘플링합니다.
+
+    Args:
+        snapshot: 경로 탐색 스냅샷
+        dem: DEM 래스터
+        step_km: 샘플 간격 (km)
+        batch_arcs: 한 번에 처리할 간선 수
+
+    Returns:
+        (간선별 상승 고도(m), 간선별 최대 오르막 경사(%)) - float32 배열
+    """
+    num_arcs = snapshot.num_arcs
+    climb = np.zeros(num_arcs, dtype=np.float32)
+    max_grade = np.zeros(num_arcs, dtype=np.float32)
+
+    for begin in range(0, num_arcs, batch_arcs):
+        arcs = np.arange(begin, min(begin + batch_arcs, num_arcs))
+        lat0, lon0, lat1, lon1, owner = arc_segments(snapshot, arcs)
+        length_km = haversine_km(lat0, lon0, lat1, lon1)
+        lat, lon, starts, pieces = segment_sample_points(lat0, lon0, lat1, lon1, length_km, step_km)
+        elevation = dem.sample(lat, lon)
+
+        # 인접 샘플 간 고도 차이 (구간 경계를 넘는 차이와 자료 없는 지점은 0으로 처리)
+        delta = np.nan_to_num(np.diff(elevation), nan=0.0)
+        delta[starts[1:] - 1] = 0.0
+        ascent = np.maximum(delta, 0.0)
+        segment_climb = np.add.reduceat(ascent, starts)
+
+        # 차이값별 소속 구간의 샘플 간격(m)으로 경사 계산
+        piece_m = length_km * 1000.0 / pieces
+        delta_owner = np.repeat(np.arange(len(pieces)), pieces + 1)[:-1]
+        grade = ascent / np.maximum(piece_m[delta_owner], 1e-6) * 100.0
+        segment_grade = np.maximum.reduceat(grade, starts)
+
+        # 구간 값을 간선 단위로 집계
+        climb[arcs] = np.bincount(owner, weights=segment_climb, minlength=len(arcs))
+        arc_grade = np.zeros(len(arcs), dtype=np.float64)
+        np.maximum.at(arc_grade, owner, segment_grade)
+        max_grade[arcs] = arc_grade
+
+    return climb, max_grade
+
+
+def attach_elevation_metrics(snapshot: RoutingSnapshot,
+                             dem: DEMRaster,
+                             preference: Optional[RoutePreference] = None,
+                             step_km: float = DEFAULT_SAMPLE_STEP_KM) -> None:
+    """
+    DEM으로 계산한 고도 메트릭을 스냅샷에 추가합니다.
+    "elevation" 메트릭은 거리 + elevation_weight * 상승 고도 환산 거리이며,
+    시간대별 프로필 커스터마이징의 기준 메트릭으로 사용할 수 있습니다.
+
+    Args:
+        snapshot: 경로 탐색 스냅샷
+        dem: DEM 래스터
+        preference: 사용자 경로 선호도 (elevation_weight 사용)
+        step_km: 샘플 간격 (km)
+    """
+    if preference is None:
+        preference = RoutePreference()
+
+    climb, max_grade = compute_arc_elevation_metrics(snapshot, dem, step_km)
+    distance = np.asarray(snapshot.metrics["distance"], dtype=np.float32)
+
+    snapshot.metrics[CLIMB_METRIC] = climb
+    snapshot.metrics[GRADE_METRIC] = max_grade
+    snapshot.metrics[ELEVATION_METRIC] = (
+        distance + preference.elevation_weight * climb * CLIMB_EQUIVALENT_KM_PER_M
+    ).astype(np.float32)
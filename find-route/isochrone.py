@@ -0,0 +1,78 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from snapshot import RoutingSnapshot
+
+
+def convex_hull(lon: np.ndarray, lat: np.ndarray) -> List[Tuple[float, float]]:
+    """
+    점들의 볼록 껍질을 구합니다 (Andrew monotone chain).
+
+    Args:
+        lon, lat: 경도/위도 배열
+
+    Returns:
+        반시계 방향으로 닫힌 (경도, 위도) 좌표열 (첫 점과 마지막 점이 같음)
+    """
+    points = np.unique(np.column_stack([lon, lat]), axis=0)
+    if len(points) <= 2:
+        ring = [(float(x), float(y)) for x, y in points]
+        return ring + ring[:1]
+
+    def cross(o, a, b) -> float:
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower: List[Tuple[float, float]] = []
+    for p in points.tolist():
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper: List[Tuple[float, float]] = []
+    for p in reversed(points.tolist()):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+
+    ring = [(float(x), float(y)) for x, y in lower[:-1] + upper[:-1]]
+    return ring + ring[:1]
+
+
+def compute_isochrones(snapshot: RoutingSnapshot,
+                       source: int,
+                       cutoffs: Sequence[float],
+                       weights: Optional[np.ndarray] = None,
+                       include_vertices: bool = False) -> List[Dict[str, Any]]:
+    """
+    한 정점에서 비용 cutoff 안에 도달할 수 있는 영역을 여러 cutoff에 대해 한 번의 탐색으로 계산합니다.
+    가장 큰 cutoff까지만 일대전체 탐색을 하고, 각 cutoff는 정점별 비용 배열을 거르기만 합니다.
+
+    Args:
+        snapshot: 경로 탐색 스냅샷
+        source: 시작 정점 인덱스
+        cutoffs: 비용 상한 목록 (weights 단위)
+        weights: 간선별 비용 배열 (기본값: "distance" 메트릭)
+        include_vertices: 결과에 도달 가능한 정점 좌표 포함 여부
+
+    Returns:
+        cutoff별 {"cutoff", "vertex_count", "polygon", ("vertices")} 목록 (cutoff 오름차순)
+    """
+    cutoffs = sorted(cutoffs)
+    dist, _ = snapshot.search(source, weights, cutoff=cutoffs[-1])
+    reached = np.flatnonzero(np.isfinite(dist))
+    reached_dist = dist[reached]
+    lon = np.asarray(snapshot.lon)[reached]
+    lat = np.asarray(snapshot.lat)[reached]
+
+    isochrones = []
+    for cutoff in cutoffs:
+        mask = reached_dist <= cutoff
+        isochrone = {
+            "cutoff": cutoff,
+            "vertex_count": int(mask.sum()),
+            "polygon": convex_hull(lon[mask], lat[mask]),
+        }
+        if include_vertices:
+            isochrone["vertices"] = np.column_stack([lon[mask], lat[mask]]).tolist()
+        isochrones.append(isochrone)
+    return isochrones
@@ -1,8 +1,19 @@
+import argparse
+import json
 import sys
+from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
+from batch import DEFAULT_CHUNK_SIZE, print_batch_report, run_batch
 from daejeonBike import DaejeonBikeAPI
 from cch import CustomizableContractionHierarchies, Graph, Vertex, Arc
+from elevation import DEMRaster, ELEVATION_METRIC, attach_elevation_metrics
+from profiles import DEFAULT_HOURLY_TRAFFIC_FACTORS, MetricProfiles, customize_profiles
+from route_metrics import customize_priority_metrics
+from simplify import compress_degree2_chains
+from snapshot import RoutingSnapshot
+from stations import StationTable
+from store import SnapshotStore
 
 
 def fetch_bike_routes(num_of_rows: int = 30) -> Optional[Dict]:
@@ -75,6 +86,71 @@ def preprocess_graph(graph: Graph) -> Optional[CustomizableContractionHierarchie
     return cch
 
 
+def build_routing_snapshot(graph: Graph,
+                           hourly_traffic_factors: Optional[List[float]] = None,
+                           dem: Optional[DEMRaster] = None,
+                           compress_chains: bool = True,
+                           output_dir: Optional[str] = None,
+                           stations: Optional[List[Dict]] = None) -> RoutingSnapshot:
+    """
+    그래프로부터 경로 탐색 스냅샷을 만들고 시간대별 프로필을 미리 커스터마이징합니다.
+    CCH 전처리가 그래프에 지름길을 추가하기 전에 호출해야 합니다.
+
+    Args:
+        graph: 원본 그래프
+        hourly_traffic_factors: 시간대별 교통량 계수 (기본값: DEFAULT_HOURLY_TRAFFIC_FACTORS)
+        dem: 고도 메트릭 계산에 사용할 DEM 래스터 (None이면 거리만 사용)
+        compress_chains: True면 차수 2 정점 체인을 간선 하나로 압축 (중간 정점은 좌표열로 보존)
+        output_dir: 스냅샷을 저장할 디렉터리 (None이면 저장하지 않음)
+        stations: 타슈 대여소 목록 [{"id", "latitude", "longitude"}, ...] (주어지면 대여소 간 거리표 계산)
+
+    Returns:
+        생성된 스냅샷
+    """
+    # 차수 2 정점 체인 압축
+    chains = None
+    if compress_chains:
+        graph, chains = compress_degree2_chains(graph)
+    snapshot = RoutingSnapshot.from_graph(graph, chains)
+
+    # 연결 요소 라벨링 (도달 불가능한 질의를 O(1)로 거절하기 위함)
+    snapshot.label_components()
+
+    # 고도 메트릭 계산 (DEM이 있는 경우 프로필의 기준 비용으로 사용)
+    base_metric = "distance"
+    if dem is not None:
+        attach_elevation_metrics(snapshot, dem)
+        base_metric = ELEVATION_METRIC
+
+    # 길안내 우선순위(RECOMMEND/SAFETY/DISTANCE)별 메트릭 커스터마이징
+    customize_priority_metrics(snapshot)
+
+    # 시간대별 프로필 커스터마이징
+    factors = hourly_traffic_factors or DEFAULT_HOURLY_TRAFFIC_FACTORS
+    profiles = customize_profiles(snapshot, factors, base_metric=base_metric)
+    profiles.attach(snapshot)
+
+    # 대여소 간 자전거 거리표 (타슈 복합 경로 탐색용)
+    if stations:
+        table = StationTable.build(
+            snapshot,
+            [station["id"] for station in stations],
+            [float(station["latitude"]) for station in stations],
+            [float(station["longitude"]) for station in stations],
+        )
+        table.attach(snapshot)
+        print(f"대여소 거리표 계산 완료: {len(table)}개 대여소")
+
+    print(f"스냅샷 생성 완료: {snapshot.num_vertices}개의 정점, {snapshot.num_arcs}개의 간선, "
+          f"{profiles.num_slots}개의 시간대 프로필")
+
+    if output_dir:
+        snapshot.save(output_dir)
+        print(f"스냅샷 저장 완료: {output_dir}")
+
+    return snapshot
+
+
 def dijkstra(graph: Graph, start_id: int, end_id: int) -> List[Arc]:
     """
     다익스트라 알고리즘을 사용하여 최단 경로를 찾습니다.
@@ -148,7 +224,8 @@ def dijkstra(graph: Graph, start_id: int, end_id: int) -> List[Arc]:
     return path
 
 
-def find_shortest_path(graph: Graph, cch: CustomizableContractionHierarchies, start_id: int, end_id: int) -> List[Arc]:
+def find_shortest_path(graph: Graph, cch: CustomizableContractionHierarchies, start_id: int, end_id: int,
+                       snapshot: Optional[RoutingSnapshot] = None) -> List[Arc]:
     """
     두 정점 간의 최단 경로를 찾습니다.
     CCH 알고리즘을 사용하고, 실패하면 다익스트라 알고리즘을 사용합니다.
@@ -158,12 +235,21 @@ def find_shortest_path(graph: Graph, cch: CustomizableContractionHierarchies, st
         cch: CCH 인스턴스
         start_id: 시작 정점 ID
         end_id: 도착 정점 ID
+        snapshot: 연결 요소 정보가 있는 스냅샷 (있으면 도달 불가능한 질의를 바로 거절)
         
     Returns:
         경로 (Arc 리스트)
     """
     path = []
     
+    # 서로 다른 연결 요소에 있으면 탐색하지 않음
+    if snapshot is not None:
+        source = snapshot.resolve_vertex(start_id)
+        target = snapshot.resolve_vertex(end_id, as_target=True)
+        if source is not None and target is not None and not snapshot.may_reach(source, target):
+            print(f"  {start_id}와(과) {end_id}는 서로 다른 연결 요소에 있어 도달할 수 없습니다.")
+            return path
+    
     # 직접 간선이 있는지 확인
     start_arc = graph.arcs.get((start_id, end_id))
     if start_arc:
@@ -457,6 +543,9 @@ def daejeon_bike_cch_example() -> Graph:
     # 3. 정점 정보 출력
     print_vertex_info(graph)
     
+    # 3-1. 경로 탐색 스냅샷 생성 (CCH 전처리가 지름길을 추가하기 전의 원본 그래프 사용)
+    snapshot = build_routing_snapshot(graph)
+    
     # 4. 그래프 전처리
     cch = preprocess_graph(graph)
     if not cch:
@@ -481,8 +570,16 @@ def daejeon_bike_cch_example() -> Graph:
         else:
             # 경로 계산
             print(f"\n{start_id}->{end_id} 경로 계산 중...")
-            path = find_shortest_path(graph, cch, start_id, end_id)
+            path = find_shortest_path(graph, cch, start_id, end_id, snapshot)
             print_path_info(path)
+            
+            # 현재 시간대 프로필로 계산한 비용
+            profiles = MetricProfiles.from_snapshot(snapshot)
+            route = profiles.route(snapshot, start_id, end_id, datetime.now())
+            if route:
+                print(f"현재 시간대 교통량 반영 비용: {route.cost:.2f}")
+            else:
+                print("  현재 시간대 프로필로 경로를 찾을 수 없습니다.")
     except ValueError:
         print("숫자를 입력해주세요.")
     except KeyboardInterrupt:
@@ -492,12 +589,85 @@ def daejeon_bike_cch_example() -> Graph:
     return graph
 
 
+def build_snapshot_command(output_dir: str,
+                           num_of_rows: int = 50,
+                           dem_path: Optional[str] = None,
+                           publish: bool = False,
+                           stations_path: Optional[str] = None) -> None:
+    """
+    자전거 도로 데이터로 스냅샷을 만들어 디렉터리에 저장합니다.
+
+    Args:
+        output_dir: 스냅샷을 저장할 디렉터리 (publish면 버전 저장소 디렉터리)
+        num_of_rows: 가져올 자전거 도로 데이터 개수
+        dem_path: DEM GeoTIFF 경로 (선택)
+        publish: True면 저장소에 새 버전으로 게시해 실행 중인 서버가 교체해 사용하도록 함
+        stations_path: 타슈 대여소 목록 JSON 파일 경로 (선택)
+    """
+    bike_routes = fetch_bike_routes(num_of_rows=num_of_rows)
+    if not bike_routes:
+        print("자전거 도로 데이터를 가져오는데 실패했습니다.")
+        print("예제 데이터를 사용하여 계속합니다.")
+        bike_routes = create_example_data()
+
+    graph = create_bike_route_graph(bike_routes)
+    dem = DEMRaster.open_geotiff(dem_path) if dem_path else None
+    stations = None
+    if stations_path:
+        with open(stations_path, encoding="utf-8") as f:
+            stations = json.load(f)
+    if publish:
+        snapshot = build_routing_snapshot(graph, dem=dem, stations=stations)
+        version = SnapshotStore(output_dir).publish(snapshot)
+        print(f"스냅샷 게시 완료: {output_dir} (버전 {version})")
+    else:
+        build_routing_snapshot(graph, dem=dem, output_dir=output_dir, stations=stations)
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """
+    명령행 인자를 해석합니다. 하위 명령이 없으면 대화형 예제를 실행합니다.
+    """
+    parser = argparse.ArgumentParser(description="대전광역시 자전거 도로 경로 탐색")
+    subparsers = parser.add_subparsers(dest="command")
+
+    build_parser = subparsers.add_parser("build", help="경로 탐색 스냅샷 생성")
+    build_parser.add_argument("--output", required=True, help="스냅샷 저장 디렉터리")
+    build_parser.add_argument("--rows", type=int, default=50, help="가져올 자전거 도로 데이터 개수")
+    build_parser.add_argument("--dem", help="DEM GeoTIFF 경로")
+    build_parser.add_argument("--publish", action="store_true",
+                              help="--output을 버전 저장소로 보고 새 버전으로 게시")
+    build_parser.add_argument("--stations", help="타슈 대여소 목록 JSON 파일 (id, latitude, longitude)")
+
+    batch_parser = subparsers.add_parser("batch", help="OD 쌍 파일 일괄 경로 계산")
+    batch_parser.add_argument("--snapshot", required=True, help="스냅샷 디렉터리")
+    batch_parser.add_argument("--input", required=True, help="OD 쌍 파일 (.csv 또는 .ndjson)")
+    batch_parser.add_argument("--output", required=True, help="결과 파일 (.csv 또는 .ndjson)")
+    batch_parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본값: CPU 수)")
+    batch_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="작업당 OD 쌍 수")
+    batch_parser.add_argument("--geometry", action="store_true", help="결과에 경로 좌표열 포함")
+
+    return parser.parse_args(argv)
+
+
 def main():
     """
     메인 함수
     """
-    print("대전광역시 자전거 도로 API와 CCH 알고리즘 예제 실행\n")
-    daejeon_bike_cch_example()
+    args = parse_args(sys.argv[1:])
+
+    if args.command == "build":
+        build_snapshot_command(args.output, num_of_rows=args.rows, dem_path=args.dem, publish=args.publish,
+                               stations_path=args.stations)
+    elif args.command == "batch":
+        report = run_batch(
+            args.snapshot, args.input, args.output,
+            workers=args.workers, chunk_size=args.chunk_size, include_geometry=args.geometry
+        )
+        print_batch_report(report)
+    else:
+        print("대전광역시 자전거 도로 API와 CCH 알고리즘 예제 실행\n")
+        daejeon_bike_cch_example()
 
 
 # 프로그램 시작점
@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from customer import RoutePreference
+from snapshot import Route, RoutingSnapshot
+
+# 스냅샷에 시간대별 메트릭을 저장할 때 사용하는 메트릭 이름
+PROFILE_METRIC = "traffic_profile"
+
+# uint16 양자화 시 사용할 수 있는 최대 값
+QUANTIZED_MAX = np.iinfo(np.uint16).max - 1
+
+MINUTES_PER_DAY = 24 * 60
+
+# 기본 시간대별(0~23시) 교통량 계수 - 출퇴근 시간대 혼잡 반영
+DEFAULT_HOURLY_TRAFFIC_FACTORS = [
+    1.0, 1.0, 1.0, 1.0, 1.0, 1.0,   # 0~5시
+    1.1, 1.5, 1.6, 1.3, 1.1, 1.1,   # 6~11시
+    1.2, 1.1, 1.1, 1.2, 1.3, 1.6,   # 12~17시
+    1.6, 1.4, 1.2, 1.1, 1.0, 1.0,   # 18~23시
+]
+
+
+@dataclass
+class MetricProfiles:
+    """
+    시간대별 메트릭 프로필
+
+    하루를 slot_minutes 단위 구간(예: 60분 -> 24개, 15분 -> 96개)으로 나누고,
+    구간마다 미리 커스터마이징된 간선 비용 벡터를 (구간 수, 간선 수) 행렬로 보관합니다.
+    weights가 uint16이면 양자화된 값이며, 실제 비용은 값 * scale 입니다.
+    """
+    weights: np.ndarray
+    slot_minutes: int = 60
+    scale: float = 1.0
+
+    @property
+    def num_slots(self) -> int:
+        return self.weights.shape[0]
+
+    @property
+    def quantized(self) -> bool:
+        return self.weights.dtype == np.uint16
+
+    def slot_of(self, departure: datetime) -> int:
+        """
+        출발 시각에 해당하는 프로필 구간 번호를 반환합니다.
+
+        Args:
+            departure: 출발 시각
+
+        Returns:
+            프로필 구간 번호
+        """
+        return (departure.hour * 60 + departure.minute) // self.slot_minutes % self.num_slots
+
+    def weights_at(self, departure: datetime) -> np.ndarray:
+        """
+        출발 시각에 해당하는 간선 비용 벡터를 반환합니다 (복사 없이 행 뷰만 반환).
+
+        Args:
+            departure: 출발 시각
+
+        Returns:
+            간선별 비용 배열
+        """
+        return self.weights[self.slot_of(departure)]
+
+    def route(self,
+              snapshot: RoutingSnapshot,
+              source_id: int,
+              target_id: int,
+              departure: datetime) -> Optional[Route]:
+        """
+        출발 시각의 프로필로 최단 경로를 찾습니다.
+        양자화된 프로필은 정수 단위로 탐색한 뒤 결과 비용에만 scale을 곱합니다.
+
+        Args:
+            snapshot: 경로 탐색 스냅샷
+            source_id: 시작 정점 ID
+            target_id: 도착 정점 ID
+            departure: 출발 시각
+
+        Returns:
+            경로 또는 None (경로가 없는 경우)
+        """
+        route = snapshot.shortest_path(source_id, target_id, self.weights_at(departure))
+        if route is not None and self.quantized:
+            route.cost *= self.scale
+        return route
+
+    def attach(self, snapshot: RoutingSnapshot) -> None:
+        """
+        프로필을 스냅샷 메트릭으로 등록합니다 (스냅샷과 함께 저장됨).
+
+        Args:
+            snapshot: 대상 스냅샷
+        """
+        snapshot.metrics[PROFILE_METRIC] = self.weights
+        snapshot.meta[PROFILE_METRIC] = {
+            "slot_minutes": self.slot_minutes,
+            "scale": self.scale,
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: RoutingSnapshot) -> Optional["MetricProfiles"]:
+        """
+        스냅샷에 저장된 프로필을 불러옵니다.
+
+        Args:
+            snapshot: 스냅샷
+
+        Returns:
+            프로필 또는 None (저장된 프로필이 없는 경우)
+        """
+        if PROFILE_METRIC not in snapshot.metrics:
+            return None
+        config = snapshot.meta.get(PROFILE_METRIC, {})
+        return cls(
+            weights=snapshot.metrics[PROFILE_METRIC],
+            slot_minutes=config.get("slot_minutes", 60),
+            scale=config.get("scale", 1.0),
+        )
+
+
+def customize_profiles(snapshot: RoutingSnapshot,
+                       traffic_factors: Union[Sequence[float], np.ndarray],
+                       preference: Optional[RoutePreference] = None,
+                       base_metric: str = "distance",
+                       quantize: bool = False) -> MetricProfiles:
+    """
+    시간대별 교통량 계수로 모든 프로필을 미리 커스터마이징합니다.
+
+    구간 s, 간선 a의 비용은 base[a] * (1 + traffic_weight * (factor[s, a] - 1)) 입니다.
+    계수 1.0은 한산한 상태를 뜻하며, 클수록 혼잡합니다.
+
+    Args:
+        snapshot: 경로 탐색 스냅샷
+        traffic_factors: 구간별 교통량 계수. (구간 수,) 이면 모든 간선에 같은 계수를,
+            (구간 수, 간선 수) 이면 간선별 계수를 적용
+        preference: 사용자 경로 선호도 (traffic_weight 사용)
+        base_metric: 기준 비용 메트릭 이름
+        quantize: True면 uint16으로 양자화하여 저장
+
+    Returns:
+        커스터마이징된 프로필
+    """
+    if preference is None:
+        preference = RoutePreference()
+
+    factors = np.asarray(traffic_factors, dtype=np.float32)
+    if factors.ndim == 1:
+        factors = factors[:, np.newaxis]
+    num_slots = factors.shape[0]
+    if MINUTES_PER_DAY % num_slots != 0:
+        raise ValueError(f"하루를 {num_slots}개 구간으로 나눌 수 없습니다.")
+
+    base = np.asarray(snapshot.metrics[base_metric], dtype=np.float32)
+    weights = base[np.newaxis, :] * (1.0 + preference.traffic_weight * (factors - 1.0))
+    weights = np.maximum(weights, 0.0).astype(np.float32)
+
+    scale = 1.0
+    if quantize:
+        max_cost = float(weights.max()) if weights.size else 0.0
+        scale = max_cost / QUANTIZED_MAX if max_cost > 0 else 1.0
+        quantized = np.rint(weights / scale).astype(np.uint16)
+        # 비용이 있는 간선이 0으로 반올림되지 않도록 최소 1 단위 유지
+        quantized[(quantized == 0) & (weights > 0)] = 1
+        weights = quantized
+
+    return MetricProfiles(
+        weights=weights,
+        slot_minutes=MINUTES_PER_DAY // num_slots,
+        scale=scale,
+    )
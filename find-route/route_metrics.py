@@ -0,0 +1,43 @@
+import numpy as np
+
+from elevation import ELEVATION_METRIC
+from snapshot import ROAD_CLASS, RoutingSnapshot
+
+# 평균 자전거 주행 속도 (km/h)
+BIKE_SPEED_KMH = 15.0
+
+# 평균 보행 속도 (km/h)
+WALK_SPEED_KMH = 4.5
+
+# 길안내 우선순위 -> 스냅샷 메트릭 이름
+PRIORITY_METRICS = {
+    "RECOMMEND": "recommend",
+    "SAFETY": "safety",
+    "DISTANCE": "distance",
+}
+
+# 안전 우선 메트릭에서 자전거 도로가 아닌 연결 간선에 붙는 추가 비용 비율
+SAFETY_LINK_PENALTY = 1.0
+
+# 추천 메트릭에서 연결 간선에 붙는 추가 비용 비율
+RECOMMEND_LINK_PENALTY = 0.3
+
+
+def customize_priority_metrics(snapshot: RoutingSnapshot) -> None:
+    """
+    길안내 우선순위(RECOMMEND/SAFETY/DISTANCE)별 메트릭을 미리 커스터마이징해 스냅샷에 추가합니다.
+
+    - DISTANCE: 거리 그대로 사용
+    - SAFETY: 자전거 도로가 아닌 연결 간선의 비용을 (1 + SAFETY_LINK_PENALTY)배
+    - RECOMMEND: 고도 메트릭(있으면) 또는 거리에 연결 간선 추가 비용을 (1 + RECOMMEND_LINK_PENALTY)배
+
+    Args:
+        snapshot: 경로 탐색 스냅샷 (고도 메트릭은 이 함수 호출 전에 계산되어 있어야 함)
+    """
+    distance = np.asarray(snapshot.metrics["distance"], dtype=np.float32)
+    is_link = np.asarray(snapshot.extras.get(ROAD_CLASS, np.zeros(len(distance), dtype=np.uint8)),
+                         dtype=np.float32)
+
+    base = np.asarray(snapshot.metrics.get(ELEVATION_METRIC, distance), dtype=np.float32)
+    snapshot.metrics["safety"] = (distance * (1.0 + SAFETY_LINK_PENALTY * is_link)).astype(np.float32)
+    snapshot.metrics["recommend"] = (base * (1.0 + RECOMMEND_LINK_PENALTY * is_link)).astype(np.float32)
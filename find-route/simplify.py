@@ -0,0 +1,146 @@
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from cch import Graph, Vertex, Arc
+
+
+def _is_chain_vertex(out_neighbors: Set[int], in_neighbors: Set[int]) -> bool:
+    """
+    경로 중간에서 제거할 수 있는 차수 2 정점인지 확인합니다.
+    양방향 통과 정점(a <-> v <-> b) 또는 단방향 통과 정점(a -> v -> b)이 대상입니다.
+    """
+    if len(out_neighbors | in_neighbors) != 2:
+        return False
+    if out_neighbors == in_neighbors:
+        return True
+    return len(out_neighbors) == 1 and len(in_neighbors) == 1
+
+
+def compress_degree2_chains(graph: Graph) -> Tuple[Graph, Dict[Tuple[int, int], List[Vertex]]]:
+    """
+    차수 2 정점으로 이어진 체인을 하나의 간선으로 압축합니다.
+    CCH 전처리, 커스터마이징, 질의 비용은 모두 남은 정점 수에 비례하므로
+    스냅샷 생성 전에 적용합니다.
+
+    같은 두 정점을 잇는 평행 체인과 남은 정점이 없는 순환은 가운데 정점을 기준점으로 남겨 나누므로,
+    제거된 정점은 모두 남은 압축 간선의 중간 정점이 됩니다 (중간 정점 테이블로 ID를 찾을 수 있음).
+
+    Args:
+        graph: 원본 그래프 (CCH 전처리 이전)
+
+    Returns:
+        (압축된 그래프, 압축된 간선 (출발 ID, 도착 ID) -> 중간 정점 목록)
+    """
+    out_neighbors: Dict[int, Set[int]] = defaultdict(set)
+    in_neighbors: Dict[int, Set[int]] = defaultdict(set)
+    for (src, dst) in graph.arcs:
+        if src != dst:
+            out_neighbors[src].add(dst)
+            in_neighbors[dst].add(src)
+
+    keep = {
+        vertex_id for vertex_id in graph.vertices
+        if not _is_chain_vertex(out_neighbors[vertex_id], in_neighbors[vertex_id])
+    }
+
+    # 제거한 정점은 모두 남은 간선 하나의 중간 정점이어야 ID로 찾을 수 있으므로,
+    # 어느 간선에도 속하지 않은 체인(남은 정점이 없는 순환, 버린 평행 체인과 자기 루프)마다
+    # 가운데 정점 하나를 기준점으로 남기고 다시 압축
+    while True:
+        compressed, chains = _compress(graph, keep, out_neighbors)
+        covered = {v.id for interior in chains.values() for v in interior}
+        uncovered = set(graph.vertices) - keep - covered
+        if not uncovered:
+            break
+        keep.update(_chain_anchors(uncovered, out_neighbors, in_neighbors))
+
+    removed = len(graph.vertices) - len(compressed.vertices)
+    print(f"체인 압축 완료: 정점 {len(graph.vertices)}개 -> {len(compressed.vertices)}개 "
+          f"({removed}개 제거), 간선 {len(graph.arcs)}개 -> {len(compressed.arcs)}개")
+    return compressed, chains
+
+
+def _chain_anchors(uncovered: Set[int],
+                   out_neighbors: Dict[int, Set[int]],
+                   in_neighbors: Dict[int, Set[int]]) -> List[int]:
+    """
+    간선에 속하지 않은 차수 2 정점들을 이어진 체인별로 묶어, 체인마다 가운데 정점 하나를 반환합니다.
+    가운데 정점을 남기면 순환은 두 체인으로, 버려진 평행 체인은 끝점이 다른 체인으로 나뉩니다.
+    """
+    def neighbors(vertex_id: int) -> Set[int]:
+        return (out_neighbors[vertex_id] | in_neighbors[vertex_id]) & uncovered
+
+    anchors = []
+    seen: Set[int] = set()
+    for vertex_id in uncovered:
+        if vertex_id in seen:
+            continue
+        # 이어진 정점 묶음을 모은 뒤 체인 끝(묶음 안 이웃이 하나 이하)에서부터 순서대로 나열 (순환이면 아무 정점부터)
+        group = {vertex_id}
+        stack = [vertex_id]
+        while stack:
+            for next_id in neighbors(stack.pop()) - group:
+                group.add(next_id)
+                stack.append(next_id)
+        seen |= group
+        start = next((v for v in group if len(neighbors(v)) < 2), vertex_id)
+        run = [start]
+        visited = {start}
+        while True:
+            nexts = neighbors(run[-1]) - visited
+            if not nexts:
+                break
+            run.append(min(nexts))
+            visited.add(run[-1])
+        anchors.append(run[len(run) // 2])
+    return anchors
+
+
+def _compress(graph: Graph,
+              keep: Set[int],
+              out_neighbors: Dict[int, Set[int]]) -> Tuple[Graph, Dict[Tuple[int, int], List[Vertex]]]:
+    """
+    남길 정점(keep) 사이의 체인을 따라가 압축된 그래프를 만듭니다.
+    같은 두 정점을 잇는 체인이 여러 개면 비용이 가장 작은 체인만 남기며,
+    출발 정점으로 되돌아오는 체인(자기 루프)은 버립니다.
+    """
+    compressed = Graph()
+    for vertex_id in keep:
+        compressed.add_vertex(graph.vertices[vertex_id])
+
+    chains: Dict[Tuple[int, int], List[Vertex]] = {}
+    for start_id in keep:
+        for first_id in out_neighbors[start_id]:
+            interior: List[Vertex] = []
+            cost = graph.arcs[(start_id, first_id)].cost
+            kind = graph.arcs[(start_id, first_id)].kind
+            prev_id, current_id = start_id, first_id
+
+            # 남길 정점을 만날 때까지 체인을 따라감
+            while current_id not in keep:
+                interior.append(graph.vertices[current_id])
+                candidates = out_neighbors[current_id] - {prev_id}
+                if len(candidates) != 1 or len(interior) > len(graph.vertices):
+                    break
+                next_id = next(iter(candidates))
+                cost += graph.arcs[(current_id, next_id)].cost
+                # 연결 간선이 하나라도 섞이면 압축된 간선도 연결 간선으로 취급
+                if graph.arcs[(current_id, next_id)].kind != "road":
+                    kind = "link"
+                prev_id, current_id = current_id, next_id
+
+            if current_id not in keep or current_id == start_id:
+                continue
+
+            key = (start_id, current_id)
+            existing = compressed.arcs.get(key)
+            if existing is not None and existing.cost <= cost:
+                continue
+
+            compressed.add_arc(Arc(graph.vertices[start_id], graph.vertices[current_id], cost, kind))
+            if interior:
+                chains[key] = interior
+            else:
+                chains.pop(key, None)
+
+    return compressed, chains
@@ -0,0 +1,798 @@
+import heapq
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from cch import Graph, Vertex
+
+# 스냅샷 디렉터리 형식 버전
+SNAPSHOT_FORMAT_VERSION = 1
+
+# 스냅샷 메타데이터 파일 이름
+META_FILE = "meta.json"
+
+# 압축된 간선의 중간 정점 테이블 (간선 순서의 CSR 형태)
+GEOMETRY_OFFSETS = "geom_offsets"
+GEOMETRY_VERTEX_IDS = "geom_vertex_ids"
+GEOMETRY_LAT = "geom_lat"
+GEOMETRY_LON = "geom_lon"
+
+# 간선별 도로 종류 (0: 자전거 도로, 1: 연결 간선)
+ROAD_CLASS = "road_class"
+
+# 정점별 연결 요소 ID (크기 내림차순으로 번호를 매겨 0이 가장 큰 요소)
+STRONG_COMPONENT = "strong_component"
+WEAK_COMPONENT = "weak_component"
+
+
+# 지구 반경 (km)
+EARTH_RADIUS_KM = 6371.0
+
+# 탐색 중 제한 시각을 확인하는 간격 (꺼낸 정점 수)
+DEADLINE_CHECK_INTERVAL = 1024
+
+# 현재 질의의 제한 시각 (time.time() 기준, None이면 제한 없음)
+_deadline: Optional[float] = None
+
+
+class SearchTimeout(Exception):
+    """탐색이 제한 시각을 넘긴 경우"""
+
+
+@contextmanager
+def search_deadline(deadline: Optional[float]):
+    """
+    블록 안에서 실행하는 탐색(shortest_path, search)이 deadline(time.time() 기준)을 넘기면
+    SearchTimeout을 발생시켜 멈추게 합니다 (질의를 한 번에 하나씩 처리하는 작업 프로세스용).
+
+    Args:
+        deadline: 제한 시각 (None이면 제한 없음)
+    """
+    global _deadline
+    previous = _deadline
+    _deadline = deadline
+    try:
+        yield
+    finally:
+        _deadline = previous
+
+
+def _check_deadline(deadline: Optional[float], popped: int) -> None:
+    if deadline is not None and popped % DEADLINE_CHECK_INTERVAL == 0 and time.time() > deadline:
+        raise SearchTimeout("탐색 제한 시간을 넘겼습니다")
+
+
+def haversine_km(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    두 지점 배열 간의 거리를 계산합니다 (Haversine 공식, 벡터화).
+
+    Args:
+        lat1, lon1: 첫 번째 지점들의 위도/경도
+        lat2, lon2: 두 번째 지점들의 위도/경도
+
+    Returns:
+        거리 배열 (km)
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(a, dtype=np.float64)) for a in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def strongly_connected_components(offsets: np.ndarray, heads: np.ndarray) -> np.ndarray:
+    """
+    강연결요소를 계산합니다 (반복형 Tarjan 알고리즘, O(n + m)).
+
+    Args:
+        offsets: CSR 오프셋
+        heads: 간선 도착 정점 인덱스
+
+    Returns:
+        정점별 강연결요소 ID (크기 내림차순 번호)
+    """
+    n = len(offsets) - 1
+    offsets = offsets.tolist()
+    heads = heads.tolist()
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    labels = [-1] * n
+    stack: List[int] = []
+    counter = 0
+    num_components = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        # (정점, 다음에 볼 간선 위치) 호출 스택
+        call_stack = [(root, offsets[root])]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+
+        while call_stack:
+            u, e = call_stack[-1]
+            if e < offsets[u + 1]:
+                call_stack[-1] = (u, e + 1)
+                v = heads[e]
+                if index[v] == -1:
+                    index[v] = low[v] = counter
+                    counter += 1
+                    stack.append(v)
+                    on_stack[v] = True
+                    call_stack.append((v, offsets[v]))
+                elif on_stack[v]:
+                    low[u] = min(low[u], index[v])
+                continue
+
+            call_stack.pop()
+            if call_stack:
+                parent = call_stack[-1][0]
+                low[parent] = min(low[parent], low[u])
+            if low[u] == index[u]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    labels[w] = num_components
+                    if w == u:
+                        break
+                num_components += 1
+
+    return _relabel_by_size(np.array(labels, dtype=np.int32))
+
+
+def weakly_connected_components(offsets: np.ndarray, heads: np.ndarray) -> np.ndarray:
+    """
+    간선 방향을 무시한 연결 요소를 계산합니다 (Union-Find).
+
+    Args:
+        offsets: CSR 오프셋
+        heads: 간선 도착 정점 인덱스
+
+    Returns:
+        정점별 연결 요소 ID (크기 내림차순 번호)
+    """
+    n = len(offsets) - 1
+    parent = list(range(n))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    tails = np.repeat(np.arange(n), np.diff(offsets)).tolist()
+    for u, v in zip(tails, heads.tolist()):
+        ru, rv = find(u), find(v)
+        if ru != rv:
+            parent[ru] = rv
+
+    roots = np.array([find(x) for x in range(n)], dtype=np.int64)
+    return _relabel_by_size(np.unique(roots, return_inverse=True)[1].astype(np.int32))
+
+
+def _relabel_by_size(labels: np.ndarray) -> np.ndarray:
+    """
+    연결 요소 ID를 크기 내림차순(0이 가장 큰 요소)으로 다시 매깁니다.
+    """
+    if len(labels) == 0:
+        return labels
+    sizes = np.bincount(labels)
+    order = np.argsort(-sizes, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return rank[labels].astype(np.int32)
+
+
+@dataclass
+class Route:
+    """
+    스냅샷 위에서 계산된 경로
+    """
+    cost: float          # 경로 비용 (메트릭 단위)
+    vertices: List[int]  # 경유 정점 ID 목록
+    arcs: List[int]      # 경유 간선 인덱스 목록 (스냅샷 간선 순서)
+
+
+class RoutingSnapshot:
+    """
+    경로 탐색용 그래프의 압축 배열(CSR) 표현
+
+    정점은 ID 오름차순으로 0..n-1 인덱스를 가지며, 간선은 출발 정점 순으로 정렬되어
+    offsets[i]..offsets[i+1] 구간이 정점 i의 나가는 간선입니다.
+    간선별 비용은 이름이 붙은 메트릭 배열(metrics)로 보관되며, 2차원 메트릭은
+    (프로필 수, 간선 수) 형태로 시간대별 비용 등을 담습니다.
+    디스크에는 배열별 .npy 파일로 저장되어 메모리 매핑으로 불러올 수 있습니다.
+    """
+
+    def __init__(self,
+                 vertex_ids: np.ndarray,
+                 lat: np.ndarray,
+                 lon: np.ndarray,
+                 offsets: np.ndarray,
+                 heads: np.ndarray,
+                 metrics: Optional[Dict[str, np.ndarray]] = None,
+                 extras: Optional[Dict[str, np.ndarray]] = None,
+                 meta: Optional[Dict[str, Any]] = None):
+        """
+        RoutingSnapshot 초기화
+
+        Args:
+            vertex_ids: 정점 ID (오름차순, 길이 n)
+            lat, lon: 정점 위도/경도 (길이 n)
+            offsets: CSR 오프셋 (길이 n+1)
+            heads: 간선 도착 정점 인덱스 (길이 m)
+            metrics: 메트릭 이름 -> 간선별 비용 배열
+            extras: 그 밖의 부가 배열 (정점/간선 속성 등)
+            meta: 메트릭 설정 등 JSON으로 저장되는 부가 정보
+        """
+        self.vertex_ids = vertex_ids
+        self.lat = lat
+        self.lon = lon
+        self.offsets = offsets
+        self.heads = heads
+        self.metrics: Dict[str, np.ndarray] = metrics or {}
+        self.extras: Dict[str, np.ndarray] = extras or {}
+        self.meta: Dict[str, Any] = meta or {}
+        self._spatial_index = None
+        self._reverse = None
+        self._interior = None
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.vertex_ids)
+
+    @property
+    def num_arcs(self) -> int:
+        return len(self.heads)
+
+    @classmethod
+    def from_graph(cls,
+                   graph: Graph,
+                   chains: Optional[Dict[Tuple[int, int], List[Vertex]]] = None) -> "RoutingSnapshot":
+        """
+        Graph 객체로부터 스냅샷을 생성합니다.
+        CCH 전처리로 추가되는 지름길이 섞이지 않도록 전처리 이전의 원본 그래프를 사용해야 합니다.
+
+        Args:
+            graph: 원본 그래프 (또는 체인 압축된 그래프)
+            chains: 압축된 간선 (출발 ID, 도착 ID) -> 중간 정점 목록.
+                주어지면 간선 순서의 중간 정점 테이블을 extras에 저장합니다.
+
+        Returns:
+            생성된 스냅샷 ("distance" 메트릭 포함)
+        """
+        vertex_ids = np.array(sorted(graph.vertices), dtype=np.int64)
+        lat = np.array([graph.vertices[v].lat for v in vertex_ids], dtype=np.float64)
+        lon = np.array([graph.vertices[v].lon for v in vertex_ids], dtype=np.float64)
+
+        # 비용이 유한한 간선만 출발 정점 순으로 정렬
+        arcs = [
+            (src, dst, arc.cost, arc.kind) for (src, dst), arc in graph.arcs.items()
+            if arc.cost != float('inf')
+        ]
+        tails = np.searchsorted(vertex_ids, np.array([a[0] for a in arcs], dtype=np.int64))
+        heads = np.searchsorted(vertex_ids, np.array([a[1] for a in arcs], dtype=np.int64))
+        costs = np.array([a[2] for a in arcs], dtype=np.float32)
+        road_class = np.array([a[3] != "road" for a in arcs], dtype=np.uint8)
+
+        order = np.argsort(tails, kind="stable")
+        tails = tails[order]
+        offsets = np.zeros(len(vertex_ids) + 1, dtype=np.int64)
+        np.add.at(offsets, tails + 1, 1)
+        np.cumsum(offsets, out=offsets)
+
+        extras = {ROAD_CLASS: road_class[order]}
+        if chains:
+            # 간선 순서대로 중간 정점을 하나의 배열에 이어 붙임
+            interiors = [chains.get(arcs[i][:2], []) for i in order]
+            geom_offsets = np.zeros(len(arcs) + 1, dtype=np.int64)
+            geom_offsets[1:] = np.cumsum([len(chain) for chain in interiors])
+            points = [v for chain in interiors for v in chain]
+            extras.update({
+                GEOMETRY_OFFSETS: geom_offsets,
+                GEOMETRY_VERTEX_IDS: np.array([v.id for v in points], dtype=np.int64),
+                GEOMETRY_LAT: np.array([v.lat for v in points], dtype=np.float64),
+                GEOMETRY_LON: np.array([v.lon for v in points], dtype=np.float64),
+            })
+
+        return cls(
+            vertex_ids=vertex_ids,
+            lat=lat,
+            lon=lon,
+            offsets=offsets,
+            heads=heads[order].astype(np.int32),
+            metrics={"distance": costs[order]},
+            extras=extras,
+        )
+
+    def index_of(self, vertex_id: int) -> Optional[int]:
+        """
+        정점 ID에 해당하는 스냅샷 인덱스를 반환합니다.
+
+        Args:
+            vertex_id: 정점 ID
+
+        Returns:
+            정점 인덱스 또는 None (없는 경우)
+        """
+        i = int(np.searchsorted(self.vertex_ids, vertex_id))
+        if i < self.num_vertices and self.vertex_ids[i] == vertex_id:
+            return i
+        return None
+
+    def arc_tails(self) -> np.ndarray:
+        """
+        간선별 출발 정점 인덱스 배열을 반환합니다.
+        """
+        return np.repeat(np.arange(self.num_vertices, dtype=np.int32), np.diff(self.offsets))
+
+    def reverse_arcs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        도착 정점 순으로 정렬한 역방향 CSR을 반환합니다 (처음 호출할 때 한 번만 생성).
+        정점 i로 들어오는 간선은 arcs[offsets[i]:offsets[i+1]]이고, 각 간선의 출발 정점은 tails의 같은 위치입니다.
+
+        Returns:
+            (offsets, tails, arcs)
+        """
+        if self._reverse is None:
+            arcs = np.argsort(np.asarray(self.heads), kind="stable")
+            offsets = np.zeros(self.num_vertices + 1, dtype=np.int64)
+            np.cumsum(np.bincount(np.asarray(self.heads), minlength=self.num_vertices), out=offsets[1:])
+            self._reverse = (offsets, self.arc_tails()[arcs], arcs)
+        return self._reverse
+
+    def has_geometry(self) -> bool:
+        return GEOMETRY_OFFSETS in self.extras
+
+    def arc_interior(self, arc: int) -> slice:
+        """
+        간선의 중간 정점이 중간 정점 테이블에서 차지하는 구간을 반환합니다.
+
+        Args:
+            arc: 간선 인덱스
+
+        Returns:
+            중간 정점 테이블의 slice (압축되지 않은 간선이면 빈 구간)
+        """
+        if not self.has_geometry():
+            return slice(0, 0)
+        geom_offsets = self.extras[GEOMETRY_OFFSETS]
+        return slice(int(geom_offsets[arc]), int(geom_offsets[arc + 1]))
+
+    def interior_positions(self, vertex_id: int) -> List[Tuple[int, float]]:
+        """
+        체인 압축으로 제거된 정점이 놓인 압축 간선과 그 간선 위의 위치를 반환합니다.
+        (처음 호출할 때 중간 정점 ID 색인을 한 번만 생성)
+
+        Args:
+            vertex_id: 정점 ID
+
+        Returns:
+            (간선 인덱스, 간선 출발 정점에서부터의 거리 비율 0~1) 목록
+            (양방향 체인이면 방향별로 하나씩, 중간 정점이 아니면 빈 목록)
+        """
+        if not self.has_geometry():
+            return []
+        if self._interior is None:
+            order = np.argsort(np.asarray(self.extras[GEOMETRY_VERTEX_IDS]), kind="stable")
+            self._interior = (np.asarray(self.extras[GEOMETRY_VERTEX_IDS])[order], order)
+        sorted_ids, order = self._interior
+        lo = int(np.searchsorted(sorted_ids, vertex_id, side="left"))
+        hi = int(np.searchsorted(sorted_ids, vertex_id, side="right"))
+
+        geom_offsets = self.extras[GEOMETRY_OFFSETS]
+        positions = []
+        for position in order[lo:hi].tolist():
+            # 중간 정점이 있는 간선 중 position을 포함하는 간선
+            e = int(np.searchsorted(geom_offsets, position, side="right")) - 1
+            interior = self.arc_interior(e)
+            tail = int(np.searchsorted(self.offsets, e, side="right")) - 1
+            head = int(self.heads[e])
+            lat = np.concatenate([[self.lat[tail]], self.extras[GEOMETRY_LAT][interior], [self.lat[head]]])
+            lon = np.concatenate([[self.lon[tail]], self.extras[GEOMETRY_LON][interior], [self.lon[head]]])
+            lengths = np.cumsum(haversine_km(lat[:-1], lon[:-1], lat[1:], lon[1:]))
+            k = position - interior.start
+            if lengths[-1] > 0:
+                fraction = float(lengths[k] / lengths[-1])
+            else:
+                fraction = (k + 1) / (len(lengths))
+            positions.append((e, fraction))
+        return positions
+
+    def resolve_vertex(self, vertex_id: int, as_target: bool = False) -> Optional[int]:
+        """
+        정점 ID를 탐색에 쓸 정점 인덱스로 바꿉니다.
+        체인 압축으로 제거된 정점이면 그 정점이 놓인 압축 간선을 따라 가장 가까운 남은 정점으로 옮깁니다
+        (출발지면 간선 방향으로 나아가 만나는 도착 정점, 도착지면 간선의 출발 정점).
+
+        Args:
+            vertex_id: 정점 ID
+            as_target: 도착지로 쓸 정점이면 True
+
+        Returns:
+            정점 인덱스 또는 None (스냅샷에 없는 정점)
+        """
+        i = self.index_of(vertex_id)
+        if i is not None:
+            return i
+        best = None
+        for e, fraction in self.interior_positions(vertex_id):
+            if as_target:
+                candidate = (fraction, int(np.searchsorted(self.offsets, e, side="right")) - 1)
+            else:
+                candidate = (1.0 - fraction, int(self.heads[e]))
+            if best is None or candidate < best:
+                best = candidate
+        return best[1] if best is not None else None
+
+    def expand_vertices(self, route: Route) -> List[int]:
+        """
+        압축된 간선의 중간 정점까지 포함한 전체 정점 ID 경로를 반환합니다.
+
+        Args:
+            route: 경로
+
+        Returns:
+            정점 ID 목록
+        """
+        if not self.has_geometry():
+            return list(route.vertices)
+        geom_ids = self.extras[GEOMETRY_VERTEX_IDS]
+        vertices = route.vertices[:1]
+        for e, head in zip(route.arcs, route.vertices[1:]):
+            vertices.extend(int(v) for v in geom_ids[self.arc_interior(e)])
+            vertices.append(head)
+        return vertices
+
+    def route_geometry(self, route: Route) -> List[Tuple[float, float]]:
+        """
+        경로의 전체 좌표열을 반환합니다 (압축된 간선의 중간 정점 포함).
+
+        Args:
+            route: 경로
+
+        Returns:
+            (위도, 경도) 목록
+        """
+        if not route.vertices:
+            return []
+        source = self.index_of(route.vertices[0])
+        points = [(float(self.lat[source]), float(self.lon[source]))]
+        for e in route.arcs:
+            if self.has_geometry():
+                interior = self.arc_interior(e)
+                points.extend(zip(self.extras[GEOMETRY_LAT][interior].tolist(),
+                                  self.extras[GEOMETRY_LON][interior].tolist()))
+            head = self.heads[e]
+            points.append((float(self.lat[head]), float(self.lon[head])))
+        return points
+
+    def label_components(self) -> None:
+        """
+        강연결요소와 약연결요소를 계산해 extras에 저장합니다 (스냅샷 생성 시 1회).
+        """
+        self.extras[STRONG_COMPONENT] = strongly_connected_components(self.offsets, self.heads)
+        self.extras[WEAK_COMPONENT] = weakly_connected_components(self.offsets, self.heads)
+
+    def may_reach(self, source: int, target: int) -> bool:
+        """
+        source에서 target으로 갈 수 있는지 O(1)로 판정합니다.
+        False면 확실히 도달할 수 없고, True면 탐색이 필요합니다.
+        (같은 강연결요소면 항상 도달 가능하며, 약연결요소가 다르면 항상 도달 불가)
+
+        Args:
+            source: 시작 정점 인덱스
+            target: 도착 정점 인덱스
+
+        Returns:
+            도달 가능성 여부
+        """
+        weak = self.extras.get(WEAK_COMPONENT)
+        if weak is None:
+            return True
+        return weak[source] == weak[target]
+
+    def spatial_index(self):
+        """
+        정점/간선 좌표 색인을 반환합니다 (처음 호출할 때 한 번만 생성).
+
+        Returns:
+            SpatialIndex
+        """
+        if self._spatial_index is None:
+            # spatial 모듈이 이 모듈을 가져오므로 순환 참조를 피하기 위해 여기서 가져옴
+            from spatial import SpatialIndex
+            self._spatial_index = SpatialIndex.from_snapshot(self)
+        return self._spatial_index
+
+    def nearest_vertices(self, lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+        """
+        여러 지점 각각에서 가장 가까운 정점을 한 번에 찾습니다 (격자 색인 사용).
+
+        Args:
+            lat, lon: 위도/경도 배열
+
+        Returns:
+            정점 ID 배열
+        """
+        nearest, _ = self.spatial_index().nearest_vertices(lat, lon, k=1)
+        return np.asarray(self.vertex_ids)[nearest[:, 0]]
+
+    def snap_to_largest_component(self, vertex_id: int) -> int:
+        """
+        정점이 가장 큰 강연결요소 밖에 있으면 그 요소 안의 가장 가까운 정점으로 옮깁니다.
+        가장 큰 강연결요소 안의 정점끼리는 항상 서로 도달할 수 있습니다.
+
+        Args:
+            vertex_id: 정점 ID
+
+        Returns:
+            가장 큰 강연결요소에 속한 정점 ID
+        """
+        strong = self.extras.get(STRONG_COMPONENT)
+        i = self.index_of(vertex_id)
+        if strong is None or i is None or strong[i] == 0:
+            return vertex_id
+        members = np.flatnonzero(strong == 0)
+        distances = haversine_km(self.lat[i], self.lon[i], self.lat[members], self.lon[members])
+        return int(self.vertex_ids[members[np.argmin(distances)]])
+
+    def shortest_path(self,
+                      source_id: int,
+                      target_id: int,
+                      weights: Optional[np.ndarray] = None) -> Optional[Route]:
+        """
+        두 정점 간의 최단 경로를 찾습니다 (배열 기반 다익스트라).
+        체인 압축으로 제거된 정점은 resolve_vertex로 옮긴 남은 정점에서 출발/도착하므로,
+        이때 경로의 첫/마지막 정점은 주어진 ID와 다를 수 있습니다.
+
+        Args:
+            source_id: 시작 정점 ID
+            target_id: 도착 정점 ID
+            weights: 간선별 비용 배열 (기본값: "distance" 메트릭)
+
+        Returns:
+            경로 또는 None (경로가 없는 경우)
+        """
+        # 체인 압축으로 제거된 정점이면 압축 간선을 따라 가장 가까운 남은 정점에서 출발/도착
+        source = self.resolve_vertex(source_id)
+        target = self.resolve_vertex(target_id, as_target=True)
+        if source is None or target is None:
+            return None
+        # 서로 다른 연결 요소 간 질의는 탐색 없이 바로 거절
+        if not self.may_reach(source, target):
+            return None
+        if weights is None:
+            weights = self.metrics["distance"]
+
+        offsets = self.offsets
+        heads = self.heads
+        distances = {source: 0.0}
+        previous: Dict[int, Tuple[int, int]] = {}  # 정점 인덱스 -> (이전 정점, 간선 인덱스)
+        priority_queue = [(0.0, source)]
+        deadline = _deadline
+        popped = 0
+
+        while priority_queue:
+            current_distance, u = heapq.heappop(priority_queue)
+            popped += 1
+            _check_deadline(deadline, popped)
+            if u == target:
+                break
+            if current_distance > distances[u]:
+                continue
+            for e in range(offsets[u], offsets[u + 1]):
+                v = int(heads[e])
+                new_distance = current_distance + float(weights[e])
+                if new_distance < distances.get(v, float('inf')):
+                    distances[v] = new_distance
+                    previous[v] = (u, e)
+                    heapq.heappush(priority_queue, (new_distance, v))
+
+        if target not in distances:
+            return None
+
+        # 경로 재구성
+        arcs = []
+        u = target
+        while u != source:
+            u, e = previous[u]
+            arcs.append(e)
+        arcs.reverse()
+
+        vertices = [int(self.vertex_ids[source])]
+        vertices.extend(int(self.vertex_ids[heads[e]]) for e in arcs)
+        return Route(cost=distances[target], vertices=vertices, arcs=arcs)
+
+    def search(self,
+               source: int,
+               weights: Optional[np.ndarray] = None,
+               targets: Optional[List[int]] = None,
+               cutoff: Optional[float] = None,
+               reverse: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        한 정점에서 여러 정점까지의 최단 거리를 한 번의 탐색으로 계산합니다 (일대다 다익스트라).
+        targets가 주어지면 모두 확정되는 즉시, cutoff가 주어지면 비용이 cutoff를 넘는 즉시 멈춥니다.
+        reverse=True면 간선을 거꾸로 따라가 여러 정점에서 source까지의 최단 거리를 계산합니다 (다대일).
+
+        Args:
+            source: 시작 정점 인덱스 (reverse=True면 도착 정점 인덱스)
+            weights: 간선별 비용 배열 (기본값: "distance" 메트릭)
+            targets: 도착 정점 인덱스 목록 (None이면 도달 가능한 모든 정점, reverse=True면 출발 정점 목록)
+            cutoff: 최대 비용
+            reverse: 다대일 탐색 여부
+
+        Returns:
+            (정점별 비용 배열 (도달하지 못하면 inf), 정점별 직전 간선 인덱스 배열 (없으면 -1))
+            reverse=True면 직전 간선 대신 정점에서 source 쪽으로 나가는 다음 간선 인덱스
+        """
+        if weights is None:
+            weights = self.metrics["distance"]
+        if reverse:
+            offsets, heads, arc_ids = self.reverse_arcs()
+        else:
+            offsets, heads, arc_ids = self.offsets, self.heads, None
+        limit = float('inf') if cutoff is None else cutoff
+
+        distances: Dict[int, float] = {source: 0.0}
+        parent: Dict[int, int] = {}
+        settled = set()
+        remaining = set(targets) if targets is not None else None
+        priority_queue = [(0.0, source)]
+        deadline = _deadline
+        popped = 0
+
+        while priority_queue:
+            current_distance, u = heapq.heappop(priority_queue)
+            popped += 1
+            _check_deadline(deadline, popped)
+            if u in settled:
+                continue
+            if current_distance > limit:
+                break
+            settled.add(u)
+            if remaining is not None:
+                remaining.discard(u)
+                if not remaining:
+                    break
+            for position in range(offsets[u], offsets[u + 1]):
+                v = int(heads[position])
+                e = position if arc_ids is None else int(arc_ids[position])
+                new_distance = current_distance + float(weights[e])
+                if new_distance < distances.get(v, float('inf')):
+                    distances[v] = new_distance
+                    parent[v] = e
+                    heapq.heappush(priority_queue, (new_distance, v))
+
+        # 확정된 정점만 결과에 포함
+        dist = np.full(self.num_vertices, np.inf)
+        parent_arc = np.full(self.num_vertices, -1, dtype=np.int64)
+        if settled:
+            index = np.fromiter(settled, dtype=np.int64, count=len(settled))
+            dist[index] = [distances[v] for v in index.tolist()]
+            parent_arc[index] = [parent.get(v, -1) for v in index.tolist()]
+        return dist, parent_arc
+
+    def route_from_tree(self,
+                        source: int,
+                        target: int,
+                        dist: np.ndarray,
+                        parent_arc: np.ndarray,
+                        reverse: bool = False) -> Optional[Route]:
+        """
+        search 결과(직전 간선 배열)로 source에서 target까지의 경로를 재구성합니다.
+        reverse=True로 탐색한 결과면 target에서 source(탐색 시작 정점)까지의 경로를 재구성합니다.
+
+        Args:
+            source, target: 탐색 시작 정점/경로를 찾을 정점 인덱스
+            dist, parent_arc: search의 반환값
+            reverse: search를 reverse=True로 호출했는지 여부
+
+        Returns:
+            경로 또는 None (target에 도달하지 못한 경우)
+        """
+        if not np.isfinite(dist[target]):
+            return None
+        if reverse:
+            arcs = []
+            v = target
+            while v != source:
+                e = int(parent_arc[v])
+                arcs.append(e)
+                v = int(self.heads[e])
+            vertices = [int(self.vertex_ids[target])]
+            vertices.extend(int(self.vertex_ids[self.heads[e]]) for e in arcs)
+            return Route(cost=float(dist[target]), vertices=vertices, arcs=arcs)
+
+        arcs = []
+        v = target
+        while v != source:
+            e = int(parent_arc[v])
+            arcs.append(e)
+            # 간선의 출발 정점은 CSR 오프셋에서 이분 탐색으로 찾음
+            v = int(np.searchsorted(self.offsets, e, side="right")) - 1
+        arcs.reverse()
+        vertices = [int(self.vertex_ids[source])]
+        vertices.extend(int(self.vertex_ids[self.heads[e]]) for e in arcs)
+        return Route(cost=float(dist[target]), vertices=vertices, arcs=arcs)
+
+    def save(self, path: str) -> None:
+        """
+        스냅샷을 디렉터리에 저장합니다 (배열별 .npy 파일 + meta.json).
+
+        Args:
+            path: 저장할 디렉터리 경로
+        """
+        os.makedirs(path, exist_ok=True)
+        arrays = {
+            "vertex_ids": self.vertex_ids,
+            "lat": self.lat,
+            "lon": self.lon,
+            "offsets": self.offsets,
+            "heads": self.heads,
+        }
+        arrays.update({f"metric.{name}": a for name, a in self.metrics.items()})
+        arrays.update({f"extra.{name}": a for name, a in self.extras.items()})
+        # 좌표 색인도 함께 저장해 불러올 때 다시 만들지 않고 메모리 매핑으로 공유
+        spatial_index = self.spatial_index()
+        arrays.update({f"spatial.{name}": a for name, a in spatial_index.arrays().items()})
+
+        for name, array in arrays.items():
+            np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(array))
+
+        meta = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "num_vertices": self.num_vertices,
+            "num_arcs": self.num_arcs,
+            "metrics": sorted(self.metrics),
+            "extras": sorted(self.extras),
+            "spatial": spatial_index.params(),
+            "spatial_arrays": sorted(spatial_index.arrays()),
+            "meta": self.meta,
+        }
+        with open(os.path.join(path, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "RoutingSnapshot":
+        """
+        디렉터리에 저장된 스냅샷을 불러옵니다.
+
+        Args:
+            path: 스냅샷 디렉터리 경로
+            mmap: True면 배열을 읽기 전용 메모리 매핑으로 불러옴
+
+        Returns:
+            불러온 스냅샷
+        """
+        with open(os.path.join(path, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 형식입니다: {meta.get('format_version')}")
+
+        mmap_mode = "r" if mmap else None
+
+        def _load(name: str) -> np.ndarray:
+            return np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+
+        snapshot = cls(
+            vertex_ids=_load("vertex_ids"),
+            lat=_load("lat"),
+            lon=_load("lon"),
+            offsets=_load("offsets"),
+            heads=_load("heads"),
+            metrics={name: _load(f"metric.{name}") for name in meta["metrics"]},
+            extras={name: _load(f"extra.{name}") for name in meta["extras"]},
+            meta=meta.get("meta", {}),
+        )
+        if "spatial" in meta:
+            from spatial import SpatialIndex
+            arrays = {name: _load(f"spatial.{name}") for name in meta["spatial_arrays"]}
+            snapshot._spatial_index = SpatialIndex.restore(arrays, meta["spatial"])
+        return snapshot
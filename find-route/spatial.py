@@ -0,0 +1,427 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from snapshot import EARTH_RADIUS_KM, GEOMETRY_LAT, GEOMETRY_LON, GEOMETRY_OFFSETS, RoutingSnapshot, haversine_km
+
+# 격자 한 칸에 들어갈 평균 항목 수
+ITEMS_PER_CELL = 2.0
+
+# 격자 칸 수 상한 (항목 수 대비 배수)
+MAX_CELLS_PER_ITEM = 4
+
+
+@dataclass
+class ArcProjection:
+    """
+    지점들을 가장 가까운 간선 위로 투영한 결과 (지점별 배열)
+    """
+    arc: np.ndarray          # 간선 인덱스
+    fraction: np.ndarray     # 간선 출발 정점에서부터의 길이 비율 (0..1)
+    lat: np.ndarray          # 투영된 지점 위도
+    lon: np.ndarray          # 투영된 지점 경도
+    distance_km: np.ndarray  # 원래 지점과 투영 지점 사이 거리
+
+
+class _PackedGrid:
+    """
+    평면 좌표(km) 위의 균일 격자. 칸별 항목 번호를 CSR 형태로 압축해 보관합니다.
+    """
+
+    def __init__(self, min_xy: np.ndarray, cell_km: float, shape: Tuple[int, int],
+                 cell_start: np.ndarray, items: np.ndarray):
+        self.min_xy = min_xy
+        self.cell_km = cell_km
+        self.shape = shape          # (가로 칸 수, 세로 칸 수)
+        self.cell_start = cell_start
+        self.items = items
+
+    @classmethod
+    def build(cls, min_x: np.ndarray, min_y: np.ndarray, max_x: np.ndarray, max_y: np.ndarray) -> "_PackedGrid":
+        """
+        항목별 경계 상자(점이면 min == max)로 격자를 만듭니다.
+        경계 상자가 여러 칸에 걸치는 항목은 걸치는 모든 칸에 넣습니다.
+        """
+        n = len(min_x)
+        lo = np.array([min_x.min(), min_y.min()]) if n else np.zeros(2)
+        hi = np.array([max_x.max(), max_y.max()]) if n else np.zeros(2)
+        extent = np.maximum(hi - lo, 1e-6)
+
+        # 칸당 평균 ITEMS_PER_CELL개가 되도록 칸 크기 결정
+        cell_km = float(np.sqrt(extent[0] * extent[1] * ITEMS_PER_CELL / max(n, 1)))
+        cell_km = max(cell_km, float(extent.max()) / np.sqrt(MAX_CELLS_PER_ITEM * max(n, 1)), 1e-6)
+        shape = (int(extent[0] // cell_km) + 1, int(extent[1] // cell_km) + 1)
+
+        cx0 = ((min_x - lo[0]) // cell_km).astype(np.int64)
+        cy0 = ((min_y - lo[1]) // cell_km).astype(np.int64)
+        cx1 = ((max_x - lo[0]) // cell_km).astype(np.int64)
+        cy1 = ((max_y - lo[1]) // cell_km).astype(np.int64)
+
+        # 항목이 걸치는 칸들을 펼침
+        span_x = cx1 - cx0 + 1
+        span_y = cy1 - cy0 + 1
+        counts = span_x * span_y
+        item = np.repeat(np.arange(n, dtype=np.int64), counts)
+        local = np.arange(len(item), dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+        cell_x = cx0[item] + local % span_x[item]
+        cell_y = cy0[item] + local // span_x[item]
+        cell = cell_y * shape[0] + cell_x
+
+        order = np.argsort(cell, kind="stable")
+        cell_start = np.zeros(shape[0] * shape[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cell, minlength=shape[0] * shape[1]), out=cell_start[1:])
+        return cls(lo, cell_km, shape, cell_start, item[order])
+
+    def params(self) -> Dict[str, Any]:
+        return {"min_xy": [float(v) for v in self.min_xy], "cell_km": self.cell_km, "shape": list(self.shape)}
+
+    @classmethod
+    def restore(cls, params: Dict[str, Any], cell_start: np.ndarray, items: np.ndarray) -> "_PackedGrid":
+        return cls(np.array(params["min_xy"]), float(params["cell_km"]), tuple(params["shape"]), cell_start, items)
+
+    def candidates(self, x: np.ndarray, y: np.ndarray, radius: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        각 지점의 칸에서 체비셰프 거리 radius 이내 칸들의 항목을 한 번에 모읍니다.
+
+        Returns:
+            (지점 번호 배열, 항목 번호 배열) - 같은 길이의 평탄화된 후보 목록
+        """
+        cx = np.clip((x - self.min_xy[0]) // self.cell_km, 0, self.shape[0] - 1).astype(np.int64)
+        cy = np.clip((y - self.min_xy[1]) // self.cell_km, 0, self.shape[1] - 1).astype(np.int64)
+        offsets = np.arange(-radius, radius + 1)
+        dx, dy = np.meshgrid(offsets, offsets)
+        nx = cx[:, np.newaxis] + dx.ravel()
+        ny = cy[:, np.newaxis] + dy.ravel()
+        valid = (nx >= 0) & (nx < self.shape[0]) & (ny >= 0) & (ny < self.shape[1])
+
+        query = np.broadcast_to(np.arange(len(x))[:, np.newaxis], nx.shape)[valid]
+        cell = (ny * self.shape[0] + nx)[valid]
+        starts = self.cell_start[cell]
+        counts = self.cell_start[cell + 1] - starts
+        total = int(counts.sum())
+        position = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        return np.repeat(query, counts), self.items[position]
+
+    def unsearched_distance(self, x: np.ndarray, y: np.ndarray, radius: int) -> np.ndarray:
+        """
+        각 지점에서 candidates(radius)가 탐색하지 않은 칸까지의 최소 거리를 계산합니다.
+        이 거리 안에서 찾은 항목은 탐색하지 않은 칸의 어떤 항목보다도 가깝습니다.
+        격자 밖의 지점도 정확히 처리합니다.
+        """
+        width, height = self.shape
+        cx = np.clip((x - self.min_xy[0]) // self.cell_km, 0, width - 1).astype(np.int64)
+        cy = np.clip((y - self.min_xy[1]) // self.cell_km, 0, height - 1).astype(np.int64)
+        x0, x1 = np.maximum(cx - radius, 0), np.minimum(cx + radius, width - 1)
+        y0, y1 = np.maximum(cy - radius, 0), np.minimum(cy + radius, height - 1)
+
+        def to_rect(cell_x0, cell_x1, cell_y0, cell_y1, exists):
+            # 칸 범위 [cell_x0, cell_x1] x [cell_y0, cell_y1]로 이루어진 직사각형까지의 거리
+            rx0 = self.min_xy[0] + cell_x0 * self.cell_km
+            rx1 = self.min_xy[0] + (cell_x1 + 1) * self.cell_km
+            ry0 = self.min_xy[1] + cell_y0 * self.cell_km
+            ry1 = self.min_xy[1] + (cell_y1 + 1) * self.cell_km
+            gap_x = np.maximum(np.maximum(rx0 - x, x - rx1), 0.0)
+            gap_y = np.maximum(np.maximum(ry0 - y, y - ry1), 0.0)
+            return np.where(exists, np.hypot(gap_x, gap_y), np.inf)
+
+        # 탐색한 정사각형 바깥을 위/아래/왼쪽/오른쪽 띠 네 개로 나눔
+        below = to_rect(0, width - 1, 0, y0 - 1, y0 > 0)
+        above = to_rect(0, width - 1, y1 + 1, height - 1, y1 < height - 1)
+        left = to_rect(0, x0 - 1, y0, y1, x0 > 0)
+        right = to_rect(x1 + 1, width - 1, y0, y1, x1 < width - 1)
+        return np.minimum(np.minimum(below, above), np.minimum(left, right))
+
+
+def _k_smallest(query: np.ndarray, distance: np.ndarray, num_queries: int, k: int
+                ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    평탄화된 (지점, 거리) 후보 목록에서 지점별로 거리가 가장 작은 후보 k개의 위치를 고릅니다.
+
+    Returns:
+        (후보 위치 배열 (지점 수, k), 유효 여부 배열 (지점 수, k))
+    """
+    order = np.lexsort((distance, query))
+    sorted_query = query[order]
+    group_start = np.searchsorted(sorted_query, np.arange(num_queries))
+    group_end = np.searchsorted(sorted_query, np.arange(num_queries), side="right")
+    rank = group_start[:, np.newaxis] + np.arange(k)
+    valid = rank < group_end[:, np.newaxis]
+    picked = order[np.minimum(rank, len(order) - 1)]
+    return picked, valid
+
+
+class SpatialIndex:
+    """
+    정점과 간선 선분에 대한 격자 공간 색인
+
+    위경도를 기준 위도의 등장방형 평면 좌표(km)로 바꾼 뒤, 정점과 간선 선분을
+    각각 압축 격자(packed grid)에 넣습니다. 질의는 여러 지점을 한 번에 처리하며,
+    지점이 속한 칸 주변을 넓혀 가며 후보를 모아 넘파이 연산으로 최근접 항목을 고릅니다.
+    """
+
+    def __init__(self,
+                 lat: np.ndarray,
+                 lon: np.ndarray,
+                 segment_arc: np.ndarray,
+                 segment_lat: np.ndarray,
+                 segment_lon: np.ndarray,
+                 segment_offset_km: np.ndarray,
+                 arc_length_km: np.ndarray):
+        """
+        SpatialIndex 초기화
+
+        Args:
+            lat, lon: 정점 위도/경도
+            segment_arc: 선분이 속한 간선 인덱스 (길이 s)
+            segment_lat, segment_lon: 선분 양 끝 위도/경도 (s, 2)
+            segment_offset_km: 간선 출발점에서 선분 시작점까지 거리
+            arc_length_km: 간선별 좌표열 길이
+        """
+        self.origin_lat = float(np.mean(lat)) if len(lat) else 0.0
+        self.kx = EARTH_RADIUS_KM * np.radians(1.0) * np.cos(np.radians(self.origin_lat))
+        self.ky = EARTH_RADIUS_KM * np.radians(1.0)
+
+        self.vertex_x, self.vertex_y = self.project(lat, lon)
+        self.vertex_grid = _PackedGrid.build(self.vertex_x, self.vertex_y, self.vertex_x, self.vertex_y)
+
+        self.segment_arc = segment_arc
+        self.segment_x, self.segment_y = self.project(segment_lat, segment_lon)
+        self.segment_offset_km = segment_offset_km
+        self.arc_length_km = arc_length_km
+        self.segment_grid = None
+        if len(segment_arc):
+            self.segment_grid = _PackedGrid.build(self.segment_x.min(axis=1), self.segment_y.min(axis=1),
+                                                  self.segment_x.max(axis=1), self.segment_y.max(axis=1))
+
+    @classmethod
+    def from_snapshot(cls, snapshot: RoutingSnapshot) -> "SpatialIndex":
+        """
+        스냅샷의 정점과 간선 좌표열(압축된 간선의 중간 정점 포함)로 색인을 만듭니다.
+
+        Args:
+            snapshot: 경로 탐색 스냅샷
+
+        Returns:
+            생성된 색인
+        """
+        lat = np.asarray(snapshot.lat, dtype=np.float64)
+        lon = np.asarray(snapshot.lon, dtype=np.float64)
+        tails = snapshot.arc_tails()
+        heads = np.asarray(snapshot.heads, dtype=np.int64)
+        m = snapshot.num_arcs
+
+        # 간선별 좌표열: 출발 정점, 중간 정점들, 도착 정점
+        if snapshot.has_geometry():
+            geom_offsets = np.asarray(snapshot.extras[GEOMETRY_OFFSETS], dtype=np.int64)
+            interior_count = np.diff(geom_offsets)
+        else:
+            geom_offsets = np.zeros(m + 1, dtype=np.int64)
+            interior_count = np.zeros(m, dtype=np.int64)
+        point_count = interior_count + 2
+        arc_start = np.cumsum(point_count) - point_count
+        total = int(point_count.sum())
+
+        point_lat = np.empty(total)
+        point_lon = np.empty(total)
+        point_lat[arc_start] = lat[tails]
+        point_lon[arc_start] = lon[tails]
+        point_lat[arc_start + point_count - 1] = lat[heads]
+        point_lon[arc_start + point_count - 1] = lon[heads]
+        if snapshot.has_geometry() and geom_offsets[-1] > 0:
+            position = (np.repeat(arc_start + 1 - geom_offsets[:-1], interior_count)
+                        + np.arange(int(geom_offsets[-1])))
+            point_lat[position] = snapshot.extras[GEOMETRY_LAT]
+            point_lon[position] = snapshot.extras[GEOMETRY_LON]
+
+        # 연속한 두 점이 선분 하나 (간선의 마지막 점에서 시작하는 선분은 제외)
+        is_start = np.ones(total, dtype=bool)
+        is_start[arc_start + point_count - 1] = False
+        first = np.flatnonzero(is_start)
+        segment_arc = np.repeat(np.arange(m, dtype=np.int64), point_count - 1)
+        segment_lat = np.stack([point_lat[first], point_lat[first + 1]], axis=1)
+        segment_lon = np.stack([point_lon[first], point_lon[first + 1]], axis=1)
+
+        segment_km = haversine_km(segment_lat[:, 0], segment_lon[:, 0], segment_lat[:, 1], segment_lon[:, 1])
+        cumulative = np.cumsum(segment_km)
+        segment_end = np.cumsum(point_count - 1)
+        arc_total = np.concatenate([[0.0], cumulative])[segment_end]
+        arc_before = np.concatenate([[0.0], arc_total[:-1]])
+        arc_length_km = arc_total - arc_before
+        segment_offset_km = cumulative - segment_km - np.repeat(arc_before, point_count - 1)
+
+        return cls(lat, lon, segment_arc, segment_lat, segment_lon, segment_offset_km, arc_length_km)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """
+        색인을 이루는 배열 (스냅샷과 함께 저장해 메모리 매핑으로 다시 불러오기 위함)
+        """
+        arrays = {
+            "vertex_x": self.vertex_x,
+            "vertex_y": self.vertex_y,
+            "vertex_cell_start": self.vertex_grid.cell_start,
+            "vertex_items": self.vertex_grid.items,
+            "segment_arc": self.segment_arc,
+            "segment_x": self.segment_x,
+            "segment_y": self.segment_y,
+            "segment_offset_km": self.segment_offset_km,
+            "arc_length_km": self.arc_length_km,
+        }
+        if self.segment_grid is not None:
+            arrays["segment_cell_start"] = self.segment_grid.cell_start
+            arrays["segment_items"] = self.segment_grid.items
+        return arrays
+
+    def params(self) -> Dict[str, Any]:
+        """
+        색인의 격자 설정 (JSON으로 저장)
+        """
+        return {
+            "origin_lat": self.origin_lat,
+            "vertex_grid": self.vertex_grid.params(),
+            "segment_grid": self.segment_grid.params() if self.segment_grid is not None else None,
+        }
+
+    @classmethod
+    def restore(cls, arrays: Dict[str, np.ndarray], params: Dict[str, Any]) -> "SpatialIndex":
+        """
+        arrays()/params()로 저장한 색인을 다시 만듭니다 (격자를 새로 계산하지 않음).
+
+        Args:
+            arrays: 색인 배열 (메모리 매핑 배열 가능)
+            params: 격자 설정
+
+        Returns:
+            복원된 색인
+        """
+        index = cls.__new__(cls)
+        index.origin_lat = float(params["origin_lat"])
+        index.kx = EARTH_RADIUS_KM * np.radians(1.0) * np.cos(np.radians(index.origin_lat))
+        index.ky = EARTH_RADIUS_KM * np.radians(1.0)
+        index.vertex_x = arrays["vertex_x"]
+        index.vertex_y = arrays["vertex_y"]
+        index.vertex_grid = _PackedGrid.restore(params["vertex_grid"], arrays["vertex_cell_start"],
+                                                arrays["vertex_items"])
+        index.segment_arc = arrays["segment_arc"]
+        index.segment_x = arrays["segment_x"]
+        index.segment_y = arrays["segment_y"]
+        index.segment_offset_km = arrays["segment_offset_km"]
+        index.arc_length_km = arrays["arc_length_km"]
+        index.segment_grid = None
+        if params.get("segment_grid") is not None:
+            index.segment_grid = _PackedGrid.restore(params["segment_grid"], arrays["segment_cell_start"],
+                                                     arrays["segment_items"])
+        return index
+
+    def project(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        위경도를 평면 좌표(km)로 바꿉니다.
+        """
+        return np.asarray(lon, dtype=np.float64) * self.kx, np.asarray(lat, dtype=np.float64) * self.ky
+
+    def nearest_vertices(self, lat: np.ndarray, lon: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 지점 각각에서 가장 가까운 정점 k개를 한 번에 찾습니다.
+
+        Args:
+            lat, lon: 위도/경도 배열
+            k: 찾을 정점 수
+
+        Returns:
+            (정점 인덱스 배열 (지점 수, k), 거리 배열 (지점 수, k) km)
+            정점이 k개보다 적으면 남는 자리는 인덱스 -1, 거리 inf
+        """
+        x, y = self.project(np.atleast_1d(lat), np.atleast_1d(lon))
+        num_queries = len(x)
+        result = np.full((num_queries, k), -1, dtype=np.int64)
+        result_distance = np.full((num_queries, k), np.inf)
+        if len(self.vertex_x) == 0:
+            return result, result_distance
+
+        pending = np.arange(num_queries)
+        radius = 1
+        while len(pending):
+            query, item = self.vertex_grid.candidates(x[pending], y[pending], radius)
+            if len(item) == 0:
+                radius *= 2
+                continue
+            distance = np.hypot(self.vertex_x[item] - x[pending][query], self.vertex_y[item] - y[pending][query])
+            picked, valid = _k_smallest(query, distance, len(pending), k)
+            found_distance = np.where(valid, distance[picked], np.inf)
+
+            # k번째 정점이 탐색하지 않은 칸보다 가까워야 결과가 확정됨
+            done = found_distance[:, -1] <= self.vertex_grid.unsearched_distance(x[pending], y[pending], radius)
+            result[pending[done]] = np.where(valid[done], item[picked[done]], -1)
+            result_distance[pending[done]] = found_distance[done]
+            pending = pending[~done]
+            radius *= 2
+        return result, result_distance
+
+    def project_to_arcs(self, lat: np.ndarray, lon: np.ndarray) -> ArcProjection:
+        """
+        여러 지점 각각을 가장 가까운 간선 선분 위로 한 번에 투영합니다.
+
+        Args:
+            lat, lon: 위도/경도 배열
+
+        Returns:
+            지점별 투영 결과 (간선이 없으면 arc가 -1)
+        """
+        x, y = self.project(np.atleast_1d(lat), np.atleast_1d(lon))
+        num_queries = len(x)
+        best_segment = np.full(num_queries, -1, dtype=np.int64)
+        best_t = np.zeros(num_queries)
+        best_distance = np.full(num_queries, np.inf)
+        if self.segment_grid is None:
+            nan = np.full(num_queries, np.nan)
+            return ArcProjection(best_segment, best_t, nan, nan.copy(), best_distance)
+
+        pending = np.arange(num_queries)
+        radius = 1
+        while len(pending):
+            query, segment = self.segment_grid.candidates(x[pending], y[pending], radius)
+            if len(segment) == 0:
+                radius *= 2
+                continue
+            px = x[pending][query]
+            py = y[pending][query]
+            ax, bx = self.segment_x[segment, 0], self.segment_x[segment, 1]
+            ay, by = self.segment_y[segment, 0], self.segment_y[segment, 1]
+            dx, dy = bx - ax, by - ay
+            length_sq = dx * dx + dy * dy
+            t = np.where(length_sq > 0, ((px - ax) * dx + (py - ay) * dy) / np.where(length_sq > 0, length_sq, 1), 0)
+            t = np.clip(t, 0.0, 1.0)
+            distance = np.hypot(ax + t * dx - px, ay + t * dy - py)
+
+            picked, valid = _k_smallest(query, distance, len(pending), 1)
+            picked, valid = picked[:, 0], valid[:, 0]
+            found_distance = np.where(valid, distance[picked], np.inf)
+
+            done = found_distance <= self.segment_grid.unsearched_distance(x[pending], y[pending], radius)
+            hit = done & valid
+            best_segment[pending[hit]] = segment[picked[hit]]
+            best_t[pending[hit]] = t[picked[hit]]
+            best_distance[pending[done]] = found_distance[done]
+            pending = pending[~done]
+            radius *= 2
+
+        found = best_segment >= 0
+        segment = np.where(found, best_segment, 0)
+        px = self.segment_x[segment, 0] + best_t * (self.segment_x[segment, 1] - self.segment_x[segment, 0])
+        py = self.segment_y[segment, 0] + best_t * (self.segment_y[segment, 1] - self.segment_y[segment, 0])
+        arc = np.where(found, self.segment_arc[segment], -1)
+
+        # 간선 좌표열 길이 기준으로 투영 지점까지의 비율 계산
+        segment_km = np.hypot(self.segment_x[segment, 1] - self.segment_x[segment, 0],
+                              self.segment_y[segment, 1] - self.segment_y[segment, 0])
+        along = self.segment_offset_km[segment] + best_t * segment_km
+        length = self.arc_length_km[self.segment_arc[segment]]
+        fraction = np.where(found & (length > 0), along / np.where(length > 0, length, 1), 0.0)
+
+        return ArcProjection(
+            arc=arc,
+            fraction=np.clip(fraction, 0.0, 1.0),
+            lat=np.where(found, py / self.ky, np.nan),
+            lon=np.where(found, px / self.kx, np.nan),
+            distance_km=best_distance,
+        )
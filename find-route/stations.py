@@ -0,0 +1,120 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from snapshot import RoutingSnapshot
+
+# 스냅샷 extras에 저장하는 대여소 거리표 배열 이름
+STATION_IDS = "station_ids"
+STATION_VERTICES = "station_vertices"
+STATION_BIKE_KM = "station_bike_km"
+
+
+class StationTable:
+    """
+    대여소 간 자전거 거리표
+
+    대여소마다 가장 가까운 정점에서 일대다 탐색을 한 번씩 해 (대여소 수 x 대여소 수)
+    거리 행렬을 미리 계산합니다. 대여소 위치는 거의 바뀌지 않으므로 스냅샷을 만들 때
+    함께 계산해 저장하고, 요청마다 바뀌는 자전거 수는 질의 시점에 걸러서 사용합니다.
+    """
+
+    def __init__(self, station_ids: np.ndarray, vertices: np.ndarray, bike_km: np.ndarray):
+        """
+        StationTable 초기화
+
+        Args:
+            station_ids: 대여소 ID (문자열, 길이 s)
+            vertices: 대여소별 정점 인덱스 (길이 s)
+            bike_km: 대여소 간 자전거 거리 (s, s) - 도달할 수 없으면 inf
+        """
+        self.station_ids = station_ids
+        self.vertices = vertices
+        self.bike_km = bike_km
+        self._row = {str(station_id): i for i, station_id in enumerate(station_ids.tolist())}
+
+    def __len__(self) -> int:
+        return len(self.station_ids)
+
+    @classmethod
+    def build(cls,
+              snapshot: RoutingSnapshot,
+              station_ids: Sequence[str],
+              lat: Sequence[float],
+              lon: Sequence[float],
+              weights: Optional[np.ndarray] = None) -> "StationTable":
+        """
+        대여소 좌표를 정점에 스냅하고 대여소 간 거리표를 계산합니다.
+
+        Args:
+            snapshot: 경로 탐색 스냅샷
+            station_ids: 대여소 ID 목록
+            lat, lon: 대여소 위도/경도
+            weights: 간선별 비용 배열 (기본값: "distance" 메트릭)
+
+        Returns:
+            생성된 거리표
+        """
+        nearest, _ = snapshot.spatial_index().nearest_vertices(np.asarray(lat), np.asarray(lon))
+        vertices = nearest[:, 0]
+        targets = np.unique(vertices).tolist()
+
+        bike_km = np.full((len(vertices), len(vertices)), np.inf, dtype=np.float32)
+        # 같은 정점에 스냅된 대여소는 탐색을 한 번만 함
+        for source in targets:
+            dist, _ = snapshot.search(source, weights, targets=targets)
+            bike_km[vertices == source] = dist[vertices]
+        return cls(np.array([str(s) for s in station_ids]), vertices, bike_km)
+
+    def attach(self, snapshot: RoutingSnapshot) -> None:
+        """
+        거리표를 스냅샷 extras에 저장합니다 (스냅샷과 함께 저장/메모리 매핑됨).
+        """
+        snapshot.extras[STATION_IDS] = self.station_ids
+        snapshot.extras[STATION_VERTICES] = self.vertices
+        snapshot.extras[STATION_BIKE_KM] = self.bike_km
+
+    @classmethod
+    def from_snapshot(cls, snapshot: RoutingSnapshot) -> Optional["StationTable"]:
+        """
+        스냅샷에 저장된 거리표를 불러옵니다 (없으면 None).
+        """
+        if STATION_BIKE_KM not in snapshot.extras:
+            return None
+        return cls(snapshot.extras[STATION_IDS], snapshot.extras[STATION_VERTICES],
+                   snapshot.extras[STATION_BIKE_KM])
+
+    def rows(self, station_ids: Sequence[str]) -> np.ndarray:
+        """
+        대여소 ID들의 거리표 행 번호 (거리표에 없는 대여소는 -1)
+        """
+        return np.array([self._row.get(str(s), -1) for s in station_ids], dtype=np.int64)
+
+
+def best_combinations(first_leg: np.ndarray,
+                      middle: np.ndarray,
+                      last_leg: np.ndarray,
+                      k: int = 1) -> List[Tuple[int, int, float]]:
+    """
+    (첫 구간 비용 + 가운데 구간 비용 + 마지막 구간 비용)이 가장 작은 조합 k개를 한 번의 행렬 연산으로 찾습니다.
+
+    Args:
+        first_leg: 출발지 -> 대여소 i 비용 (길이 a)
+        middle: 대여소 i -> 대여소 j 비용 (a, b)
+        last_leg: 대여소 j -> 목적지 비용 (길이 b)
+        k: 찾을 조합 수
+
+    Returns:
+        (i, j, 총 비용) 목록 (총 비용 오름차순, 유한한 조합만)
+    """
+    if len(first_leg) == 0 or len(last_leg) == 0:
+        return []
+    total = first_leg[:, np.newaxis] + middle + last_leg[np.newaxis, :]
+    flat = total.ravel()
+    k = min(k, len(flat))
+    candidates = np.argpartition(flat, k - 1)[:k]
+    candidates = candidates[np.argsort(flat[candidates])]
+    return [
+        (int(c // total.shape[1]), int(c % total.shape[1]), float(flat[c]))
+        for c in candidates if np.isfinite(flat[c])
+    ]
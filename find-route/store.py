@@ -0,0 +1,218 @@
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Iterator, List, Optional
+
+from snapshot import META_FILE, RoutingSnapshot
+
+# 현재 버전 이름을 담는 파일
+CURRENT_FILE = "CURRENT"
+
+# 게시할 때 남겨 둘 이전 버전 수 (현재 버전 제외)
+DEFAULT_KEEP_VERSIONS = 2
+
+# 버전 디렉터리가 없는 단일 스냅샷 디렉터리의 버전 이름
+STATIC_VERSION = "static"
+
+
+class SnapshotStore:
+    """
+    버전별 스냅샷 저장소
+
+    root/<버전>/ 디렉터리마다 스냅샷 하나를 저장하고, root/CURRENT 파일이 현재 버전을 가리킵니다.
+    새 버전은 임시 디렉터리에 모두 쓴 뒤 이름을 바꾸고, CURRENT도 임시 파일을 os.replace로
+    바꿔 쓰므로 읽는 쪽은 항상 완전한 버전만 보게 됩니다.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def current_version(self) -> Optional[str]:
+        """
+        현재 버전 이름 (버전 저장소가 아니고 스냅샷 디렉터리 자체면 STATIC_VERSION)
+        """
+        try:
+            with open(os.path.join(self.root, CURRENT_FILE), encoding="utf-8") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            if os.path.exists(os.path.join(self.root, META_FILE)):
+                return STATIC_VERSION
+            return None
+
+    def version_path(self, version: str) -> str:
+        if version == STATIC_VERSION:
+            return self.root
+        return os.path.join(self.root, version)
+
+    def versions(self) -> List[str]:
+        """
+        저장된 버전 목록 (오래된 순)
+        """
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if not name.startswith(".") and os.path.exists(os.path.join(self.root, name, META_FILE))
+        )
+
+    def publish(self, snapshot: RoutingSnapshot, keep: int = DEFAULT_KEEP_VERSIONS) -> str:
+        """
+        스냅샷을 새 버전으로 저장하고 현재 버전으로 바꿉니다.
+
+        Args:
+            snapshot: 저장할 스냅샷
+            keep: 남겨 둘 이전 버전 수 (나머지는 삭제)
+
+        Returns:
+            새 버전 이름
+        """
+        os.makedirs(self.root, exist_ok=True)
+        version = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        tmp_path = os.path.join(self.root, f".tmp-{version}")
+        snapshot.save(tmp_path)
+        os.rename(tmp_path, self.version_path(version))
+
+        # CURRENT 파일을 원자적으로 교체
+        tmp_current = os.path.join(self.root, f".{CURRENT_FILE}.tmp")
+        with open(tmp_current, "w", encoding="utf-8") as f:
+            f.write(version)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_current, os.path.join(self.root, CURRENT_FILE))
+
+        self.prune(keep)
+        return version
+
+    def prune(self, keep: int = DEFAULT_KEEP_VERSIONS) -> List[str]:
+        """
+        현재 버전과 최근 keep개 이전 버전을 뺀 나머지 버전을 삭제합니다.
+        이미 매핑된 파일은 삭제 후에도 매핑을 해제할 때까지 유효합니다 (POSIX).
+
+        Returns:
+            삭제한 버전 목록
+        """
+        current = self.current_version()
+        older = [v for v in self.versions() if v != current]
+        removed = older[:max(len(older) - keep, 0)]
+        for version in removed:
+            shutil.rmtree(self.version_path(version), ignore_errors=True)
+        return removed
+
+
+class _Mapped:
+    """
+    불러온 버전 하나와 그 버전을 사용 중인 질의 수
+    """
+
+    def __init__(self, version: str, value: Any):
+        self.version = version
+        self.value = value
+        self.in_flight = 0
+
+
+class SnapshotManager:
+    """
+    현재 버전의 스냅샷을 읽기 전용 메모리 매핑으로 불러와 공유하고, 새 버전이 게시되면 교체합니다.
+
+    새 버전은 질의 경로 밖(refresh)에서 미리 불러온 뒤 참조 하나만 바꿔 원자적으로 교체합니다
+    (이중 버퍼링). 이전 버전은 진행 중인 질의가 모두 끝나면 참조를 놓아 매핑이 해제됩니다.
+    같은 파일을 매핑한 프로세스들은 운영체제 페이지 캐시를 공유하므로, 작업 프로세스가
+    늘어도 스냅샷 메모리는 버전당 한 벌만 사용합니다.
+    """
+
+    def __init__(self,
+                 root: str,
+                 loader: Callable[[str], Any] = RoutingSnapshot.load,
+                 on_swap: Optional[Callable[[str, Optional[str]], None]] = None):
+        """
+        SnapshotManager 초기화 - 현재 버전을 바로 불러옵니다.
+
+        Args:
+            root: 스냅샷 저장소 디렉터리 (또는 단일 스냅샷 디렉터리)
+            loader: 버전 디렉터리 경로로 질의 객체를 만드는 함수 (기본값: RoutingSnapshot.load)
+            on_swap: 버전이 바뀔 때 (새 버전, 이전 버전)으로 호출되는 함수
+        """
+        self.store = SnapshotStore(root)
+        self.loader = loader
+        self.on_swap = on_swap
+        self._lock = threading.Lock()
+        self._active: Optional[_Mapped] = None
+        self._retired: List[_Mapped] = []
+        self._refresher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        if not self.refresh():
+            raise FileNotFoundError(f"스냅샷을 찾을 수 없습니다: {root}")
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._active.version if self._active is not None else None
+
+    def refresh(self) -> bool:
+        """
+        CURRENT가 가리키는 버전이 바뀌었으면 새 버전을 불러와 교체합니다.
+
+        Returns:
+            새 버전으로 교체했으면 True
+        """
+        version = self.store.current_version()
+        if version is None or version == self.version:
+            return False
+
+        # 불러오기는 잠금 밖에서 (그동안 질의는 이전 버전으로 계속 처리)
+        mapped = _Mapped(version, self.loader(self.store.version_path(version)))
+        with self._lock:
+            previous = self._active
+            self._active = mapped
+            if previous is not None:
+                self._retired.append(previous)
+            self._release_drained()
+
+        if self.on_swap is not None:
+            self.on_swap(version, previous.version if previous is not None else None)
+        return True
+
+    def _release_drained(self) -> None:
+        # 진행 중인 질의가 없는 이전 버전의 참조를 놓음 (잠금 안에서 호출)
+        self._retired = [mapped for mapped in self._retired if mapped.in_flight > 0]
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """
+        현재 버전을 질의 하나 동안 사용합니다. 질의 도중 교체되어도 같은 버전을 계속 봅니다.
+        """
+        with self._lock:
+            mapped = self._active
+            mapped.in_flight += 1
+        try:
+            yield mapped.value
+        finally:
+            with self._lock:
+                mapped.in_flight -= 1
+                if mapped is not self._active:
+                    self._release_drained()
+
+    def start_refresher(self, interval: float) -> None:
+        """
+        interval초마다 새 버전을 확인하는 백그라운드 스레드를 시작합니다.
+        """
+        if self._refresher is not None:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.refresh()
+                except Exception as e:
+                    # 게시 도중이거나 손상된 버전이면 현재 버전을 유지하고 다음 주기에 다시 시도
+                    print(f"스냅샷 갱신 실패 (현재 버전 {self.version} 유지): {e}")
+
+        self._refresher = threading.Thread(target=run, name="snapshot-refresher", daemon=True)
+        self._refresher.start()
+
+    def stop_refresher(self) -> None:
+        self._stop.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout=1.0)
+            self._refresher = None
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# find-route 모듈은 스크립트 디렉터리에서 이름으로 서로 임포트하므로 상위 디렉터리를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+import batch
+from snapshot import RoutingSnapshot
+
+# 경도 방향으로 0.01도(약 0.9km) 간격의 정점 4개
+LON = 127.30 + 0.01 * np.arange(4)
+
+
+@pytest.fixture
+def line_snapshot(monkeypatch):
+    """
+    0-1-2-3 일직선 양방향 그래프를 작업 프로세스 스냅샷으로 설정
+    """
+    arcs = sorted([(v, v + 1) for v in range(3)] + [(v + 1, v) for v in range(3)])
+    tails = np.array([a[0] for a in arcs])
+    offsets = np.zeros(5, dtype=np.int64)
+    np.add.at(offsets, tails + 1, 1)
+    np.cumsum(offsets, out=offsets)
+    snapshot = RoutingSnapshot(
+        vertex_ids=np.arange(4, dtype=np.int64),
+        lat=np.full(4, 36.35),
+        lon=LON.copy(),
+        offsets=offsets,
+        heads=np.array([a[1] for a in arcs], dtype=np.int64),
+        metrics={"distance": np.full(len(arcs), 0.9, dtype=np.float32)},
+    )
+    monkeypatch.setattr(batch, "_worker_snapshot", snapshot)
+    monkeypatch.setattr(batch, "_worker_profiles", None)
+    return snapshot
+
+
+def coordinate_row(row_id, origin, destination):
+    return {"id": row_id, "origin_lat": 36.35, "origin_lon": float(LON[origin]),
+            "destination_lat": 36.35, "destination_lon": float(LON[destination])}
+
+
+def test_route_chunk_snaps_coordinates(line_snapshot):
+    results = batch.route_chunk([coordinate_row(0, 0, 3), {"id": 1, "origin_id": 1, "destination_id": 2}])
+    assert [r["status"] for r in results] == ["ok", "ok"]
+    assert (results[0]["origin_id"], results[0]["destination_id"]) == (0, 3)
+    assert results[0]["distance_km"] == pytest.approx(2.7)
+    assert results[1]["distance_km"] == pytest.approx(0.9)
+
+
+def test_bad_coordinate_rows_do_not_abort_chunk(line_snapshot):
+    missing = coordinate_row(1, 0, 1)
+    del missing["destination_lon"]
+    rows = [
+        coordinate_row(0, 0, 2),
+        missing,
+        dict(coordinate_row(2, 0, 1), origin_lat="abc"),
+        dict(coordinate_row(3, 0, 1), origin_lon="nan"),
+        coordinate_row(4, 3, 1),
+    ]
+    results = batch.route_chunk(rows)
+    assert [r["id"] for r in results] == [0, 1, 2, 3, 4]
+    assert results[0]["status"] == "ok" and results[0]["destination_id"] == 2
+    assert all(r["status"].startswith("error: ") for r in results[1:4])
+    assert all(r["distance_km"] is None for r in results[1:4])
+    assert results[4]["status"] == "ok" and (results[4]["origin_id"], results[4]["destination_id"]) == (3, 1)
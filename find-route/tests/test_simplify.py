@@ -0,0 +1,100 @@
+import pytest
+
+import batch
+from cch import Arc, Graph, Vertex
+from simplify import compress_degree2_chains
+from snapshot import RoutingSnapshot
+
+
+def make_graph(two_way=(), one_way=()):
+    """
+    정점 ID i를 위도 36.35 + 0.001 * i에 두고 거리 1인 간선으로 잇는 그래프
+    """
+    graph = Graph()
+    ids = {v for edge in (*two_way, *one_way) for v in edge}
+    for i in sorted(ids):
+        graph.add_vertex(Vertex(i, 36.35 + 0.001 * i, 127.38))
+    for a, b in two_way:
+        graph.add_arc(Arc(graph.vertices[a], graph.vertices[b], 1.0))
+        graph.add_arc(Arc(graph.vertices[b], graph.vertices[a], 1.0))
+    for a, b in one_way:
+        graph.add_arc(Arc(graph.vertices[a], graph.vertices[b], 1.0))
+    return graph
+
+
+def removed_vertices_are_covered(graph, compressed, chains):
+    covered = {v.id for interior in chains.values() for v in interior}
+    return set(graph.vertices) == set(compressed.vertices) | covered
+
+
+def test_chain_is_compressed_to_one_arc():
+    # 0-1-2-3 체인 끝의 3에서 4, 5로 갈라짐
+    graph = make_graph(two_way=[(0, 1), (1, 2), (2, 3), (3, 4), (3, 5)])
+    compressed, chains = compress_degree2_chains(graph)
+
+    assert sorted(compressed.vertices) == [0, 3, 4, 5]
+    assert compressed.arcs[(0, 3)].cost == 3.0
+    assert [v.id for v in chains[(0, 3)]] == [1, 2]
+    assert [v.id for v in chains[(3, 0)]] == [2, 1]
+    assert removed_vertices_are_covered(graph, compressed, chains)
+
+
+def test_pure_cycle_next_to_other_component_is_kept():
+    # 0-1-6 경로 옆의 차수 2 정점만으로 된 순환 2-3-4-5
+    graph = make_graph(two_way=[(0, 1), (1, 6), (2, 3), (3, 4), (4, 5), (5, 2)])
+    compressed, chains = compress_degree2_chains(graph)
+
+    assert set(compressed.vertices) & {2, 3, 4, 5}
+    assert removed_vertices_are_covered(graph, compressed, chains)
+    # 순환 위의 어느 두 정점 사이에도 경로가 있음
+    snapshot = RoutingSnapshot.from_graph(compressed, chains)
+    for source in (2, 3, 4, 5):
+        for target in (2, 3, 4, 5):
+            assert snapshot.shortest_path(source, target) is not None
+
+
+def test_parallel_chains_are_both_kept():
+    # 0과 5 사이에 0-1-2-5와 0-3-4-5 두 체인 (0, 5는 다른 정점과도 연결)
+    graph = make_graph(two_way=[(0, 1), (1, 2), (2, 5), (0, 3), (3, 4), (4, 5), (0, 6), (5, 7)])
+    compressed, chains = compress_degree2_chains(graph)
+
+    assert removed_vertices_are_covered(graph, compressed, chains)
+
+
+@pytest.fixture
+def chain_snapshot(monkeypatch):
+    # 양방향 체인 0-1-2-3-4-5 (5에서 6, 7로 갈라짐)와 단방향 체인 7 -> 8 -> 9 -> 6
+    graph = make_graph(two_way=[(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (5, 7)],
+                       one_way=[(7, 8), (8, 9), (9, 6)])
+    snapshot = RoutingSnapshot.from_graph(*compress_degree2_chains(graph))
+    snapshot.label_components()
+    monkeypatch.setattr(batch, "_worker_snapshot", snapshot)
+    monkeypatch.setattr(batch, "_worker_profiles", None)
+    return snapshot
+
+
+def test_interior_vertex_resolves_along_its_arc(chain_snapshot):
+    snapshot = chain_snapshot
+    assert snapshot.index_of(1) is None
+    assert [e for e, _ in snapshot.interior_positions(1)] != []
+    assert len(snapshot.interior_positions(1)) == 2
+    assert snapshot.interior_positions(100) == []
+
+    # 양방향 체인에서는 가까운 끝 정점으로 옮김
+    assert snapshot.vertex_ids[snapshot.resolve_vertex(1)] == 0
+    assert snapshot.vertex_ids[snapshot.resolve_vertex(4)] == 5
+    assert snapshot.vertex_ids[snapshot.resolve_vertex(4, as_target=True)] == 5
+    # 단방향 체인에서는 출발지면 간선 도착 정점, 도착지면 간선 출발 정점
+    assert snapshot.vertex_ids[snapshot.resolve_vertex(8)] == 6
+    assert snapshot.vertex_ids[snapshot.resolve_vertex(8, as_target=True)] == 7
+    assert snapshot.resolve_vertex(100) is None
+
+
+def test_interior_vertex_ids_are_routable(chain_snapshot):
+    route = chain_snapshot.shortest_path(1, 9)
+    assert route is not None
+    assert route.vertices[0] == 0 and route.vertices[-1] == 7
+
+    results = batch.route_chunk([{"id": 0, "origin_id": 2, "destination_id": 8}])
+    assert results[0]["status"] == "ok"
+    assert results[0]["distance_km"] == pytest.approx(6.0)
@@ -0,0 +1,58 @@
+import time
+
+import numpy as np
+import pytest
+
+from snapshot import RoutingSnapshot, SearchTimeout, search_deadline
+
+
+def grid_snapshot(n):
+    """
+    n x n 격자 양방향 그래프 (간선 거리 0.1)
+    """
+    arcs = []
+    for v in range(n * n):
+        i, j = divmod(v, n)
+        for a, b in ((i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)):
+            if 0 <= a < n and 0 <= b < n:
+                arcs.append((v, a * n + b))
+    arcs.sort()
+    tails = np.array([a[0] for a in arcs])
+    offsets = np.zeros(n * n + 1, dtype=np.int64)
+    np.add.at(offsets, tails + 1, 1)
+    np.cumsum(offsets, out=offsets)
+    ids = np.arange(n * n, dtype=np.int64)
+    return RoutingSnapshot(
+        vertex_ids=ids,
+        lat=36.3 + (ids // n) * 0.001,
+        lon=127.3 + (ids % n) * 0.001,
+        offsets=offsets,
+        heads=np.array([a[1] for a in arcs], dtype=np.int32),
+        metrics={"distance": np.full(len(arcs), 0.1, dtype=np.float32)},
+    )
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return grid_snapshot(60)
+
+
+def test_expired_deadline_stops_searches(grid):
+    with search_deadline(time.time() - 1):
+        with pytest.raises(SearchTimeout):
+            grid.shortest_path(0, grid.num_vertices - 1)
+        with pytest.raises(SearchTimeout):
+            grid.search(0)
+        with pytest.raises(SearchTimeout):
+            grid.search(grid.num_vertices - 1, reverse=True)
+
+
+def test_deadline_is_scoped_to_block(grid):
+    with search_deadline(time.time() + 60):
+        route = grid.shortest_path(0, grid.num_vertices - 1)
+    assert route is not None and route.cost == pytest.approx(0.1 * 2 * 59)
+
+    with search_deadline(time.time() - 1):
+        pass
+    dist, _ = grid.search(0)
+    assert np.isfinite(dist).all()
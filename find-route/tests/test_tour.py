@@ -0,0 +1,75 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from tour import HELD_KARP_MAX_STOPS, held_karp, improve_path, nearest_neighbor, path_cost, solve_path_order
+
+
+def brute_force(cost):
+    n = len(cost)
+    best = None
+    for middle in itertools.permutations(range(1, n - 1)):
+        order = [0, *middle, n - 1]
+        if best is None or path_cost(cost, order) < path_cost(cost, best):
+            best = order
+    return best
+
+
+def random_cost(n, seed, symmetric=False):
+    rng = np.random.default_rng(seed)
+    points = rng.random((n, 2))
+    cost = np.linalg.norm(points[:, None] - points[None], axis=2)
+    if not symmetric:
+        cost = cost * rng.uniform(0.8, 1.2, size=(n, n))
+    return cost
+
+
+@pytest.mark.parametrize("n", range(3, 9))
+@pytest.mark.parametrize("seed", range(5))
+def test_held_karp_matches_brute_force(n, seed):
+    cost = random_cost(n, seed)
+    order = held_karp(cost)
+    assert order[0] == 0 and order[-1] == n - 1
+    assert sorted(order) == list(range(n))
+    assert path_cost(cost, order) == pytest.approx(path_cost(cost, brute_force(cost)))
+
+
+def test_held_karp_without_waypoints():
+    assert held_karp(np.zeros((2, 2))) == [0, 1]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_heuristic_for_many_stops(seed):
+    n = HELD_KARP_MAX_STOPS + 8
+    cost = random_cost(n, seed, symmetric=True)
+    order = solve_path_order(cost)
+    assert order[0] == 0 and order[-1] == n - 1
+    assert sorted(order) == list(range(n))
+    # 지역 탐색은 초기해(최근접 이웃)보다 나빠지지 않고, 주어진 순서보다 충분히 짧아야 함
+    assert path_cost(cost, order) <= path_cost(cost, nearest_neighbor(cost)) + 1e-9
+    assert path_cost(cost, order) < path_cost(cost, list(range(n)))
+
+
+def test_improve_path_is_locally_optimal():
+    cost = random_cost(10, 7)
+    order = improve_path(cost, nearest_neighbor(cost))
+    assert improve_path(cost, order) == order
+
+
+def test_unreachable_waypoint_returns_none():
+    cost = random_cost(5, 0)
+    # 2번 경유지로는 어디서도 갈 수 없음
+    cost[:, 2] = np.inf
+    cost[2, 2] = 0
+    assert held_karp(cost) is None
+    assert solve_path_order(cost) is None
+
+
+def test_unreachable_waypoint_in_heuristic_is_infinite():
+    n = HELD_KARP_MAX_STOPS + 3
+    cost = random_cost(n, 1)
+    cost[:, 4] = np.inf
+    order = solve_path_order(cost)
+    assert sorted(order) == list(range(n))
+    assert not np.isfinite(path_cost(cost, order))
@@ -0,0 +1,140 @@
+from typing import List, Optional
+
+import numpy as np
+
+# 이 수 이하의 경유지는 Held-Karp 동적 계획법으로 정확히 풀고, 넘으면 지역 탐색 휴리스틱 사용
+HELD_KARP_MAX_STOPS = 12
+
+# Or-opt에서 한 번에 옮기는 최대 구간 길이
+OR_OPT_MAX_SEGMENT = 3
+
+
+def path_cost(cost: np.ndarray, order: List[int]) -> float:
+    """
+    방문 순서대로 이동할 때의 총 비용
+    """
+    return float(sum(cost[a, b] for a, b in zip(order, order[1:])))
+
+
+def held_karp(cost: np.ndarray) -> Optional[List[int]]:
+    """
+    0번에서 출발해 n-1번에 도착하며 나머지 지점을 모두 한 번씩 방문하는 최소 비용 순서 (정확해).
+    부분집합 x 마지막 지점 비용표를 부분집합 순서대로 채우며, 부분집합마다 다음 지점 후보를 한 번의 행렬 연산으로 갱신합니다.
+
+    Args:
+        cost: (n, n) 지점 간 비용 행렬 (비대칭 가능, 갈 수 없으면 inf)
+
+    Returns:
+        방문 순서 (0으로 시작해 n-1로 끝남, 모든 지점을 방문하는 경로가 없으면 None)
+    """
+    n = len(cost)
+    m = n - 2
+    if m <= 0:
+        return list(range(n))
+
+    inner = cost[1:-1, 1:-1]
+    size = 1 << m
+    dp = np.full((size, m), np.inf)
+    parent = np.full((size, m), -1, dtype=np.int64)
+    bits = 1 << np.arange(m)
+    dp[bits, np.arange(m)] = cost[0, 1:-1]
+
+    for mask in range(1, size):
+        row = dp[mask]
+        if not np.isfinite(row).any():
+            continue
+        # (마지막 지점 j, 다음 지점 k) 비용 중 k별 최솟값
+        candidate = row[:, np.newaxis] + inner
+        best_last = np.argmin(candidate, axis=0)
+        best = candidate[best_last, np.arange(m)]
+        for k in np.flatnonzero((mask & bits) == 0).tolist():
+            next_mask = mask | (1 << k)
+            if best[k] < dp[next_mask, k]:
+                dp[next_mask, k] = best[k]
+                parent[next_mask, k] = best_last[k]
+
+    full = size - 1
+    final = dp[full] + cost[1:-1, -1]
+    # 갈 수 없는 지점이 있으면 모든 값이 inf이고 argmin이 0을 골라 일부 지점만 복원되므로 실패로 처리
+    if not np.isfinite(final).any():
+        return None
+    last = int(np.argmin(final))
+    order = []
+    mask = full
+    while last >= 0:
+        order.append(last + 1)
+        mask, last = mask & ~(1 << last), int(parent[mask, last])
+    return [0] + order[::-1] + [n - 1]
+
+
+def nearest_neighbor(cost: np.ndarray) -> List[int]:
+    """
+    0번에서 출발해 매번 가장 가까운 미방문 지점으로 이동하는 순서 (지역 탐색의 초기해)
+    """
+    n = len(cost)
+    order = [0]
+    remaining = set(range(1, n - 1))
+    while remaining:
+        current = order[-1]
+        nearest = min(remaining, key=lambda j: cost[current, j])
+        order.append(nearest)
+        remaining.remove(nearest)
+    return order + [n - 1]
+
+
+def improve_path(cost: np.ndarray, order: List[int]) -> List[int]:
+    """
+    2-opt(구간 뒤집기)와 Or-opt(1~3개 지점 구간 옮기기)로 더 이상 줄지 않을 때까지 순서를 개선합니다.
+    비용 행렬이 비대칭일 수 있으므로 뒤집은 구간의 비용은 다시 계산합니다. 출발/도착 지점은 고정입니다.
+
+    Args:
+        cost: (n, n) 지점 간 비용 행렬
+        order: 초기 방문 순서
+
+    Returns:
+        개선된 방문 순서
+    """
+    order = list(order)
+    best = path_cost(cost, order)
+    improved = True
+    while improved:
+        improved = False
+
+        # 2-opt: order[i..j] 뒤집기
+        for i in range(1, len(order) - 2):
+            for j in range(i + 1, len(order) - 1):
+                candidate = order[:i] + order[i:j + 1][::-1] + order[j + 1:]
+                candidate_cost = path_cost(cost, candidate)
+                if candidate_cost < best - 1e-12:
+                    order, best, improved = candidate, candidate_cost, True
+
+        # Or-opt: 길이 1~3 구간을 다른 위치로 옮기기
+        for length in range(1, OR_OPT_MAX_SEGMENT + 1):
+            for i in range(1, len(order) - length):
+                segment = order[i:i + length]
+                rest = order[:i] + order[i + length:]
+                for j in range(1, len(rest)):
+                    if j == i:
+                        continue
+                    candidate = rest[:j] + segment + rest[j:]
+                    candidate_cost = path_cost(cost, candidate)
+                    if candidate_cost < best - 1e-12:
+                        order, best, improved = candidate, candidate_cost, True
+                        break
+    return order
+
+
+def solve_path_order(cost: np.ndarray, exact_max_stops: int = HELD_KARP_MAX_STOPS) -> Optional[List[int]]:
+    """
+    출발지(0)와 도착지(n-1)를 고정하고 경유지 방문 순서를 최적화합니다.
+
+    Args:
+        cost: (n, n) 출발지 + 경유지 + 도착지 간 비용 행렬
+        exact_max_stops: 정확해(Held-Karp)를 구할 최대 경유지 수
+
+    Returns:
+        방문 순서 (0으로 시작해 n-1로 끝나는 지점 번호 목록, 정확해를 구할 때 경로가 없으면 None)
+    """
+    if len(cost) - 2 <= exact_max_stops:
+        return held_karp(cost)
+    return improve_path(cost, nearest_neighbor(cost))